@@ -0,0 +1,80 @@
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from authentications.services.revocation import _is_token_revoked
+from authentications.services.user_cache import _get_user_snapshot
+
+
+class StatelessUser(TokenUser):
+    """
+    Lightweight user built from the token and the cached user snapshot, for endpoints that do not
+    need the full row. Other claims of the token are readable as attributes, like on TokenUser.
+    """
+
+    def __init__(self, token, snapshot: dict):
+        super().__init__(token)
+        self.snapshot = snapshot
+
+    @cached_property
+    def id(self):
+        return self.snapshot['pk']
+
+    @cached_property
+    def username(self) -> str:
+        return self.token[api_settings.USER_ID_CLAIM]
+
+    @cached_property
+    def is_active(self) -> bool:
+        return self.snapshot['is_active']
+
+    @cached_property
+    def is_staff(self) -> bool:
+        return self.snapshot['is_staff']
+
+    @cached_property
+    def is_superuser(self) -> bool:
+        return self.snapshot['is_superuser']
+
+
+class RevocableJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication rejecting revoked tokens, for views that need the full user row.
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        if _is_token_revoked(validated_token):
+            raise AuthenticationFailed(_('Token has been revoked'), code='token_not_valid')
+        return validated_token
+
+
+class StatelessJWTAuthentication(RevocableJWTAuthentication):
+    """
+    JWTAuthentication returning a StatelessUser checked against the cached user snapshot instead
+    of querying the user on every request. A token whose `user_version` claim no longer matches the
+    user, as the password or the user's status changed since it was issued, is rejected.
+    Views that need the full row, e.g. to serialize it, use RevocableJWTAuthentication.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            username = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        snapshot = _get_user_snapshot(username)
+        if snapshot is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+
+        if not snapshot['is_active']:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        version = validated_token.get('user_version')
+        if version is not None and version != snapshot['version']:
+            raise AuthenticationFailed(_('Token is no longer valid for this user'), code='token_not_valid')
+
+        return StatelessUser(validated_token, snapshot)
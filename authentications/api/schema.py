@@ -0,0 +1,6 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class RevocableJWTScheme(SimpleJWTScheme):
+    target_class = 'authentications.api.authentication.RevocableJWTAuthentication'
+    match_subclasses = True
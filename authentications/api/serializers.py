@@ -0,0 +1,42 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+
+from authentications.services.jwt import RefreshToken, add_user_claims
+from authentications.services.revocation import _is_token_revoked, _revoke_token
+
+
+class UserClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = RefreshToken
+
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = RefreshToken
+
+    def validate(self, attrs):
+        if _is_token_revoked(self.token_class(attrs['refresh'])):
+            raise InvalidToken(_('Token has been revoked'))
+        return super().validate(attrs)
+
+
+class TokenRevokeSerializer(serializers.Serializer):
+    refresh = serializers.CharField(write_only=True)
+
+    def validate(self, attrs):
+        try:
+            attrs['refresh'] = RefreshToken(attrs['refresh'])
+        except TokenError as error:
+            raise InvalidToken(error.args[0])
+        return attrs
+
+    def save(self, **kwargs):
+        _revoke_token(self.validated_data['refresh'])
+        request = self.context.get('request')
+        if request is not None and request.auth is not None:
+            # Also revokes the access token the request was authenticated with
+            _revoke_token(request.auth)
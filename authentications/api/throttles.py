@@ -0,0 +1,9 @@
+from config.throttling import IPRateThrottle, EmailRateThrottle
+
+
+class LoginIPThrottle(IPRateThrottle):
+    scope = 'login_ip'
+
+
+class LoginEmailThrottle(EmailRateThrottle):
+    scope = 'login_email'
@@ -1,9 +1,13 @@
 from rest_framework.urls import path
-from rest_framework_simplejwt.views import TokenRefreshView, TokenObtainPairView
+from rest_framework_simplejwt.views import TokenRefreshView
+
+from authentications.api.views import ThrottledTokenObtainPairView, TokenRevokeView, JWKSView
 
 app_name = 'authentications'
 
 urlpatterns = [
-    path('login/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
+    path('login/', ThrottledTokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('logout/', TokenRevokeView.as_view(), name='token_revoke'),
+    path('jwks/', JWKSView.as_view(), name='jwks'),
 ]
@@ -1,3 +1,46 @@
-from django.shortcuts import render
+from django.utils.cache import patch_cache_control
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.views import TokenObtainPairView
 
-# Create your views here.
+from authentications.api.serializers import TokenRevokeSerializer
+from authentications.api.throttles import LoginIPThrottle, LoginEmailThrottle
+from authentications.services.signing import get_jwks
+from config import settings
+
+
+class ThrottledTokenObtainPairView(TokenObtainPairView):
+    throttle_classes = [LoginIPThrottle, LoginEmailThrottle]
+
+
+class TokenRevokeView(GenericAPIView):
+    """
+    Logs out by revoking the refresh token, and the access token the request is authenticated with.
+    """
+    permission_classes = [AllowAny]
+    serializer_class = TokenRevokeSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class JWKSView(APIView):
+    """
+    Publishes the public keys tokens are signed with, so other services can verify them locally.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    @extend_schema(responses={200: OpenApiTypes.OBJECT})
+    def get(self, request, *args, **kwargs):
+        response = Response(get_jwks())
+        patch_cache_control(response, public=True, max_age=settings.JWT_JWKS_MAX_AGE)
+        return response
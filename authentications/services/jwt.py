@@ -1,14 +1,53 @@
+import hashlib
+
 from django.contrib.auth import get_user_model
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt import tokens
+
+from authentications.services.revocation import ISSUED_AT_CLAIM
+from authentications.services.signing import get_token_backend
+from users.services.passwords import get_password_salt
 
 User = get_user_model()
 
 
+class AccessToken(tokens.AccessToken):
+    @property
+    def token_backend(self):
+        return get_token_backend()
+
+
+class RefreshToken(tokens.RefreshToken):
+    access_token_class = AccessToken
+
+    @property
+    def token_backend(self):
+        return get_token_backend()
+
+
+def get_user_version(password: str, is_active: bool, is_staff: bool, is_superuser: bool) -> str:
+    """
+    Returns a stamp of the fields a token's validity depends on, changing with the password or the
+    user's status, so tokens issued before such a change can be told apart without the row. It is
+    made from the password's salt, so upgrading the hash of the same password keeps it.
+    """
+    value = f'{get_password_salt(password)}|{is_active:d}{is_staff:d}{is_superuser:d}'
+    return hashlib.sha256(value.encode()).hexdigest()[:16]
+
+
+def add_user_claims(token, user: User):
+    token['is_active'] = user.is_active
+    token['is_staff'] = user.is_staff
+    token['is_superuser'] = user.is_superuser
+    token['user_version'] = get_user_version(user.password, user.is_active, user.is_staff, user.is_superuser)
+    token[ISSUED_AT_CLAIM] = token.current_time.timestamp()
+    return token
+
+
 def get_jwt_tokens_for_user(user: User) -> dict:
     """
     Returns a dictionary containing the access and refresh tokens for the given user.
     """
-    refresh = RefreshToken.for_user(user)
+    refresh = add_user_claims(RefreshToken.for_user(user), user)
 
     return {
         'refresh': str(refresh),
@@ -0,0 +1,201 @@
+import hashlib
+import logging
+import math
+import os
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django_redis import get_redis_connection
+from rest_framework_simplejwt.settings import api_settings
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+REVOKED_TOKEN_KEY = 'auth:revoked:jti:{jti}'
+# Holds the time up to which the tokens issued to the user are revoked
+REVOKED_USER_KEY = 'auth:revoked:user:{username}'
+# Sorted set of the revocations' filter items scored by their expiry, to rebuild the filters from
+REVOCATIONS_KEY = 'auth:revocations'
+REVOCATIONS_CHANNEL = 'auth:revocations'
+# Issue time of the token in fractions of a second, as `iat` is in whole seconds
+ISSUED_AT_CLAIM = 'issued_at'
+# Seconds to wait before subscribing again after losing the connection
+RESUBSCRIBE_DELAY = 1
+
+
+class _BloomFilter:
+    """
+    Set of strings answering membership with no false negatives and about `error_rate` false
+    positives while holding up to `capacity` items.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(round(self.size / capacity * math.log(2)), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + index * second) % self.size for index in range(self.hash_count)]
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class _RevocationFilter:
+    """
+    Per-process Bloom filter of the revoked tokens and users, so a token that was not revoked is told
+    apart without Redis. A background thread keeps it in sync through pub/sub and rebuilds it from
+    the revocations' sorted set when subscribing and periodically, dropping expired revocations.
+    Until it is subscribed, e.g. right after starting or losing the connection, every token is
+    looked up in Redis.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._filter = self._new_filter()
+        self._synced = False
+        self._pid = None
+
+    @staticmethod
+    def _new_filter() -> _BloomFilter:
+        return _BloomFilter(settings.AUTH_REVOCATION_FILTER_CAPACITY, settings.AUTH_REVOCATION_FILTER_ERROR_RATE)
+
+    @property
+    def synced(self) -> bool:
+        return self._synced and self._pid == os.getpid()
+
+    def might_contain(self, items) -> bool:
+        self._ensure_subscribed()
+        if not self.synced:
+            return True
+        bloom = self._filter
+        return any(item in bloom for item in items)
+
+    def add(self, item: str):
+        with self._lock:
+            self._filter.add(item)
+
+    def rebuild(self):
+        bloom = self._new_filter()
+        for item in get_redis_connection().zrangebyscore(cache.make_key(REVOCATIONS_KEY), time.time(), '+inf'):
+            bloom.add(item.decode())
+        with self._lock:
+            self._filter = bloom
+            self._synced = True
+
+    def _ensure_subscribed(self):
+        # Also starts the thread again in a forked process, which does not inherit it
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+            self._synced = False
+            threading.Thread(target=self._listen, args=(pid,), name='token-revocations', daemon=True).start()
+
+    def _listen(self, pid: int):
+        while self._pid == pid:
+            pubsub = get_redis_connection().pubsub()
+            try:
+                pubsub.subscribe(cache.make_key(REVOCATIONS_CHANNEL))
+                rebuilt_at = time.monotonic()
+                while self._pid == pid:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None and message['type'] == 'subscribe':
+                        # Revocations published from now on are received, older ones are in the set
+                        self.rebuild()
+                        rebuilt_at = time.monotonic()
+                    elif message is not None and message['type'] == 'message':
+                        self.add(message['data'].decode())
+                    elif time.monotonic() - rebuilt_at >= settings.AUTH_REVOCATION_FILTER_REBUILD_INTERVAL:
+                        self.rebuild()
+                        rebuilt_at = time.monotonic()
+            except Exception:
+                self._synced = False
+                logger.warning('Lost the token revocations subscription', exc_info=True)
+                time.sleep(RESUBSCRIBE_DELAY)
+            finally:
+                pubsub.close()
+
+
+revocation_filter = _RevocationFilter()
+
+
+def _get_token_item(jti: str) -> str:
+    return f'jti:{jti}'
+
+
+def _get_user_item(username: str) -> str:
+    return f'user:{username}'
+
+
+def _revoke(item: str, key: str, value, timeout: float):
+    """
+    Stores the revocation for `timeout` seconds, indexes it for rebuilding the filters and publishes
+    it to the other processes, in one round trip.
+    """
+    now = time.time()
+    index_key = cache.make_key(REVOCATIONS_KEY)
+    pipeline = get_redis_connection().pipeline()
+    pipeline.set(cache.make_key(key), cache.client.encode(value), px=max(int(timeout * 1000), 1))
+    pipeline.zremrangebyscore(index_key, '-inf', now)
+    pipeline.zadd(index_key, {item: now + timeout})
+    pipeline.publish(cache.make_key(REVOCATIONS_CHANNEL), item)
+    pipeline.execute()
+    revocation_filter.add(item)
+
+
+def _revoke_token(token):
+    """
+    Revokes the token until it expires.
+    """
+    timeout = token['exp'] - time.time()
+    if timeout <= 0:
+        return
+    jti = token[api_settings.JTI_CLAIM]
+    _revoke(_get_token_item(jti), REVOKED_TOKEN_KEY.format(jti=jti), 1, timeout)
+
+
+def _revoke_user_tokens(username: str):
+    """
+    Revokes the tokens of the user issued before now, until the longest lived of them expires.
+    """
+    timeout = max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME).total_seconds()
+    key = REVOKED_USER_KEY.format(username=username)
+    _revoke(_get_user_item(username), key, time.time(), timeout)
+
+
+def revoke_user_tokens_on_commit(username: str):
+    transaction.on_commit(lambda: _revoke_user_tokens(username))
+
+
+def _is_token_revoked(token) -> bool:
+    """
+    Returns whether the token, or the tokens of its user issued before it, were revoked, without
+    Redis unless the filter may contain them. Tokens are dated by their sub-second `issued_at`
+    claim, or by `iat` in whole seconds when they have none.
+    """
+    jti = token.get(api_settings.JTI_CLAIM)
+    username = token.get(api_settings.USER_ID_CLAIM)
+    if not revocation_filter.might_contain([_get_token_item(jti), _get_user_item(username)]):
+        return False
+
+    token_key = REVOKED_TOKEN_KEY.format(jti=jti)
+    user_key = REVOKED_USER_KEY.format(username=username)
+    revocations = cache.get_many([token_key, user_key])
+    if token_key in revocations:
+        return True
+    issued_at = token.get(ISSUED_AT_CLAIM, token.get('iat', 0))
+    return user_key in revocations and issued_at < revocations[user_key]
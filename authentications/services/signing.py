@@ -0,0 +1,150 @@
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+from django.utils.translation import gettext_lazy as _
+from jwt import InvalidTokenError
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import TokenBackendError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state import token_backend as default_token_backend
+
+from config import settings
+
+# Members of each key type's JWK that its RFC 7638 thumbprint, used as the key id, is computed from
+THUMBPRINT_MEMBERS = {'RSA': ('e', 'kty', 'n'), 'OKP': ('crv', 'kty', 'x')}
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    kid: str
+    algorithm: str
+    private_key: object
+    public_key: object
+    public_jwk: dict
+
+
+def _get_thumbprint(jwk: dict) -> str:
+    members = {member: jwk[member] for member in THUMBPRINT_MEMBERS[jwk['kty']]}
+    digest = hashlib.sha256(json.dumps(members, separators=(',', ':'), sort_keys=True).encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b'=').decode()
+
+
+def _load_signing_key(pem: bytes) -> SigningKey:
+    private_key = load_pem_private_key(pem, password=None)
+    if isinstance(private_key, RSAPrivateKey):
+        algorithm, jwk_algorithm = 'RS256', RSAAlgorithm
+    elif isinstance(private_key, Ed25519PrivateKey):
+        algorithm, jwk_algorithm = 'EdDSA', OKPAlgorithm
+    else:
+        raise ValueError('Only RSA and Ed25519 keys can sign tokens')
+
+    public_key = private_key.public_key()
+    jwk = jwk_algorithm.to_jwk(public_key, as_dict=True)
+    kid = _get_thumbprint(jwk)
+    public_jwk = {**jwk, 'kid': kid, 'alg': algorithm, 'use': 'sig'}
+    return SigningKey(kid, algorithm, private_key, public_key, public_jwk)
+
+
+class RotatingTokenBackend(TokenBackend):
+    """
+    Signs tokens with the first key, stamping its id in the `kid` header, and verifies them with
+    whichever of the keys the header names, so keys can be rotated without invalidating tokens.
+    The keys are parsed once per process.
+    """
+
+    def __init__(self, keys, **kwargs):
+        self.keys = {key.kid: key for key in keys}
+        self.signing_key_entry = keys[0]
+        super().__init__(self.signing_key_entry.algorithm, **kwargs)
+
+    def _validate_algorithm(self, algorithm: str) -> None:
+        # The algorithms come from the key types, which only RS256 and EdDSA are allowed for
+        pass
+
+    def get_key(self, token) -> SigningKey:
+        try:
+            kid = jwt.get_unverified_header(token).get('kid')
+        except InvalidTokenError as ex:
+            raise TokenBackendError(_('Token is invalid or expired')) from ex
+
+        key = self.keys.get(kid)
+        if key is None:
+            raise TokenBackendError(_('Token is invalid or expired'))
+        return key
+
+    def get_verifying_key(self, token):
+        return self.get_key(token).public_key
+
+    def encode(self, payload):
+        jwt_payload = payload.copy()
+        if self.audience is not None:
+            jwt_payload['aud'] = self.audience
+        if self.issuer is not None:
+            jwt_payload['iss'] = self.issuer
+
+        key = self.signing_key_entry
+        return jwt.encode(
+            jwt_payload,
+            key.private_key,
+            algorithm=key.algorithm,
+            headers={'kid': key.kid},
+            json_encoder=self.json_encoder,
+        )
+
+    def decode(self, token, verify: bool = True):
+        key = self.get_key(token)
+        try:
+            return jwt.decode(
+                token,
+                key.public_key,
+                algorithms=[key.algorithm],
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.get_leeway(),
+                options={
+                    'verify_aud': self.audience is not None,
+                    'verify_signature': verify,
+                },
+            )
+        except InvalidTokenError as ex:
+            raise TokenBackendError(_('Token is invalid or expired')) from ex
+
+
+_token_backend = None
+
+
+def get_token_backend() -> TokenBackend:
+    """
+    Returns the backend signing with the configured private keys, or simplejwt's HS256 one signing
+    with the `SECRET_KEY` when there are none.
+    """
+    global _token_backend
+    if _token_backend is None:
+        if not settings.JWT_PRIVATE_KEY_FILES:
+            _token_backend = default_token_backend
+        else:
+            keys = []
+            for path in settings.JWT_PRIVATE_KEY_FILES:
+                with open(path, 'rb') as file:
+                    keys.append(_load_signing_key(file.read()))
+            _token_backend = RotatingTokenBackend(
+                keys,
+                audience=api_settings.AUDIENCE,
+                issuer=api_settings.ISSUER,
+                leeway=api_settings.LEEWAY,
+                json_encoder=api_settings.JSON_ENCODER,
+            )
+    return _token_backend
+
+
+def get_jwks() -> dict:
+    backend = get_token_backend()
+    keys = backend.keys.values() if isinstance(backend, RotatingTokenBackend) else ()
+    return {'keys': [key.public_jwk for key in keys]}
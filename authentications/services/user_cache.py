@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+from authentications.services.jwt import get_user_version
+from config import settings
+
+USER_CACHE_KEY = 'auth:user:{username}'
+
+
+class _LocalUserCache:
+    """
+    Per-process LRU of user snapshots, kept for a few seconds only since a save in another process
+    can not evict it.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, username: str):
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            self._entries.move_to_end(username)
+            return entry[1]
+
+    def set(self, username: str, snapshot: dict):
+        with self._lock:
+            self._entries[username] = (time.monotonic() + settings.AUTH_USER_LOCAL_CACHE_TIMEOUT, snapshot)
+            self._entries.move_to_end(username)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, username: str):
+        with self._lock:
+            self._entries.pop(username, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_user_cache = _LocalUserCache(max_size=settings.AUTH_USER_LOCAL_CACHE_SIZE)
+
+
+def _load_user_snapshot(username: str):
+    row = (
+        get_user_model().objects
+        .filter(username=username)
+        .values('pk', 'password', 'is_active', 'is_staff', 'is_superuser')
+        .first()
+    )
+    if row is None:
+        return None
+
+    password = row.pop('password')
+    row['version'] = get_user_version(password, row['is_active'], row['is_staff'], row['is_superuser'])
+    return row
+
+
+def _get_user_snapshot(username: str):
+    """
+    Returns the pk, status flags and version stamp of the user, from the local LRU, then Redis,
+    then the database, or `None` if there is no such user.
+    """
+    snapshot = local_user_cache.get(username)
+    if snapshot is not None:
+        return snapshot
+
+    key = USER_CACHE_KEY.format(username=username)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = _load_user_snapshot(username)
+        if snapshot is None:
+            return None
+        cache.set(key, snapshot, timeout=settings.AUTH_USER_CACHE_TIMEOUT)
+
+    local_user_cache.set(username, snapshot)
+    return snapshot
+
+
+def _invalidate_user_snapshot(username: str):
+    local_user_cache.delete(username)
+    cache.delete(USER_CACHE_KEY.format(username=username))
+
+
+def invalidate_user_snapshot_on_commit(username: str):
+    """
+    Evicts the user once the current transaction commits, so a concurrent request can not cache
+    the old row again.
+    """
+    transaction.on_commit(lambda: _invalidate_user_snapshot(username))
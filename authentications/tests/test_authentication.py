@@ -0,0 +1,124 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+
+from authentications.api.authentication import StatelessJWTAuthentication, StatelessUser
+from authentications.services.jwt import AccessToken, get_jwt_tokens_for_user
+from authentications.services.user_cache import local_user_cache
+
+
+class StatelessJWTAuthenticationTests(APITestCase):
+
+    def setUp(self):
+        self.user = baker.make(get_user_model(), username='test', email='test@test.com')
+        self.user.set_password('Strong-Pass-1234')
+        self.user.save()
+        self.authentication = StatelessJWTAuthentication()
+
+    def authenticate(self, access: str):
+        return self.authentication.get_user(AccessToken(access))
+
+    def test_authenticated_requests_cost_no_query(self):
+        access = get_jwt_tokens_for_user(self.user)['access']
+
+        with self.assertNumQueries(1):
+            user = self.authenticate(access)
+
+        self.assertIsInstance(user, StatelessUser)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.username, 'test')
+        self.assertTrue(user.is_authenticated)
+
+        local_user_cache.clear()
+        with self.assertNumQueries(0):
+            self.authenticate(access)
+            self.authenticate(access)
+
+    def test_saved_user_is_evicted(self):
+        access = get_jwt_tokens_for_user(self.user)['access']
+        self.authenticate(access)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = 'Test'
+            self.user.save()
+
+        with self.assertNumQueries(1):
+            self.authenticate(access)
+
+    def test_renamed_user_is_evicted_under_the_old_username(self):
+        access = get_jwt_tokens_for_user(self.user)['access']
+        self.authenticate(access)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.username = 'renamed'
+            self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(access)
+        self.assertEqual(self.authenticate(get_jwt_tokens_for_user(self.user)['access']).username, 'renamed')
+
+    def test_renamed_deferred_user_is_evicted_under_the_old_username(self):
+        access = get_jwt_tokens_for_user(self.user)['access']
+        self.authenticate(access)
+
+        user = get_user_model().objects.only('pk', 'username').get(pk=self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            user.username = 'renamed'
+            user.save(update_fields=['username'])
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(access)
+
+    def test_inactive_user_is_rejected(self):
+        access = get_jwt_tokens_for_user(self.user)['access']
+        self.authenticate(access)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(access)
+
+    def test_tokens_issued_before_a_password_change_are_rejected(self):
+        access = get_jwt_tokens_for_user(self.user)['access']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.set_password('Other-Pass-1234')
+            self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(access)
+        self.authenticate(get_jwt_tokens_for_user(self.user)['access'])
+
+    def test_login_tokens_carry_the_user_claims(self):
+        response = self.client.post(
+            reverse('authentications:token_obtain_pair'),
+            {'email': 'test@test.com', 'password': 'Strong-Pass-1234'},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        token = AccessToken(response.data['access'])
+        self.assertTrue(token['is_active'])
+        self.assertFalse(token['is_staff'])
+        self.assertEqual(self.authenticate(response.data['access']).pk, self.user.pk)
+
+    def test_authenticated_endpoint(self):
+        access = get_jwt_tokens_for_user(self.user)['access']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+        url = reverse('users:user-detail', kwargs={'username': 'test'})
+        self.client.get(url)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['username'], 'test')
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+        local_user_cache.clear()
@@ -0,0 +1,167 @@
+import os
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentications.services.jwt import get_jwt_tokens_for_user
+from authentications.services.revocation import (_BloomFilter, _RevocationFilter, _revoke_user_tokens,
+                                                 revocation_filter, REVOCATIONS_CHANNEL)
+from authentications.services.user_cache import local_user_cache
+from config import settings
+from users.tests.test_api.test_registration_round_trips import count_redis_commands
+
+PASSWORD = 'Strong-Pass-1234'
+
+
+class TokenRevocationTests(APITestCase):
+
+    def setUp(self):
+        self.user = baker.make(get_user_model(), username='test', email='test@test.com')
+        self.user.set_password(PASSWORD)
+        self.user.save()
+        self.profile_url = reverse('users:user-detail', kwargs={'username': 'test'})
+
+    def refresh(self, refresh: str):
+        return self.client.post(reverse('authentications:token_refresh'), {'refresh': refresh})
+
+    def get_profile(self, access: str):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+        return self.client.get(self.profile_url)
+
+    def test_password_change_revokes_refresh_tokens(self):
+        tokens = get_jwt_tokens_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {tokens["access"]}')
+        url = reverse('users:user-change_password', args=['test'])
+        data = {'previous_password': PASSWORD, 'password': 'Other-Pass-1234', 'confirm_password': 'Other-Pass-1234'}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.refresh(tokens['refresh']).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.get_profile(tokens['access']).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_password_reset_revokes_refresh_tokens(self):
+        tokens = get_jwt_tokens_for_user(self.user)
+        cache.set(f'test@test.com{settings.VERIFIED_FORGET_PASSWORD_EMAIL_REDIS_KEY_POSTFIX}', True)
+        data = {'email': 'test@test.com', 'password': 'Other-Pass-1234', 'confirm_password': 'Other-Pass-1234'}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('users:reset_password'), data)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(self.refresh(tokens['refresh']).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_tokens_issued_after_the_revocation_are_valid(self):
+        with mock.patch('authentications.services.revocation.time.time', return_value=time.time() - 5):
+            _revoke_user_tokens('test')
+        tokens = get_jwt_tokens_for_user(self.user)
+
+        self.assertEqual(self.refresh(tokens['refresh']).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_profile(tokens['access']).status_code, status.HTTP_200_OK)
+
+    def test_login_right_after_the_revocation(self):
+        tokens = get_jwt_tokens_for_user(self.user)
+        _revoke_user_tokens('test')
+
+        response = self.client.post(
+            reverse('authentications:token_obtain_pair'), {'email': 'test@test.com', 'password': PASSWORD},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.refresh(response.data['refresh']).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_profile(response.data['access']).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.refresh(tokens['refresh']).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_revokes_the_tokens(self):
+        tokens = get_jwt_tokens_for_user(self.user)
+        other_tokens = get_jwt_tokens_for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {tokens["access"]}')
+
+        response = self.client.post(reverse('authentications:token_revoke'), {'refresh': tokens['refresh']})
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.refresh(tokens['refresh']).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.get_profile(tokens['access']).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.refresh(other_tokens['refresh']).status_code, status.HTTP_200_OK)
+
+    def test_logout_with_an_invalid_token(self):
+        response = self.client.post(reverse('authentications:token_revoke'), {'refresh': 'invalid'})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+        local_user_cache.clear()
+
+
+@mock.patch.object(_RevocationFilter, '_ensure_subscribed')
+class RevocationFilterTests(APITestCase):
+
+    def setUp(self):
+        self.filter = _RevocationFilter()
+        self.filter._pid = os.getpid()
+
+    def test_unsynced_filter_may_contain_everything(self, ensure_subscribed):
+        self.assertFalse(_RevocationFilter().synced)
+        self.assertTrue(_RevocationFilter().might_contain(['jti:1']))
+
+    def test_synced_filter_skips_redis(self, ensure_subscribed):
+        with mock.patch('authentications.services.revocation.revocation_filter', self.filter):
+            _revoke_user_tokens('revoked')
+            self.filter.rebuild()
+
+            with count_redis_commands() as commands:
+                self.assertFalse(self.filter.might_contain(['jti:1', 'user:test']))
+                self.assertTrue(self.filter.might_contain(['jti:1', 'user:revoked']))
+
+        self.assertEqual(commands, [])
+
+    def test_rebuild_drops_expired_revocations(self, ensure_subscribed):
+        with mock.patch('authentications.services.revocation.revocation_filter', self.filter):
+            with mock.patch('authentications.services.revocation.time.time', return_value=time.time() - 60 * 60 * 2):
+                _revoke_user_tokens('expired')
+            _revoke_user_tokens('revoked')
+
+        self.filter.rebuild()
+
+        self.assertFalse(self.filter.might_contain(['user:expired']))
+        self.assertTrue(self.filter.might_contain(['user:revoked']))
+
+    def test_bloom_filter(self, ensure_subscribed):
+        bloom = _BloomFilter(capacity=1000, error_rate=0.01)
+        for index in range(1000):
+            bloom.add(f'jti:{index}')
+
+        self.assertTrue(all(f'jti:{index}' in bloom for index in range(1000)))
+        false_positives = sum(f'user:{index}' in bloom for index in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+
+
+class RevocationSubscriptionTests(APITestCase):
+
+    def test_revocations_are_received(self):
+        revocation_filter.might_contain([])
+        deadline = time.monotonic() + 5
+        while not revocation_filter.synced and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(revocation_filter.synced)
+
+        get_redis_connection().publish(cache.make_key(REVOCATIONS_CHANNEL), 'user:published')
+        while not revocation_filter.might_contain(['user:published']) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertTrue(revocation_filter.might_contain(['user:published']))
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
@@ -0,0 +1,132 @@
+import os
+import tempfile
+from unittest import mock
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.exceptions import TokenError
+
+from authentications.services.jwt import AccessToken, get_jwt_tokens_for_user
+from authentications.services.user_cache import local_user_cache
+from config import settings
+
+
+def write_private_key(directory: str, name: str, private_key) -> str:
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as file:
+        file.write(private_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption(),
+        ))
+    return path
+
+
+class AsymmetricSigningTests(APITestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.rsa_key = write_private_key(
+            cls.directory.name, 'rsa.pem', rsa.generate_private_key(public_exponent=65537, key_size=2048),
+        )
+        cls.ed25519_key = write_private_key(cls.directory.name, 'ed25519.pem', ed25519.Ed25519PrivateKey.generate())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.user = baker.make(get_user_model(), username='test', email='test@test.com')
+        self.user.set_password('Strong-Pass-1234')
+        self.user.save()
+
+    def use_keys(self, *paths):
+        patchers = [
+            mock.patch.object(settings, 'JWT_PRIVATE_KEY_FILES', list(paths)),
+            mock.patch('authentications.services.signing._token_backend', None),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_jwks(self):
+        return self.client.get(reverse('authentications:jwks'))
+
+    def test_tokens_are_signed_with_the_first_key(self):
+        for path, algorithm in ((self.rsa_key, 'RS256'), (self.ed25519_key, 'EdDSA')):
+            self.use_keys(path)
+            access = get_jwt_tokens_for_user(self.user)['access']
+
+            header = jwt.get_unverified_header(access)
+            self.assertEqual(header['alg'], algorithm)
+            self.assertEqual(header['kid'], self.get_jwks().data['keys'][0]['kid'])
+            self.assertEqual(AccessToken(access)['username'], 'test')
+
+    def test_tokens_verify_with_the_published_keys(self):
+        self.use_keys(self.ed25519_key, self.rsa_key)
+        access = get_jwt_tokens_for_user(self.user)['access']
+
+        jwks = jwt.PyJWKSet.from_dict(self.get_jwks().data)
+        key = next(key for key in jwks.keys if key.key_id == jwt.get_unverified_header(access)['kid'])
+
+        self.assertEqual(jwt.decode(access, key.key, algorithms=[key.algorithm_name])['username'], 'test')
+
+    def test_rotation_keeps_tokens_of_the_previous_key_valid(self):
+        self.use_keys(self.rsa_key)
+        tokens = get_jwt_tokens_for_user(self.user)
+
+        self.use_keys(self.ed25519_key, self.rsa_key)
+        self.assertEqual(AccessToken(tokens['access'])['username'], 'test')
+        self.assertEqual(jwt.get_unverified_header(get_jwt_tokens_for_user(self.user)['access'])['alg'], 'EdDSA')
+
+        self.use_keys(self.ed25519_key)
+        with self.assertRaises(TokenError):
+            AccessToken(tokens['access'])
+
+    def test_symmetric_tokens_are_rejected(self):
+        access = get_jwt_tokens_for_user(self.user)['access']
+        self.use_keys(self.rsa_key)
+
+        with self.assertRaises(TokenError):
+            AccessToken(access)
+
+    def test_login_and_refresh(self):
+        self.use_keys(self.rsa_key)
+        response = self.client.post(
+            reverse('authentications:token_obtain_pair'),
+            {'email': 'test@test.com', 'password': 'Strong-Pass-1234'},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.post(reverse('authentications:token_refresh'), {'refresh': response.data['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(jwt.get_unverified_header(response.data['access'])['alg'], 'RS256')
+
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.data["access"]}')
+        response = self.client.get(reverse('users:user-detail', kwargs={'username': 'test'}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_jwks(self):
+        self.use_keys(self.ed25519_key, self.rsa_key)
+        response = self.get_jwks()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([key['alg'] for key in response.data['keys']], ['EdDSA', 'RS256'])
+        self.assertTrue(all('d' not in key and key['use'] == 'sig' for key in response.data['keys']))
+        self.assertIn(f'max-age={settings.JWT_JWKS_MAX_AGE}', response['Cache-Control'])
+        self.assertIn('public', response['Cache-Control'])
+
+    def test_jwks_without_keys(self):
+        self.assertEqual(self.get_jwks().data, {'keys': []})
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+        local_user_cache.clear()
@@ -1,5 +1,8 @@
 import os
+import time
+
 from celery import Celery
+from celery.signals import before_task_publish, celeryd_init, task_prerun, task_revoked
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
@@ -12,3 +15,46 @@ app.autodiscover_tasks()
 @app.task(bind=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
+
+
+@celeryd_init.connect
+def configure_queue_worker(conf=None, options=None, **kwargs):
+    """
+    Applies the `CELERY_WORKER_QUEUE_OPTIONS` of the queue to a worker consuming only that queue,
+    e.g. `celery -A config worker -Q mail_otp`. Options given on the command line take precedence.
+    """
+    from config import settings
+
+    queues = (options or {}).get('queues') or []
+    if isinstance(queues, str):
+        queues = queues.split(',')
+    if len(queues) != 1 or queues[0] not in settings.CELERY_WORKER_QUEUE_OPTIONS:
+        return
+
+    for name, value in settings.CELERY_WORKER_QUEUE_OPTIONS[queues[0]].items():
+        setattr(conf, f'worker_{name}', value)
+
+
+@before_task_publish.connect
+def stamp_sent_at(headers=None, **kwargs):
+    if headers is not None:
+        headers.setdefault('sent_at', time.time())
+
+
+@task_prerun.connect
+def record_queue_latency(task=None, **kwargs):
+    from config.celery_metrics import _get_task_queue, _record_queue_latency
+
+    sent_at = getattr(task.request, 'sent_at', None)
+    queue = _get_task_queue(task.request)
+    if sent_at is not None and queue is not None and not task.request.is_eager:
+        _record_queue_latency(queue, sent_at)
+
+
+@task_revoked.connect
+def record_expired_task(request=None, expired=False, **kwargs):
+    from config.celery_metrics import _get_task_queue, _record_expired_task
+
+    queue = _get_task_queue(request)
+    if expired and queue is not None:
+        _record_expired_task(queue)
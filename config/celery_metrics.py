@@ -0,0 +1,57 @@
+import time
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+# Upper bounds in seconds of the queue latency histogram buckets, the last one is unbounded
+QUEUE_LATENCY_BUCKETS = (0.1, 0.5, 1, 5, 30, 60)
+
+_METRICS_KEY = 'celery:metrics:{queue}'
+
+
+def _get_metrics_key(queue: str) -> str:
+    return cache.make_key(_METRICS_KEY.format(queue=queue))
+
+
+def _get_bucket(latency: float) -> str:
+    for bound in QUEUE_LATENCY_BUCKETS:
+        if latency <= bound:
+            return f'le_{bound}'
+    return 'le_inf'
+
+
+def _record_queue_latency(queue: str, sent_at: float, now: float = None):
+    """
+    Counts a task started from the queue, with the seconds it waited there, in one round trip.
+    """
+    latency = max((now or time.time()) - sent_at, 0.0)
+    pipeline = get_redis_connection().pipeline(transaction=False)
+    key = _get_metrics_key(queue)
+    pipeline.hincrby(key, 'tasks', 1)
+    pipeline.hincrbyfloat(key, 'latency_sum', latency)
+    pipeline.hincrby(key, _get_bucket(latency), 1)
+    pipeline.execute()
+
+
+def _record_expired_task(queue: str, count: int = 1):
+    get_redis_connection().hincrby(_get_metrics_key(queue), 'expired', count)
+
+
+def _get_queue_metrics(queue: str) -> dict:
+    values = {
+        field.decode(): float(value)
+        for field, value in get_redis_connection().hgetall(_get_metrics_key(queue)).items()
+    }
+    tasks = int(values.get('tasks', 0))
+    buckets = [*(f'le_{bound}' for bound in QUEUE_LATENCY_BUCKETS), 'le_inf']
+    return {
+        'tasks': tasks,
+        'expired': int(values.get('expired', 0)),
+        'mean_latency': values.get('latency_sum', 0.0) / tasks if tasks else None,
+        'latency_buckets': {bucket: int(values.get(bucket, 0)) for bucket in buckets},
+    }
+
+
+def _get_task_queue(request):
+    delivery_info = getattr(request, 'delivery_info', None) or {}
+    return delivery_info.get('routing_key') or delivery_info.get('exchange') or None
@@ -0,0 +1,109 @@
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_sequence, compress_string
+
+from config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+# Random bytes added to gzip payloads to mitigate BREACH, as Django's GZipMiddleware does
+GZIP_MAX_RANDOM_BYTES = 100
+
+
+def get_available_encodings() -> list:
+    return [encoding for encoding in settings.API_COMPRESSION_ENCODINGS if encoding != 'br' or brotli is not None]
+
+
+def get_accepted_encoding(request):
+    """
+    Returns the available encoding the client prefers according to its `Accept-Encoding` header,
+    ties going to the first in `API_COMPRESSION_ENCODINGS`, or `None` for identity.
+    """
+    accepted = {}
+    for item in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        name, *params = item.split(';')
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name.strip():
+            accepted[name.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in get_available_encodings():
+        quality = accepted.get(encoding, accepted.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(content, quality=settings.API_COMPRESSION_BROTLI_QUALITY)
+    return compress_string(content, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+
+
+def compress_stream(chunks, encoding: str):
+    if encoding == 'gzip':
+        yield from compress_sequence(chunks, max_random_bytes=GZIP_MAX_RANDOM_BYTES)
+        return
+
+    compressor = brotli.Compressor(quality=settings.API_COMPRESSION_BROTLI_QUALITY)
+    for chunk in chunks:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def set_content_encoding(response, encoding: str):
+    """
+    Marks the response as encoded, weakening a strong ETag as RFC 9110 section 8.8.1 requires.
+    """
+    etag = response.get('ETag')
+    if etag and etag.startswith('"'):
+        response['ETag'] = 'W/' + etag
+    response['Content-Encoding'] = encoding
+    patch_vary_headers(response, ('Accept-Encoding',))
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Negotiated brotli / gzip compression of responses of at least `API_COMPRESSION_MIN_SIZE`
+    bytes, and of streaming responses. Responses already carrying a `Content-Encoding`, such as
+    precompressed cached payloads, are left alone.
+    """
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < settings.API_COMPRESSION_MIN_SIZE:
+            return response
+
+        if response.has_header('Content-Encoding'):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = get_accepted_encoding(request)
+        if encoding is None or (response.streaming and response.is_async):
+            return response
+
+        if response.streaming:
+            response.streaming_content = compress_stream(response.streaming_content, encoding)
+            del response['Content-Length']
+        else:
+            content = compress(response.content, encoding)
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response['Content-Length'] = str(len(content))
+
+        set_content_encoding(response, encoding)
+        return response
@@ -4,6 +4,7 @@ from datetime import timedelta
 from pathlib import Path
 
 import environ
+from kombu import Queue
 from django.utils.translation import gettext_lazy as _
 
 
@@ -34,6 +35,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     # Third Party
     'rest_framework',
@@ -52,6 +54,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'config.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -115,6 +118,33 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Hasher new passwords are hashed with: 'scrypt' or 'argon2', which are memory hard, or 'pbkdf2'. Argon2 needs
+# the argon2-cffi package. Hashes of the other hashers, or with other parameters, are still checked and are
+# upgraded in the background after a successful login.
+PASSWORD_HASHER = env.str('PASSWORD_HASHER', default='scrypt')
+PASSWORD_HASHER_CLASSES = {
+    'scrypt': 'users.hashers.TunableScryptPasswordHasher',
+    'argon2': 'users.hashers.TunableArgon2PasswordHasher',
+    'pbkdf2': 'users.hashers.TunablePBKDF2PasswordHasher',
+}
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_CLASSES[PASSWORD_HASHER],
+    *(hasher for name, hasher in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER),
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+# Benchmark with `manage.py benchmark_password_hashers` before changing them
+PASSWORD_SCRYPT_WORK_FACTOR = env.int('PASSWORD_SCRYPT_WORK_FACTOR', default=2 ** 14)
+PASSWORD_SCRYPT_BLOCK_SIZE = env.int('PASSWORD_SCRYPT_BLOCK_SIZE', default=8)
+PASSWORD_SCRYPT_PARALLELISM = env.int('PASSWORD_SCRYPT_PARALLELISM', default=1)
+# Bytes scrypt may use, which must fit the work factor of every stored hash
+PASSWORD_SCRYPT_MAX_MEMORY = env.int('PASSWORD_SCRYPT_MAX_MEMORY', default=64 * 1024 * 1024)
+PASSWORD_ARGON2_TIME_COST = env.int('PASSWORD_ARGON2_TIME_COST', default=2)
+PASSWORD_ARGON2_MEMORY_COST = env.int('PASSWORD_ARGON2_MEMORY_COST', default=64 * 1024)
+PASSWORD_ARGON2_PARALLELISM = env.int('PASSWORD_ARGON2_PARALLELISM', default=2)
+PASSWORD_PBKDF2_ITERATIONS = env.int('PASSWORD_PBKDF2_ITERATIONS', default=600000)
+# Rehashes waiting for the background thread, logins beyond it upgrade their hash on a later login
+PASSWORD_REHASH_MAX_PENDING = env.int('PASSWORD_REHASH_MAX_PENDING', default=100)
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
@@ -144,17 +174,56 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authentications.api.authentication.StatelessJWTAuthentication',
     ),
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': env.str('THROTTLE_LOGIN_IP_RATE', default='30/m'),
+        'login_email': env.str('THROTTLE_LOGIN_EMAIL_RATE', default='10/m'),
+        'otp_ip': env.str('THROTTLE_OTP_IP_RATE', default='20/m'),
+        'otp_email': env.str('THROTTLE_OTP_EMAIL_RATE', default='5/m'),
+        'otp_verify_email': env.str('THROTTLE_OTP_VERIFY_EMAIL_RATE', default='10/m'),
+        'password_user': env.str('THROTTLE_PASSWORD_USER_RATE', default='10/m'),
+    },
 }
+# Keys each worker remembers for shedding throttled requests without asking Redis
+THROTTLE_LOCAL_MAX_KEYS = env.int('THROTTLE_LOCAL_MAX_KEYS', default=10000)
+
+# Renders and parses JSON with orjson, which must be installed
+API_FAST_JSON = env.bool('API_FAST_JSON', default=False)
+if API_FAST_JSON:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = (
+        'config.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    )
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'] = (
+        'config.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    )
 
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=5),
     'REFRESH_TOKEN_LIFETIME': timedelta(minutes=60),
     "USER_ID_FIELD": "username",
     "USER_ID_CLAIM": "username",
+    "TOKEN_OBTAIN_SERIALIZER": "authentications.api.serializers.UserClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "authentications.api.serializers.RevocableTokenRefreshSerializer",
+    "AUTH_TOKEN_CLASSES": ("authentications.services.jwt.AccessToken",),
 }
+# PEM RSA (RS256) or Ed25519 (EdDSA) private keys, the first one signs the tokens and all of them are published
+# in the JWKS and verify tokens. To rotate, append the new key, promote it to first once cached JWKS expired,
+# and drop the old one once the tokens it signed expired. Without keys, tokens are HS256 signed with SECRET_KEY.
+JWT_PRIVATE_KEY_FILES = env.list('JWT_PRIVATE_KEY_FILES', default=[])
+JWT_JWKS_MAX_AGE = env.int('JWT_JWKS_MAX_AGE', default=60 * 60 * 24)
+# Users seen by StatelessJWTAuthentication, cached in Redis until saved and in each process briefly
+AUTH_USER_CACHE_TIMEOUT = env.int('AUTH_USER_CACHE_TIMEOUT', default=60 * 5)
+AUTH_USER_LOCAL_CACHE_TIMEOUT = env.int('AUTH_USER_LOCAL_CACHE_TIMEOUT', default=10)
+AUTH_USER_LOCAL_CACHE_SIZE = env.int('AUTH_USER_LOCAL_CACHE_SIZE', default=1024)
+# Revoked tokens are looked up in Redis only when the per-process Bloom filter of revocations may hold them
+AUTH_REVOCATION_FILTER_CAPACITY = env.int('AUTH_REVOCATION_FILTER_CAPACITY', default=100000)
+AUTH_REVOCATION_FILTER_ERROR_RATE = env.float('AUTH_REVOCATION_FILTER_ERROR_RATE', default=0.001)
+AUTH_REVOCATION_FILTER_REBUILD_INTERVAL = env.int('AUTH_REVOCATION_FILTER_REBUILD_INTERVAL', default=60)
 
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Bitjob API',
@@ -184,6 +253,20 @@ EMAIL_HOST_USER = env.str("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = env.str("EMAIL_HOST_PASSWORD")
 EMAIL_USE_TLS = True
 DEFAULT_FROM_EMAIL = 'info@bitjobs.ir'
+# `direct` opens a connection per email, `pooled` reuses one per worker process and `batched`
+# also queues the emails in Redis to be sent in batches over it
+MAIL_DISPATCH_MODE = env.str('MAIL_DISPATCH_MODE', default='pooled')
+MAIL_CONNECTION_MAX_AGE = env.int('MAIL_CONNECTION_MAX_AGE', default=300)
+MAIL_CONNECTION_HEALTH_CHECK_INTERVAL = env.int('MAIL_CONNECTION_HEALTH_CHECK_INTERVAL', default=30)
+MAIL_BATCH_SIZE = env.int('MAIL_BATCH_SIZE', default=100)
+# OTP emails are appended to a Redis stream with their code and published by `relay_mail_outbox`
+MAIL_OUTBOX_MAX_LENGTH = env.int('MAIL_OUTBOX_MAX_LENGTH', default=100000)
+MAIL_OUTBOX_BATCH_SIZE = env.int('MAIL_OUTBOX_BATCH_SIZE', default=100)
+MAIL_OUTBOX_BLOCK_MS = env.int('MAIL_OUTBOX_BLOCK_MS', default=1000)
+# Jobs a relay read but did not acknowledge for this long are published again by another one
+MAIL_OUTBOX_CLAIM_IDLE_MS = env.int('MAIL_OUTBOX_CLAIM_IDLE_MS', default=30000)
+# Celery beat also relays the outbox this often, in case the `relay_mail_outbox` command is not running
+MAIL_OUTBOX_RELAY_INTERVAL = env.int('MAIL_OUTBOX_RELAY_INTERVAL', default=10)
 
 REDIS_HOST = env.str('REDIS_HOST', default='localhost')
 REDIS_PORT = env.int('REDIS_PORT', default='6379')
@@ -199,6 +282,21 @@ CACHES = {
     }
 }
 
+API_RESPONSE_CACHE_TIMEOUT = env.int('API_RESPONSE_CACHE_TIMEOUT', default=60 * 15)
+API_COMPRESSION_MIN_SIZE = env.int('API_COMPRESSION_MIN_SIZE', default=1024)
+# In order of preference, brotli needs the brotli package
+API_COMPRESSION_ENCODINGS = ['br', 'gzip']
+API_COMPRESSION_BROTLI_QUALITY = env.int('API_COMPRESSION_BROTLI_QUALITY', default=5)
+CATEGORIES_CACHE_CONTROL_MAX_AGE = env.int('CATEGORIES_CACHE_CONTROL_MAX_AGE', default=60)
+
+PROJECTS_SEARCH_CONFIG = env.str('PROJECTS_SEARCH_CONFIG', default='english')
+SUGGESTIONS_SNAPSHOT_MAX_AGE = env.int('SUGGESTIONS_SNAPSHOT_MAX_AGE', default=60)
+PROJECT_BUDGET_FACET_BOUNDS = [100, 500, 1000, 5000]
+PROJECT_TAGS_FACET_LIMIT = 20
+PROJECT_BULK_CREATE_MAX_SIZE = 5000
+PROJECT_BULK_CREATE_BATCH_SIZE = 1000
+PROJECT_EXPORT_CHUNK_SIZE = 2000
+
 
 CELERY_BROKER_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/0"
 CELERY_RESULT_BACKEND = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/0"
@@ -207,6 +305,34 @@ CELERY_CACHE_BACKEND = 'default'
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Asia/Tehran'
+# Time-critical OTP emails get a queue of their own, so other tasks can never hold them back
+CELERY_TASK_DEFAULT_QUEUE = 'celery'
+CELERY_TASK_QUEUES = (
+    Queue('mail_otp'),
+    Queue('celery'),
+)
+CELERY_TASK_ROUTES = {
+    'mail.tasks.send_otp_mail_in_background': {'queue': 'mail_otp'},
+    'mail.tasks.send_queued_mails': {'queue': 'mail_otp'},
+    'mail.tasks.relay_mail_outbox': {'queue': 'mail_otp'},
+}
+CELERY_BEAT_SCHEDULE = {
+    'relay-mail-outbox': {
+        'task': 'mail.tasks.relay_mail_outbox',
+        'schedule': MAIL_OUTBOX_RELAY_INTERVAL,
+        # A run that could not start before the next one is skipped
+        'options': {'expires': MAIL_OUTBOX_RELAY_INTERVAL},
+    },
+}
+# A worker consuming several queues drains them in the order given to `-Q`
+CELERY_BROKER_TRANSPORT_OPTIONS = {'queue_order_strategy': 'priority'}
+# Applied to a worker consuming a single queue, see config.celery.configure_queue_worker
+CELERY_WORKER_QUEUE_OPTIONS = {
+    'mail_otp': {
+        'concurrency': env.int('CELERY_MAIL_OTP_CONCURRENCY', default=8),
+        'prefetch_multiplier': 1,
+    },
+}
 
 
 CODE_EXPIRY_MINUTES = env.int('CODE_MINUTES_EXPIRE_AT', default=4)
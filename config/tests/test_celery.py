@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+from django.test import TestCase
+from django_redis import get_redis_connection
+
+from config.celery import configure_queue_worker, record_expired_task, record_queue_latency
+from config.celery_metrics import _get_queue_metrics, _record_queue_latency
+
+
+class QueueMetricsTests(TestCase):
+
+    def test_record_queue_latency(self):
+        _record_queue_latency('mail_otp', sent_at=100.0, now=100.05)
+        _record_queue_latency('mail_otp', sent_at=100.0, now=102.0)
+        _record_queue_latency('mail_otp', sent_at=100.0, now=200.0)
+
+        metrics = _get_queue_metrics('mail_otp')
+        self.assertEqual(metrics['tasks'], 3)
+        self.assertAlmostEqual(metrics['mean_latency'], (0.05 + 2 + 100) / 3)
+        self.assertEqual(metrics['latency_buckets']['le_0.1'], 1)
+        self.assertEqual(metrics['latency_buckets']['le_5'], 1)
+        self.assertEqual(metrics['latency_buckets']['le_inf'], 1)
+        self.assertEqual(_get_queue_metrics('celery')['tasks'], 0)
+
+    def test_task_signals(self):
+        request = SimpleNamespace(sent_at=100.0, delivery_info={'routing_key': 'mail_otp'}, is_eager=False)
+        record_queue_latency(task=SimpleNamespace(request=request))
+        record_expired_task(request=request, expired=True)
+        record_expired_task(request=request, expired=False)
+
+        eager_request = SimpleNamespace(sent_at=None, delivery_info=None, is_eager=True)
+        record_queue_latency(task=SimpleNamespace(request=eager_request))
+
+        metrics = _get_queue_metrics('mail_otp')
+        self.assertEqual(metrics['tasks'], 1)
+        self.assertEqual(metrics['expired'], 1)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+
+
+class QueueWorkerTests(TestCase):
+
+    def test_single_queue_worker_is_configured(self):
+        conf = SimpleNamespace()
+        configure_queue_worker(conf=conf, options={'queues': ['mail_otp']})
+
+        self.assertEqual(conf.worker_prefetch_multiplier, 1)
+        self.assertTrue(conf.worker_concurrency)
+
+    def test_other_workers_are_left_alone(self):
+        for queues in (None, ['mail_otp', 'celery'], 'celery'):
+            conf = SimpleNamespace()
+            configure_queue_worker(conf=conf, options={'queues': queues})
+            self.assertEqual(vars(conf), {})
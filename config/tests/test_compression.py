@@ -0,0 +1,66 @@
+import gzip
+from unittest import mock, skipIf
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import SimpleTestCase, RequestFactory
+
+from config import compression
+from config.compression import CompressionMiddleware, get_accepted_encoding
+
+
+class AcceptedEncodingTests(SimpleTestCase):
+
+    def _get(self, header):
+        return get_accepted_encoding(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=header))
+
+    @mock.patch.object(compression, 'brotli', None)
+    def test_gzip(self):
+        self.assertEqual(self._get('gzip, deflate, br'), 'gzip')
+        self.assertEqual(self._get('*'), 'gzip')
+        self.assertIsNone(self._get('gzip;q=0'))
+        self.assertIsNone(self._get('identity'))
+        self.assertIsNone(self._get(''))
+
+    @skipIf(compression.brotli is None, 'brotli is not installed')
+    def test_brotli_is_preferred(self):
+        self.assertEqual(self._get('gzip, deflate, br'), 'br')
+        self.assertEqual(self._get('br;q=0.5, gzip'), 'gzip')
+
+
+@mock.patch.object(compression, 'brotli', None)
+class CompressionMiddlewareTests(SimpleTestCase):
+    content = b'{"title":"Project"}' * 100
+
+    def _process(self, response, header='gzip'):
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING=header)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_compresses_large_responses(self):
+        response = self._process(HttpResponse(self.content, headers={'ETag': '"digest"'}))
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['ETag'], 'W/"digest"')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(response.content), self.content)
+
+    def test_keeps_small_responses(self):
+        response = self._process(HttpResponse(b'{}'))
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, b'{}')
+
+    def test_keeps_identity_for_clients_without_gzip(self):
+        response = self._process(HttpResponse(self.content), header='identity')
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_keeps_encoded_responses(self):
+        response = self._process(HttpResponse(b'payload' * 500, headers={'Content-Encoding': 'br'}))
+        self.assertEqual(response.content, b'payload' * 500)
+
+    def test_compresses_streaming_responses(self):
+        response = self._process(StreamingHttpResponse(iter([self.content, self.content])))
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), self.content * 2)
@@ -0,0 +1,165 @@
+from datetime import datetime, date, time, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+from uuid import UUID
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse, get_resolver
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from authentications.services.jwt import RefreshToken
+from config.parsers import ORJSONParser
+from config.renderers import ORJSONRenderer
+from projects.models import Project, Category, Tag, ProjectFile
+
+API_NAMESPACES = ('authentications', 'users', 'projects')
+
+
+class ORJSONRendererCompatibilityTests(APITestCase):
+    """
+    Renders the response of every API endpoint with ORJSONRenderer and diffs it against the bytes
+    of the default renderer.
+    """
+
+    def setUp(self) -> None:
+        self.user = baker.make(get_user_model(), username='owner', email='owner@example.com', first_name='Zoë')
+        self.user.set_password('password')
+        self.user.save()
+
+        category = baker.make(Category, name='طراحی', description='Design\u2028projects', slug='design')
+        tags = [baker.make(Tag, name=name) for name in ['figma', 'لوگو']]
+        self.project = baker.make(Project, slug='logo', title='Logo 🎨', description='"Quoted"\n\\ and \u2029',
+                                  category=category, owner=self.user, budget='1234.5', deadline='2030-01-02')
+        self.project.tags.set(tags)
+        baker.make(ProjectFile, project=self.project, file='project_files/logo.pdf')
+        baker.make(Project, slug='bare', owner=self.user, category=None, budget=None, deadline=None)
+
+        self.covered = set()
+
+    def _request(self, name, method='get', data=None, kwargs=None, authenticate=False, **params):
+        self.client.force_authenticate(self.user if authenticate else None)
+        url = reverse(name, kwargs=kwargs)
+        if method == 'get':
+            response = self.client.get(url, params or data)
+        else:
+            response = getattr(self.client, method)(url, data, format='json')
+
+        self.covered.add(name)
+        self.assertIsInstance(response.accepted_renderer, JSONRenderer)
+        rendered = ORJSONRenderer().render(response.data, response.accepted_media_type, response.renderer_context)
+        self.assertEqual(rendered, response.content, f'{method.upper()} {url}')
+        return response
+
+    def test_project_endpoints(self):
+        self._request('projects:api-root')
+        self._request('projects:project-list')
+        self._request('projects:project-list', facets='status,category,tags,budget', expand='category')
+        self._request('projects:project-list', ordering='budget', cursor='invalid')
+        self._request('projects:project-list', fields='password')
+        self._request('projects:project-detail', kwargs={'slug': 'logo'})
+        self._request('projects:project-detail', kwargs={'slug': 'missing'})
+        self._request('projects:project-list', 'post', {'title': 'New', 'description': 'D', 'category': 'design',
+                                                        'tags': ['figma'], 'owner': self.user.pk}, authenticate=True)
+        self._request('projects:project-list', 'post', {'category': 'missing'}, authenticate=True)
+        self._request('projects:project-detail', 'patch', {'budget': '10.10'}, kwargs={'slug': 'logo'},
+                      authenticate=True)
+        self._request('projects:project-detail', 'delete', kwargs={'slug': 'bare'}, authenticate=True)
+        self._request('projects:project-bulk_create', 'post', [{'title': 'Bulk', 'description': 'D',
+                                                               'category': 'design', 'owner': self.user.pk}],
+                      authenticate=True)
+        self._request('projects:project-bulk_create', 'post', [{'title': 'Bulk'}], authenticate=True)
+        self._request('projects:project-export', min_budget='invalid')
+        self._request('projects:categories')
+        self._request('projects:categories', limit=0)
+        self._request('projects:categories_suggest', prefix='ط')
+        self._request('projects:tags_suggest', prefix='fi')
+
+    def test_user_endpoints(self):
+        self._request('users:api-root')
+        self._request('users:check_email', 'post', {'email': 'owner@example.com'})
+        self._request('users:check_email', 'post', {'email': 'invalid'})
+        self._request('users:send_registration_code', 'post', {'email': 'new@example.com'})
+        self._request('users:verify_registration_code', 'post', {'email': 'new@example.com', 'code': '000'})
+        self._request('users:send_forget_password_code', 'post', {})
+        self._request('users:verify_forget_code', 'post', {'email': 'owner@example.com', 'code': '000'})
+        self._request('users:reset_password', 'post', {'email': 'owner@example.com'})
+        self._request('users:profile', authenticate=True)
+        self._request('users:profile')
+        self._request('users:user-list', 'post', {'email': 'new@example.com'})
+        self._request('users:user-detail', kwargs={'username': 'owner'}, authenticate=True)
+        self._request('users:user-detail', 'delete', kwargs={'username': 'owner'}, authenticate=True)
+        self._request('users:user-change_password', 'patch', {'old_password': 'wrong'},
+                      kwargs={'username': 'owner'}, authenticate=True)
+
+    def test_authentication_endpoints(self):
+        self._request('authentications:token_obtain_pair', 'post',
+                      {'email': 'owner@example.com', 'password': 'password'})
+        self._request('authentications:token_obtain_pair', 'post', {'email': 'owner@example.com', 'password': 'x'})
+        self._request('authentications:token_refresh', 'post', {'refresh': str(RefreshToken.for_user(self.user))})
+        self._request('authentications:token_refresh', 'post', {'refresh': 'invalid'})
+        self._request('authentications:token_revoke', 'post', {'refresh': str(RefreshToken.for_user(self.user))})
+        self._request('authentications:token_revoke', 'post', {'refresh': 'invalid'})
+        self._request('authentications:jwks', 'get')
+
+    def test_every_endpoint_is_covered(self):
+        for test in (self.test_project_endpoints, self.test_user_endpoints, self.test_authentication_endpoints):
+            test()
+
+        names = set()
+        for namespace in API_NAMESPACES:
+            prefix, resolver = get_resolver().namespace_dict[namespace]
+            names |= {f'{namespace}:{pattern.name}' for pattern in resolver.url_patterns if pattern.name}
+
+        self.assertEqual(names - self.covered, set())
+
+    def test_native_values(self):
+        data = {
+            'datetime': datetime(2030, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            'naive': datetime(2030, 1, 2, 3, 4, 5),
+            'date': date(2030, 1, 2),
+            'time': time(3, 4, 5, 678901),
+            'timedelta': timedelta(hours=1),
+            'decimal': Decimal('1234.50'),
+            'uuid': UUID(int=1),
+            'bytes': b'bytes',
+            'tuple': (1, 2),
+            1: 'integer key',
+            'nested': [{'text': 'line\u2028separator\u2029', 'none': None, 'bool': True, 'float': 0.25}],
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indent_falls_back_to_the_default_renderer(self):
+        data = {'list': [1, 2]}
+        self.assertEqual(
+            ORJSONRenderer().render(data, 'application/json; indent=4'),
+            JSONRenderer().render(data, 'application/json; indent=4'),
+        )
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+
+
+class ORJSONParserCompatibilityTests(APITestCase):
+
+    def _parse(self, parser, body):
+        try:
+            return parser.parse(BytesIO(body))
+        except ParseError as exc:
+            return exc.detail
+
+    def test_same_result_as_default_parser(self):
+        bodies = [
+            b'{"title": "Logo \xf0\x9f\x8e\xa8", "tags": ["figma"], "budget": "10.50", "owner": 1}',
+            b'[{"a": 1.5}, null, true]',
+            b'{"big": 123456789012345678901234567890}',
+            b'{"nan": NaN}',
+            b'{"unterminated": ',
+            b'',
+        ]
+        for body in bodies:
+            self.assertEqual(self._parse(ORJSONParser(), body), self._parse(JSONParser(), body), body)
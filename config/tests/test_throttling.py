@@ -0,0 +1,96 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django_redis import get_redis_connection
+from redis.exceptions import ConnectionError
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from config.throttling import SlidingWindowLimiter, limiter
+from mail.services.outbox import MAIL_OUTBOX_STREAM
+
+
+class SlidingWindowLimiterTests(TestCase):
+
+    def setUp(self):
+        self.limiter = SlidingWindowLimiter(max_keys=100)
+
+    def test_limit_within_window(self):
+        self.assertIsNone(self.limiter.hit('key', 2, 60, 1000.0))
+        self.assertIsNone(self.limiter.hit('key', 2, 60, 1010.0))
+
+        self.assertAlmostEqual(self.limiter.hit('key', 2, 60, 1020.0), 40, places=2)
+        self.assertIsNone(self.limiter.hit('other', 2, 60, 1020.0))
+
+    def test_window_slides(self):
+        self.assertIsNone(self.limiter.hit('key', 2, 60, 1000.0))
+        self.assertIsNone(self.limiter.hit('key', 2, 60, 1030.0))
+
+        self.assertIsNone(self.limiter.hit('key', 2, 60, 1061.0))
+        self.assertIsNotNone(self.limiter.hit('key', 2, 60, 1062.0))
+
+    def test_window_is_shared_between_workers(self):
+        other_worker = SlidingWindowLimiter(max_keys=100)
+
+        self.assertIsNone(self.limiter.hit('key', 2, 60, 1000.0))
+        self.assertIsNone(other_worker.hit('key', 2, 60, 1001.0))
+
+        self.assertIsNotNone(self.limiter.hit('key', 2, 60, 1002.0))
+
+    def test_rejected_keys_are_shed_locally(self):
+        self.limiter.hit('key', 1, 60, 1000.0)
+        self.limiter.hit('key', 1, 60, 1001.0)
+
+        with mock.patch.object(SlidingWindowLimiter, '_hit_redis') as hit_redis:
+            self.assertAlmostEqual(self.limiter.hit('key', 1, 60, 1002.0), 58, places=2)
+            hit_redis.assert_not_called()
+
+    def test_local_fallback_when_redis_is_unreachable(self):
+        with mock.patch.object(SlidingWindowLimiter, '_hit_redis', side_effect=ConnectionError):
+            self.assertIsNone(self.limiter.hit('key', 2, 60, 1000.0))
+            self.assertIsNone(self.limiter.hit('key', 2, 60, 1001.0))
+            self.assertAlmostEqual(self.limiter.hit('key', 2, 60, 1002.0), 58, places=2)
+
+    def test_local_keys_are_bounded(self):
+        limiter = SlidingWindowLimiter(max_keys=2)
+        for key in ('a', 'b', 'c'):
+            limiter.hit(key, 1, 60, 1000.0)
+            limiter.hit(key, 1, 60, 1000.0)
+
+        self.assertEqual(list(limiter._blocked_until), ['b', 'c'])
+        self.assertEqual(list(limiter._windows), ['b', 'c'])
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+
+
+class ThrottledEndpointTests(APITestCase):
+
+    def test_otp_requests_are_throttled_per_email(self):
+        url = reverse('users:send_registration_code')
+        for _ in range(5):
+            self.client.post(url, {'email': 'test@test.com'})
+
+        response = self.client.post(url, {'email': 'test@test.com'})
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+
+        response = self.client.post(url, {'email': 'other@test.com'})
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(get_redis_connection().xlen(cache.make_key(MAIL_OUTBOX_STREAM)), 2)
+
+    def test_login_is_throttled_per_email(self):
+        url = reverse('authentications:token_obtain_pair')
+        data = {'email': 'test@test.com', 'password': 'wrong'}
+        for _ in range(10):
+            self.assertEqual(self.client.post(url, data).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        with self.assertNumQueries(0):
+            response = self.client.post(url, data)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+        limiter.clear()
@@ -0,0 +1,166 @@
+import logging
+import threading
+import uuid
+from collections import OrderedDict, deque
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import ConnectionError, TimeoutError
+from rest_framework.throttling import SimpleRateThrottle
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Sliding window over a sorted set of request timestamps. Drops the timestamps out of the window and
+# records the request if there is room, returning 0, or else the milliseconds until there is room.
+_SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[4])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return 0
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return tonumber(oldest[2]) + window - now
+"""
+
+_sliding_window_script = None
+
+
+def _get_sliding_window_script():
+    global _sliding_window_script
+    if _sliding_window_script is None:
+        _sliding_window_script = get_redis_connection().register_script(_SLIDING_WINDOW_SCRIPT)
+    return _sliding_window_script
+
+
+class SlidingWindowLimiter:
+    """
+    Sliding window rate limiter shared by all the workers through Redis, one `EVALSHA` per request.
+    Every worker also keeps a bounded in-process tier: keys Redis rejected are shed locally until
+    their retry time, without any round trip, and while Redis is unreachable the requests this worker
+    has let through are counted locally instead.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._windows = OrderedDict()
+        self._blocked_until = OrderedDict()
+
+    def hit(self, key: str, limit: int, duration: int, now: float):
+        """
+        Records a request on the key, returning `None` when it is allowed or else the seconds to wait.
+        """
+        with self._lock:
+            blocked_until = self._blocked_until.get(key)
+            if blocked_until is not None and blocked_until > now:
+                return blocked_until - now
+
+        try:
+            wait = self._hit_redis(key, limit, duration, now)
+        except (ConnectionError, TimeoutError) as e:
+            logger.warning('Rate limiting locally, Redis is unreachable: %s', e)
+            wait = self._get_local_wait(key, limit, duration, now)
+
+        with self._lock:
+            if wait is None:
+                window = self._windows.pop(key, None) or deque(maxlen=limit)
+                window.append(now)
+                self._store(self._windows, key, window)
+            else:
+                self._store(self._blocked_until, key, now + wait)
+
+        return wait
+
+    def clear(self):
+        with self._lock:
+            self._windows.clear()
+            self._blocked_until.clear()
+
+    @staticmethod
+    def _hit_redis(key: str, limit: int, duration: int, now: float):
+        now_ms = int(now * 1000)
+        wait_ms = _get_sliding_window_script()(
+            keys=[cache.make_key(key)],
+            args=[now_ms, duration * 1000, limit, f'{now_ms}:{uuid.uuid4().hex}'],
+        )
+        return wait_ms / 1000 if wait_ms else None
+
+    def _get_local_wait(self, key: str, limit: int, duration: int, now: float):
+        with self._lock:
+            window = self._windows.get(key, ())
+            while window and window[0] <= now - duration:
+                window.popleft()
+            if len(window) < limit:
+                return None
+            return window[0] + duration - now
+
+    def _store(self, entries: OrderedDict, key: str, value):
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.max_keys:
+            entries.popitem(last=False)
+
+
+limiter = SlidingWindowLimiter(max_keys=settings.THROTTLE_LOCAL_MAX_KEYS)
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    SimpleRateThrottle counting requests with the shared sliding window limiter instead of a
+    history list read and written back through the cache. Subclasses set `scope` and
+    `get_request_ident`.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.wait_time = limiter.hit(self.key, self.num_requests, self.duration, self.timer())
+        return self.wait_time is None
+
+    def wait(self):
+        return self.wait_time
+
+    def get_cache_key(self, request, view):
+        ident = self.get_request_ident(request)
+        if ident is None:
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+    def get_request_ident(self, request):
+        raise NotImplementedError('.get_request_ident() must be overridden')
+
+
+class IPRateThrottle(SlidingWindowRateThrottle):
+    def get_request_ident(self, request):
+        return self.get_ident(request)
+
+
+class EmailRateThrottle(SlidingWindowRateThrottle):
+    """
+    Limits the requests about the email in the request body, whoever sends them.
+    """
+
+    def get_request_ident(self, request):
+        data = request.data
+        email = data.get('email') if hasattr(data, 'get') else None
+        if not isinstance(email, str) or not email.strip() or len(email) > 254:
+            # Left to the serializer to reject, the IP throttles still apply
+            return None
+        return email.strip().lower()
+
+
+class UserRateThrottle(SlidingWindowRateThrottle):
+    def get_request_ident(self, request):
+        if request.user and request.user.is_authenticated:
+            return f'user:{request.user.pk}'
+        return self.get_ident(request)
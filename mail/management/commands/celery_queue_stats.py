@@ -0,0 +1,30 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django_redis import get_redis_connection
+
+from config import settings, celery_app
+from config.celery_metrics import _get_queue_metrics
+from mail.services.queue import MAIL_QUEUE_KEY, MAIL_QUEUE_METRICS_NAME
+
+
+class Command(BaseCommand):
+    help = 'Prints the pending tasks and the queue latency of every Celery queue and of the mail queue'
+
+    def handle(self, *args, **options):
+        with celery_app.connection_for_read() as connection:
+            channel = connection.default_channel
+            for queue in settings.CELERY_TASK_QUEUES:
+                pending = channel.queue_declare(queue.name).message_count
+                self._write_metrics(queue.name, _get_queue_metrics(queue.name), pending)
+
+        pending = get_redis_connection().llen(cache.make_key(MAIL_QUEUE_KEY))
+        self._write_metrics(MAIL_QUEUE_METRICS_NAME, _get_queue_metrics(MAIL_QUEUE_METRICS_NAME), pending)
+
+    def _write_metrics(self, name: str, metrics: dict, pending: int):
+        mean_latency = metrics['mean_latency']
+        self.stdout.write(
+            f"{name}: pending={pending} tasks={metrics['tasks']} "
+            f"expired={metrics['expired']} "
+            f"mean_latency={'-' if mean_latency is None else f'{mean_latency:.3f}s'}"
+        )
+        self.stdout.write('  ' + ' '.join(f'{bucket}={count}' for bucket, count in metrics['latency_buckets'].items()))
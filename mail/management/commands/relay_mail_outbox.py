@@ -0,0 +1,36 @@
+import logging
+import os
+import socket
+import time
+
+from django.core.management.base import BaseCommand
+
+from config import settings
+from mail.services.relay import _relay_mail_outbox, _relay_pending_mails
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Publishes the emails of the mail outbox to the Celery workers, in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Relay the pending emails and exit')
+        parser.add_argument('--retry-delay', type=float, default=1.0,
+                            help='Seconds to wait after the broker or Redis failed')
+
+    def handle(self, *args, **options):
+        consumer = f'{socket.gethostname()}-{os.getpid()}'
+
+        if options['once']:
+            relayed = _relay_pending_mails(consumer)
+            self.stdout.write(self.style.SUCCESS(f'{relayed} emails relayed'))
+            return
+
+        while True:
+            try:
+                _relay_mail_outbox(consumer, settings.MAIL_OUTBOX_BATCH_SIZE, block=settings.MAIL_OUTBOX_BLOCK_MS)
+            except Exception as e:
+                # The batch is left unacknowledged and claimed again later
+                logger.error(e)
+                time.sleep(options['retry_delay'])
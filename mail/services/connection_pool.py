@@ -0,0 +1,94 @@
+import logging
+import os
+import smtplib
+import socket
+import threading
+import time
+
+from django.core.mail import get_connection
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection:
+    """
+    Long-lived mail backend connection of the current process, used in place of a backend by
+    MailSenderManager so consecutive emails skip the SMTP and TLS handshakes. The connection is
+    checked with a `NOOP` after being idle, recycled after `MAIL_CONNECTION_MAX_AGE` seconds, and
+    reopened once when a message fails because the server dropped it. A forked process opens its own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+        self._opened_at = self._used_at = 0.0
+
+    def send_messages(self, messages) -> int:
+        """
+        Sends the messages one by one, so a failing message is logged without losing the others.
+        """
+        sent = 0
+        with self._lock:
+            for message in messages:
+                try:
+                    sent += self._send(message)
+                except Exception as e:
+                    logger.error(e)
+        return sent
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def _send(self, message) -> int:
+        try:
+            return self._get_connection().send_messages([message])
+        # Only a dropped connection is retried, SMTP response errors such as a refused recipient are
+        # about the message and reach the per-message log, though they subclass OSError too
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, socket.timeout) as e:
+            logger.warning('Reconnecting to the mail server: %s', e)
+            self._close()
+
+        return self._get_connection().send_messages([message])
+
+    def _get_connection(self):
+        now = time.monotonic()
+        if self._pid != os.getpid():
+            # The socket belongs to the parent process
+            self._connection, self._pid = None, os.getpid()
+        elif self._connection is not None and (
+            now - self._opened_at > settings.MAIL_CONNECTION_MAX_AGE
+            or (now - self._used_at > settings.MAIL_CONNECTION_HEALTH_CHECK_INTERVAL and not self._is_alive())
+        ):
+            self._close()
+
+        if self._connection is None:
+            self._connection = get_connection(settings.EMAIL_BACKEND, fail_silently=False)
+            self._connection.open()
+            self._opened_at = now
+
+        self._used_at = now
+        return self._connection
+
+    def _is_alive(self) -> bool:
+        client = getattr(self._connection, 'connection', None)
+        if not isinstance(client, smtplib.SMTP):
+            return True
+        try:
+            return client.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _close(self):
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception as e:
+                logger.warning(e)
+        self._connection = None
+
+
+pooled_connection = PooledConnection()
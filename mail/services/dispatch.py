@@ -0,0 +1,25 @@
+from config import settings
+from mail.services.queue import _queue_mail
+from mail.tasks import send_otp_mail_in_background, send_queued_mails
+
+
+def _dispatch_otp_mail(to_email: str, message: str, title: str, expires: float, job_id: str = None):
+    """
+    Sends a time-critical email from a worker of the `mail_otp` queue, or through the Redis mail queue
+    drained in batches when `MAIL_DISPATCH_MODE` is `batched`. It is dropped once `expires` seconds
+    have passed without it being sent, and sent once per outbox `job_id`.
+    """
+    if settings.MAIL_DISPATCH_MODE != 'batched':
+        send_otp_mail_in_background.apply_async(
+            kwargs={
+                'to_email': to_email,
+                'message': message,
+                'title': title,
+                'job_id': job_id
+            },
+            expires=expires,
+        )
+        return
+
+    if _queue_mail(to_email, message, title, expires, job_id):
+        send_queued_mails.apply_async()
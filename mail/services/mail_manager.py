@@ -2,21 +2,26 @@ import logging
 
 from config import settings
 from django.core import mail as django_mail
-from django.core.mail import get_connection
+from django.core.mail import get_connection, EmailMessage
 from django.core.mail.backends.smtp import EmailBackend
 
+from mail.services.connection_pool import pooled_connection
+
 
 logger = logging.getLogger(__name__)
 
 
 class MailSenderManager:
     """
-    This class is responsible for sending emails using django core mail
+    This class is responsible for sending emails using django core mail,
+    over the process' pooled connection unless `MAIL_DISPATCH_MODE` is `direct`
     """
     def __init__(self, connection: EmailBackend = None):
         self.connection = connection
-        if self.connection is None:
+        if self.connection is None and settings.MAIL_DISPATCH_MODE == 'direct':
             self.connection = get_connection(settings.EMAIL_BACKEND)
+        elif self.connection is None:
+            self.connection = pooled_connection
 
     def send(self, to_email: str, message: str, title: str, **kwargs):
         """
@@ -40,3 +45,23 @@ class MailSenderManager:
 
         except Exception as e:
             logger.error(e)
+
+    def send_many(self, mails: list):
+        """
+        Sends the emails over the same connection
+        :param mails: list of dicts of `to_email`, `message` and `title`
+        :return: number of successful emails
+        """
+        messages = [
+            EmailMessage(subject=mail['title'],
+                         body=mail['message'],
+                         from_email=settings.DEFAULT_FROM_EMAIL,
+                         to=mail['to_email'].split(','),
+                         connection=self.connection)
+            for mail in mails
+        ]
+        try:
+            return self.connection.send_messages(messages)
+
+        except Exception as e:
+            logger.error(e)
@@ -0,0 +1,62 @@
+import time
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+from config import settings
+
+MAIL_OUTBOX_STREAM = 'mail:outbox'
+# Marks a job as sent, so a job relayed twice is only sent once
+MAIL_SENT_KEY = 'mail:sent:{job_id}'
+MAIL_SENT_TIMEOUT = 60 * 60
+
+# Sets KEYS[1] to ARGV[1] for ARGV[2] milliseconds unless it exists, and only then appends the mail
+# job made of the remaining arguments to the outbox stream KEYS[2], returning the job id or nil.
+_SET_WITH_MAIL_SCRIPT = """
+if not redis.call('SET', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    return false
+end
+return redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[3], '*', unpack(ARGV, 4))
+"""
+
+_set_with_mail_script = None
+
+
+def _get_set_with_mail_script():
+    global _set_with_mail_script
+    if _set_with_mail_script is None:
+        _set_with_mail_script = get_redis_connection().register_script(_SET_WITH_MAIL_SCRIPT)
+    return _set_with_mail_script
+
+
+def _add_with_mail(key: str, value, timeout: int, to_email: str, message: str, title: str):
+    """
+    Stores the value like `cache.add` and, only if it was stored, appends a job sending the email
+    within `timeout` seconds to the outbox, in one script call. Returns the job id, or `None` when
+    the key already existed.
+    """
+    job_id = _get_set_with_mail_script()(
+        keys=[cache.make_key(key), cache.make_key(MAIL_OUTBOX_STREAM)],
+        args=[
+            cache.client.encode(value),
+            timeout * 1000,
+            settings.MAIL_OUTBOX_MAX_LENGTH,
+            'to', to_email,
+            'title', str(title),
+            'message', str(message),
+            'expires_at', time.time() + timeout,
+        ],
+        client=get_redis_connection(),
+    )
+    return None if job_id is None else job_id.decode()
+
+
+def _get_sent_mails(job_ids) -> set:
+    keys = {MAIL_SENT_KEY.format(job_id=job_id): job_id for job_id in job_ids if job_id is not None}
+    return {keys[key] for key in cache.get_many(keys)} if keys else set()
+
+
+def _mark_mails_sent(job_ids):
+    keys = {MAIL_SENT_KEY.format(job_id=job_id): 1 for job_id in job_ids if job_id is not None}
+    if keys:
+        cache.set_many(keys, timeout=MAIL_SENT_TIMEOUT)
@@ -0,0 +1,75 @@
+import json
+import time
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+from config import settings
+from config.celery_metrics import _record_expired_task
+from mail.services.mail_manager import MailSenderManager
+from mail.services.outbox import _get_sent_mails, _mark_mails_sent
+
+MAIL_QUEUE_KEY = 'mail:queue'
+# Set while a drain task is scheduled or running, so a burst of emails schedules a single one
+MAIL_DRAIN_SCHEDULED_KEY = 'mail:queue:drain'
+MAIL_DRAIN_SCHEDULED_TIMEOUT = 60
+# Name the emails dropped from the mail queue are counted under in the queue metrics
+MAIL_QUEUE_METRICS_NAME = 'mail_queue'
+
+
+def _queue_mail(to_email: str, message: str, title: str, expires: float = None, job_id: str = None) -> bool:
+    """
+    Appends the email to the queue, returning whether the caller has to schedule a drain task.
+    """
+    mail = json.dumps({
+        'to_email': to_email,
+        'message': str(message),
+        'title': str(title),
+        'expires_at': None if expires is None else time.time() + expires,
+        'job_id': job_id,
+    })
+    pipeline = get_redis_connection().pipeline(transaction=False)
+    pipeline.rpush(cache.make_key(MAIL_QUEUE_KEY), mail)
+    pipeline.set(cache.make_key(MAIL_DRAIN_SCHEDULED_KEY), 1, nx=True, ex=MAIL_DRAIN_SCHEDULED_TIMEOUT)
+    length, scheduled = pipeline.execute()
+    return bool(scheduled)
+
+
+def _pop_mails(count: int) -> list:
+    pipeline = get_redis_connection().pipeline()
+    pipeline.lrange(cache.make_key(MAIL_QUEUE_KEY), 0, count - 1)
+    pipeline.ltrim(cache.make_key(MAIL_QUEUE_KEY), count, -1)
+    mails, trimmed = pipeline.execute()
+    return [json.loads(mail) for mail in mails]
+
+
+def _drain_mail_queue() -> int:
+    """
+    Sends the queued emails in batches of `MAIL_BATCH_SIZE` over one connection until the queue is
+    empty, dropping the expired and already sent ones, and returns the number of successful emails.
+    Emails queued while the scheduled flag is being cleared are not left behind, the queue is
+    checked once more after clearing it.
+    """
+    connection = get_redis_connection()
+    manager = MailSenderManager()
+    sent = 0
+    while True:
+        mails = _pop_mails(settings.MAIL_BATCH_SIZE)
+        if mails:
+            now = time.time()
+            unexpired = [mail for mail in mails if mail.get('expires_at') is None or mail['expires_at'] > now]
+            if len(unexpired) < len(mails):
+                _record_expired_task(MAIL_QUEUE_METRICS_NAME, len(mails) - len(unexpired))
+            sent_jobs = _get_sent_mails(mail.get('job_id') for mail in unexpired)
+            unsent = [mail for mail in unexpired if mail.get('job_id') not in sent_jobs]
+            if unsent:
+                sent += manager.send_many(unsent) or 0
+                _mark_mails_sent(mail.get('job_id') for mail in unsent)
+            continue
+
+        connection.delete(cache.make_key(MAIL_DRAIN_SCHEDULED_KEY))
+        if not connection.llen(cache.make_key(MAIL_QUEUE_KEY)):
+            return sent
+        if not connection.set(cache.make_key(MAIL_DRAIN_SCHEDULED_KEY), 1, nx=True, ex=MAIL_DRAIN_SCHEDULED_TIMEOUT):
+            # A drain task has been scheduled for them meanwhile
+            return sent
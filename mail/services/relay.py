@@ -0,0 +1,87 @@
+import time
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import ResponseError
+
+from config import settings
+from config.celery_metrics import _record_expired_task
+from mail.services.dispatch import _dispatch_otp_mail
+from mail.services.outbox import MAIL_OUTBOX_STREAM
+
+MAIL_OUTBOX_GROUP = 'relay'
+# Name the jobs expired in the outbox are counted under in the queue metrics
+MAIL_OUTBOX_METRICS_NAME = 'mail_outbox'
+
+
+def _ensure_outbox_group(connection, stream: str):
+    try:
+        connection.xgroup_create(stream, MAIL_OUTBOX_GROUP, id='0', mkstream=True)
+    except ResponseError as e:
+        if 'BUSYGROUP' not in str(e):
+            raise
+
+
+def _read_outbox_jobs(connection, stream: str, consumer: str, count: int, block: int = None) -> list:
+    """
+    Returns up to `count` jobs, first the ones a relay read without acknowledging them for
+    `MAIL_OUTBOX_CLAIM_IDLE_MS`, as it died or failed to publish them, then new ones.
+    """
+    claimed = connection.xautoclaim(
+        stream, MAIL_OUTBOX_GROUP, consumer, min_idle_time=settings.MAIL_OUTBOX_CLAIM_IDLE_MS, count=count,
+    )[1]
+    if claimed:
+        return claimed
+
+    response = connection.xreadgroup(MAIL_OUTBOX_GROUP, consumer, {stream: '>'}, count=count, block=block)
+    return response[0][1] if response else []
+
+
+def _relay_mail_outbox(consumer: str, count: int, block: int = None) -> int:
+    """
+    Publishes a batch of outbox jobs to Celery and acknowledges them, returning the number of jobs
+    handled. A job is acknowledged only after the whole batch was published, so jobs are published
+    at least once and the workers skip the ones already sent. Expired jobs are dropped.
+    """
+    connection = get_redis_connection()
+    stream = cache.make_key(MAIL_OUTBOX_STREAM)
+    _ensure_outbox_group(connection, stream)
+
+    jobs = _read_outbox_jobs(connection, stream, consumer, count, block)
+    if not jobs:
+        return 0
+
+    now = time.time()
+    expired = 0
+    for job_id, fields in jobs:
+        if not fields:
+            # Trimmed from the stream before it was relayed
+            continue
+
+        fields = {key.decode(): value.decode() for key, value in fields.items()}
+        expires = float(fields['expires_at']) - now
+        if expires <= 0:
+            expired += 1
+            continue
+
+        _dispatch_otp_mail(fields['to'], fields['message'], fields['title'], expires=expires, job_id=job_id.decode())
+
+    if expired:
+        _record_expired_task(MAIL_OUTBOX_METRICS_NAME, expired)
+
+    job_ids = [job_id for job_id, fields in jobs]
+    pipeline = connection.pipeline()
+    pipeline.xack(stream, MAIL_OUTBOX_GROUP, *job_ids)
+    pipeline.xdel(stream, *job_ids)
+    pipeline.execute()
+    return len(jobs)
+
+
+def _relay_pending_mails(consumer: str) -> int:
+    """
+    Relays batches until the outbox is empty, returning the number of jobs handled.
+    """
+    relayed = 0
+    while count := _relay_mail_outbox(consumer, settings.MAIL_OUTBOX_BATCH_SIZE):
+        relayed += count
+    return relayed
@@ -1,9 +1,52 @@
+import os
+import socket
+
 from celery import shared_task
+from celery.signals import worker_process_shutdown
 
+from mail.services.connection_pool import pooled_connection
 from mail.services.mail_manager import MailSenderManager
+from mail.services.outbox import _get_sent_mails, _mark_mails_sent
+from mail.services.queue import _drain_mail_queue
 
 
 @shared_task
 def send_mail_in_background(to_email: str, message: str, title: str, **kwargs):
     result = MailSenderManager().send(to_email, message, title, **kwargs)
     return result
+
+
+@shared_task
+def send_otp_mail_in_background(to_email: str, message: str, title: str, job_id: str = None):
+    """
+    Routed to the `mail_otp` queue and dispatched with the code's TTL as expiry, so a code that
+    expired while waiting is dropped instead of sent. An outbox job relayed twice is sent once.
+    """
+    if job_id in _get_sent_mails([job_id]):
+        return 0
+
+    result = MailSenderManager().send(to_email, message, title)
+    if result:
+        _mark_mails_sent([job_id])
+    return result
+
+
+@shared_task
+def send_queued_mails():
+    return _drain_mail_queue()
+
+
+@shared_task
+def relay_mail_outbox():
+    """
+    Scheduled by beat every `MAIL_OUTBOX_RELAY_INTERVAL` seconds as a safety net, so the outbox is
+    still relayed, with that delay, when no `relay_mail_outbox` command is running.
+    """
+    from mail.services.relay import _relay_pending_mails
+
+    return _relay_pending_mails(f'beat-{socket.gethostname()}-{os.getpid()}')
+
+
+@worker_process_shutdown.connect
+def close_pooled_connection(**kwargs):
+    pooled_connection.close()
@@ -0,0 +1,137 @@
+import smtplib
+from unittest import mock
+
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail import get_connection
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase
+from django_redis import get_redis_connection
+
+from config import settings, celery_app
+from config.celery_metrics import _get_queue_metrics
+from mail.services.connection_pool import pooled_connection
+from mail.services.dispatch import _dispatch_otp_mail
+from mail.services.mail_manager import MailSenderManager
+from mail.services.queue import _drain_mail_queue, MAIL_QUEUE_KEY, MAIL_DRAIN_SCHEDULED_KEY, MAIL_QUEUE_METRICS_NAME
+
+LOCMEM_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+
+@mock.patch.object(settings, 'EMAIL_BACKEND', LOCMEM_BACKEND)
+@mock.patch('mail.services.connection_pool.get_connection', wraps=get_connection)
+class PooledConnectionTests(TestCase):
+
+    def test_connection_is_reused(self, connect):
+        for index in range(3):
+            MailSenderManager().send('test@test.com', f'message {index}', 'title')
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(connect.call_count, 1)
+
+    @mock.patch.object(EmailBackend, 'send_messages', side_effect=[smtplib.SMTPServerDisconnected, 1])
+    def test_reconnects_when_disconnected(self, send_messages, connect):
+        sent = MailSenderManager().send('test@test.com', 'message', 'title')
+
+        self.assertEqual(sent, 1)
+        self.assertEqual(connect.call_count, 2)
+
+    @mock.patch.object(EmailBackend, 'send_messages', side_effect=[
+        smtplib.SMTPRecipientsRefused({'test@test.com': (550, b'No such user')}), 1,
+    ])
+    def test_refused_message_does_not_reconnect(self, send_messages, connect):
+        sent = MailSenderManager().send_many([
+            {'to_email': 'test@test.com', 'message': 'message', 'title': 'title'},
+            {'to_email': 'other@test.com', 'message': 'message', 'title': 'title'},
+        ])
+
+        self.assertEqual(sent, 1)
+        self.assertEqual(send_messages.call_count, 2)
+        self.assertEqual(connect.call_count, 1)
+
+    def test_connection_is_recycled(self, connect):
+        with mock.patch.object(settings, 'MAIL_CONNECTION_MAX_AGE', -1):
+            MailSenderManager().send('test@test.com', 'message', 'title')
+            MailSenderManager().send('test@test.com', 'message', 'title')
+
+        self.assertEqual(connect.call_count, 2)
+
+    def test_forked_process_opens_its_own_connection(self, connect):
+        MailSenderManager().send('test@test.com', 'message', 'title')
+        with mock.patch('mail.services.connection_pool.os.getpid', return_value=-1):
+            MailSenderManager().send('test@test.com', 'message', 'title')
+
+        self.assertEqual(connect.call_count, 2)
+
+    def test_direct_mode_connects_per_email(self, connect):
+        with mock.patch.object(settings, 'MAIL_DISPATCH_MODE', 'direct'):
+            MailSenderManager().send('test@test.com', 'message', 'title')
+            MailSenderManager().send('test@test.com', 'message', 'title')
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(connect.call_count, 0)
+
+    def tearDown(self) -> None:
+        pooled_connection.close()
+
+
+@mock.patch.object(settings, 'EMAIL_BACKEND', LOCMEM_BACKEND)
+@mock.patch.object(settings, 'MAIL_DISPATCH_MODE', 'batched')
+@mock.patch('mail.services.dispatch.send_queued_mails')
+class BatchedDispatchTests(TestCase):
+
+    def test_burst_schedules_one_drain(self, send_queued_mails):
+        for index in range(5):
+            _dispatch_otp_mail(f'test{index}@test.com', 'message', 'title', expires=60)
+
+        self.assertEqual(send_queued_mails.apply_async.call_count, 1)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_drain_sends_in_batches(self, send_queued_mails):
+        for index in range(5):
+            _dispatch_otp_mail(f'test{index}@test.com', f'message {index}', 'title', expires=60)
+
+        with mock.patch.object(settings, 'MAIL_BATCH_SIZE', 2), \
+                mock.patch.object(MailSenderManager, 'send_many', wraps=MailSenderManager().send_many) as send_many:
+            sent = _drain_mail_queue()
+
+        self.assertEqual(sent, 5)
+        self.assertEqual(send_many.call_count, 3)
+        self.assertEqual([message.to for message in mail.outbox], [[f'test{index}@test.com'] for index in range(5)])
+        self.assertIsNone(cache.get(MAIL_DRAIN_SCHEDULED_KEY))
+        self.assertEqual(get_redis_connection().llen(cache.make_key(MAIL_QUEUE_KEY)), 0)
+
+    def test_drain_is_scheduled_again_after_draining(self, send_queued_mails):
+        _dispatch_otp_mail('test@test.com', 'message', 'title', expires=60)
+        _drain_mail_queue()
+
+        _dispatch_otp_mail('test@test.com', 'message', 'title', expires=60)
+
+        self.assertEqual(send_queued_mails.apply_async.call_count, 2)
+
+    def test_expired_mails_are_dropped(self, send_queued_mails):
+        _dispatch_otp_mail('expired@test.com', 'message', 'title', expires=-1)
+        _dispatch_otp_mail('test@test.com', 'message', 'title', expires=60)
+
+        self.assertEqual(_drain_mail_queue(), 1)
+        self.assertEqual([message.to for message in mail.outbox], [['test@test.com']])
+        self.assertEqual(_get_queue_metrics(MAIL_QUEUE_METRICS_NAME)['expired'], 1)
+
+    def tearDown(self) -> None:
+        pooled_connection.close()
+        get_redis_connection().flushall()
+
+
+class MailRoutingTests(TestCase):
+
+    def test_routes(self):
+        router = celery_app.amqp.router
+        routes = {
+            'mail.tasks.send_otp_mail_in_background': 'mail_otp',
+            'mail.tasks.send_queued_mails': 'mail_otp',
+            'mail.tasks.relay_mail_outbox': 'mail_otp',
+            'mail.tasks.send_mail_in_background': 'celery',
+            'config.celery.debug_task': 'celery',
+        }
+        for task, queue in routes.items():
+            self.assertEqual(router.route({}, task)['queue'].name, queue)
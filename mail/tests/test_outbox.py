@@ -0,0 +1,120 @@
+from unittest import mock
+
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django_redis import get_redis_connection
+
+from config import settings
+from config.celery_metrics import _get_queue_metrics
+from mail.services.connection_pool import pooled_connection
+from mail.services.outbox import MAIL_OUTBOX_STREAM
+from mail.services.relay import _relay_mail_outbox, MAIL_OUTBOX_METRICS_NAME
+from mail.tasks import relay_mail_outbox, send_otp_mail_in_background
+from users.services.otp import _issue_code_with_mail
+from users.services.registration import _send_registration_code
+
+POSTFIX = settings.REGISTRATION_EMAIL_REDIS_KEY_POSTFIX
+
+
+def get_outbox_length() -> int:
+    return get_redis_connection().xlen(cache.make_key(MAIL_OUTBOX_STREAM))
+
+
+@mock.patch('mail.services.dispatch.send_otp_mail_in_background')
+class MailOutboxTests(TestCase):
+
+    def test_code_and_mail_are_stored_together(self, send_otp_mail):
+        code = _issue_code_with_mail('test@test.com', POSTFIX, title='Code', message='Your code: {code}')
+
+        self.assertEqual(cache.get(f'test@test.com{POSTFIX}'), code)
+        self.assertEqual(get_outbox_length(), 1)
+
+        self.assertIsNone(_issue_code_with_mail('test@test.com', POSTFIX, title='Code', message='{code}'))
+        self.assertEqual(cache.get(f'test@test.com{POSTFIX}'), code)
+        self.assertEqual(get_outbox_length(), 1)
+        send_otp_mail.apply_async.assert_not_called()
+
+    def test_relay(self, send_otp_mail):
+        code = _issue_code_with_mail('test@test.com', POSTFIX, title='Code', message='Your code: {code}')
+
+        self.assertEqual(_relay_mail_outbox('relay', count=10), 1)
+
+        kwargs = send_otp_mail.apply_async.call_args.kwargs
+        self.assertEqual(kwargs['kwargs']['to_email'], 'test@test.com')
+        self.assertEqual(kwargs['kwargs']['message'], f'Your code: {code}')
+        self.assertTrue(kwargs['kwargs']['job_id'])
+        self.assertAlmostEqual(kwargs['expires'], settings.CODE_EXPIRY_MINUTES * 60, delta=1)
+        self.assertEqual(get_outbox_length(), 0)
+        self.assertEqual(_relay_mail_outbox('relay', count=10), 0)
+
+    def test_relays_in_batches(self, send_otp_mail):
+        for index in range(5):
+            _send_registration_code(f'test{index}@test.com')
+
+        self.assertEqual(_relay_mail_outbox('relay', count=3), 3)
+        self.assertEqual(_relay_mail_outbox('relay', count=3), 2)
+        self.assertEqual(send_otp_mail.apply_async.call_count, 5)
+
+    def test_unpublished_jobs_are_claimed_again(self, send_otp_mail):
+        _send_registration_code('test@test.com')
+        send_otp_mail.apply_async.side_effect = ConnectionError
+
+        with self.assertRaises(ConnectionError):
+            _relay_mail_outbox('dead-relay', count=10)
+
+        send_otp_mail.apply_async.side_effect = None
+        self.assertEqual(_relay_mail_outbox('relay', count=10), 0)
+        with mock.patch.object(settings, 'MAIL_OUTBOX_CLAIM_IDLE_MS', 0):
+            self.assertEqual(_relay_mail_outbox('relay', count=10), 1)
+
+        first, second = send_otp_mail.apply_async.call_args_list
+        self.assertEqual(first.kwargs['kwargs']['job_id'], second.kwargs['kwargs']['job_id'])
+        self.assertEqual(get_outbox_length(), 0)
+
+    def test_expired_jobs_are_dropped(self, send_otp_mail):
+        _send_registration_code('test@test.com')
+
+        with mock.patch('mail.services.relay.time.time', return_value=10 ** 10):
+            self.assertEqual(_relay_mail_outbox('relay', count=10), 1)
+
+        send_otp_mail.apply_async.assert_not_called()
+        self.assertEqual(_get_queue_metrics(MAIL_OUTBOX_METRICS_NAME)['expired'], 1)
+
+    def test_relay_command(self, send_otp_mail):
+        for index in range(3):
+            _send_registration_code(f'test{index}@test.com')
+
+        with mock.patch.object(settings, 'MAIL_OUTBOX_BATCH_SIZE', 2):
+            call_command('relay_mail_outbox', '--once', stdout=mock.Mock())
+
+        self.assertEqual(send_otp_mail.apply_async.call_count, 3)
+
+    def test_relay_task(self, send_otp_mail):
+        for index in range(3):
+            _send_registration_code(f'test{index}@test.com')
+
+        with mock.patch.object(settings, 'MAIL_OUTBOX_BATCH_SIZE', 2):
+            self.assertEqual(relay_mail_outbox(), 3)
+
+        self.assertEqual(send_otp_mail.apply_async.call_count, 3)
+        self.assertEqual(get_outbox_length(), 0)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+
+
+@mock.patch.object(settings, 'EMAIL_BACKEND', 'django.core.mail.backends.locmem.EmailBackend')
+class OutboxJobDedupeTests(TestCase):
+
+    def test_job_is_sent_once(self):
+        send_otp_mail_in_background('test@test.com', 'message', 'title', job_id='1-0')
+        send_otp_mail_in_background('test@test.com', 'message', 'title', job_id='1-0')
+        send_otp_mail_in_background('test@test.com', 'message', 'title', job_id='2-0')
+
+        self.assertEqual(len(mail.outbox), 2)
+
+    def tearDown(self) -> None:
+        pooled_connection.close()
+        get_redis_connection().flushall()
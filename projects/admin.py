@@ -4,13 +4,13 @@ from .models import Category, Tag, Project, ProjectFile
 
 
 class CategoryAdmin(admin.ModelAdmin):
-    list_display = ('name', 'description')
+    list_display = ('name', 'description', 'projects_count', 'open_projects_count')
     search_fields = ('name',)
     list_filter = ('name',)
 
 
 class TagAdmin(admin.ModelAdmin):
-    list_display = ('name',)
+    list_display = ('name', 'projects_count', 'open_projects_count')
     search_fields = ('name',)
 
 
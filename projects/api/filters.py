@@ -1,8 +1,11 @@
 import django_filters
 from projects.models import Project, Tag
+from projects.services.search import _search_projects
 
 
 class ProjectFilter(django_filters.FilterSet):
+    q = django_filters.CharFilter(method='filter_search')
+
     category = django_filters.CharFilter(field_name='category__slug', lookup_expr='exact')
     tags = django_filters.ModelMultipleChoiceFilter(queryset=Tag.objects.all(), field_name='tags__name', to_field_name='name')
 
@@ -14,4 +17,7 @@ class ProjectFilter(django_filters.FilterSet):
 
     class Meta:
         model = Project
-        fields = ['category', 'tags', 'status', 'min_budget', 'max_budget', 'deadline_after', 'deadline_before']
+        fields = ['q', 'category', 'tags', 'status', 'min_budget', 'max_budget', 'deadline_after', 'deadline_before']
+
+    def filter_search(self, queryset, name, value):
+        return _search_projects(queryset, value)
@@ -0,0 +1,174 @@
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from config import settings
+from config.compression import get_accepted_encoding, compress, set_content_encoding
+from projects.services.cache import build_request_cache_key, get_namespace_version
+
+
+class PrecompressedResponseMixin:
+    """
+    Serves cacheable JSON responses compressed, storing the compressed bytes next to a cache key
+    so identical payloads are rendered and compressed once per encoding instead of per request.
+    Responses below `API_COMPRESSION_MIN_SIZE` are left to `CompressionMiddleware`.
+    """
+    cache_timeout = settings.API_RESPONSE_CACHE_TIMEOUT
+
+    def get_response_encoding(self, request):
+        if not isinstance(request.accepted_renderer, JSONRenderer):
+            return None
+        return get_accepted_encoding(request)
+
+    def get_compressed_response(self, request, response, key: str, version):
+        encoding = self.get_response_encoding(request)
+        if encoding is None or response.status_code != status.HTTP_200_OK:
+            return response
+
+        precompressed = self.get_precompressed_response(key, version, encoding, response)
+        if precompressed is not None:
+            return precompressed
+        return self.precompress_response(request, response, key, version, encoding)
+
+    def get_precompressed_response(self, key: str, version, encoding: str, response=None):
+        """
+        Returns the cached compressed payload with the headers of `response`, if any.
+        """
+        content = cache.get(f'{key}:{encoding}', version=version)
+        if content is None:
+            return None
+        return self._build_encoded_response(content, encoding, response)
+
+    def precompress_response(self, request, response, key: str, version, encoding):
+        """
+        Renders and compresses a successful response, caching the compressed bytes.
+        """
+        if encoding is None or response.status_code != status.HTTP_200_OK:
+            return response
+
+        response.accepted_renderer = request.accepted_renderer
+        response.accepted_media_type = request.accepted_media_type
+        response.renderer_context = self.get_renderer_context()
+        rendered = response.render().content
+        if len(rendered) < settings.API_COMPRESSION_MIN_SIZE:
+            return response
+
+        content = compress(rendered, encoding)
+        cache.set(f'{key}:{encoding}', content, timeout=self.cache_timeout, version=version)
+        return self._build_encoded_response(content, encoding, response)
+
+    def _build_encoded_response(self, content: bytes, encoding: str, response=None):
+        encoded = HttpResponse(content, content_type=self.request.accepted_renderer.media_type)
+        for header, value in (response.items() if response is not None else ()):
+            if header.lower() not in ('content-type', 'content-length'):
+                encoded[header] = value
+
+        set_content_encoding(encoded, encoding)
+        return encoded
+
+
+class CachedListRetrieveMixin(PrecompressedResponseMixin):
+    """
+    Read-through cache for `list` and `retrieve`.
+    Entries are stored under the version of `cache_namespace`, so bumping the namespace
+    version invalidates all of them without scanning keys. Compressed payloads are cached the same
+    way and served without loading the data at all.
+    """
+    cache_namespace = None
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_cached_response(self, handler, request, *args, **kwargs):
+        key = build_request_cache_key(self.cache_namespace, request)
+        version = get_namespace_version(self.cache_namespace)
+
+        encoding = self.get_response_encoding(request)
+        if encoding is not None:
+            response = self.get_precompressed_response(key, version, encoding)
+            if response is not None:
+                return response
+
+        data = cache.get(key, version=version)
+        if data is not None:
+            response = Response(data, status=status.HTTP_200_OK)
+        else:
+            response = handler(request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(key, response.data, timeout=self.cache_timeout, version=version)
+
+        return self.precompress_response(request, response, key, version, encoding)
+
+
+class RowListMixin:
+    """
+    Serves `list` from `.values()` rows rendered by `row_serializer_class`, skipping model instances
+    and the per-field dispatch of DRF serializers. The row serializer takes the serializer context,
+    exposes the `columns` it reads (`pk` included) and renders rows with `to_representation`.
+    The ordering columns of the pagination and the queryset annotations are selected as well.
+    """
+    row_serializer_class = None
+    row_ordering_columns = ()
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.row_serializer_class(context=self.get_serializer_context())
+        columns = dict.fromkeys([*serializer.columns, *self.row_ordering_columns, *queryset.query.annotations])
+        queryset = queryset.prefetch_related(None).values(*columns)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.to_representation(page))
+
+        return Response(serializer.to_representation(queryset))
+
+
+class SparseFieldsetsMixin:
+    """
+    Lets clients of the `sparse_actions` pick the serialized fields with `?fields=` / `?omit=` and
+    expand relations listed in `expandable_fields` with `?expand=`, all comma separated.
+    The choices reach the serializer through its context, and `get_queryset` can use them to load
+    only what is going to be rendered.
+    """
+    sparse_actions = ('list', 'retrieve')
+    expandable_fields = ()
+
+    def get_requested_fields(self) -> list:
+        available = self.get_serializer_class().Meta.fields
+        if self.action not in self.sparse_actions:
+            return list(available)
+
+        fields = self._get_field_names('fields', available) or available
+        omitted = self._get_field_names('omit', available)
+        return [name for name in available if name in fields and name not in omitted]
+
+    def get_expanded_fields(self) -> list:
+        if self.action not in self.sparse_actions:
+            return []
+        return self._get_field_names('expand', self.expandable_fields)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in self.sparse_actions:
+            context['fields'] = self.get_requested_fields()
+            context['expand'] = self.get_expanded_fields()
+        return context
+
+    def _get_field_names(self, query_param: str, available) -> list:
+        value = self.request.query_params.get(query_param)
+        if not value:
+            return []
+
+        names = [name.strip() for name in value.split(',') if name.strip()]
+        unknown = set(names) - set(available)
+        if unknown:
+            raise ValidationError({query_param: _('Unknown fields: %s') % ', '.join(sorted(unknown))})
+
+        return names
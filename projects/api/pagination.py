@@ -0,0 +1,198 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor pagination over a composite ``(<ordering field>, id)`` key.
+
+    DRF's ``CursorPagination`` keys on the first ordering field only and falls back to
+    an offset for duplicated values, so pages over low-cardinality columns such as
+    ``budget`` get slower the deeper you go. Here the cursor carries both the ordering
+    value and the primary key of the boundary row, so every page is an index range scan
+    bounded by that position no matter how deep it is. NULLs are treated as the largest
+    value, which matches PostgreSQL's default b-tree ordering and lets one ``(field, id)``
+    index serve both directions. A page crossing from the values to the NULLs of a
+    nullable field scans the two ranges one after the other.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    ordering = '-created_at'
+    ordering_fields = ('created_at',)
+    ordering_query_param = 'ordering'
+
+    def get_keyset(self, request, queryset):
+        """
+        Returns the ``(field name, descending)`` pair requested through the ordering query param,
+        falling back to the default ordering for unknown fields.
+        """
+        ordering = request.query_params.get(self.ordering_query_param, self.get_default_ordering(queryset))
+        field_name = ordering.lstrip('-')
+        if field_name not in self.ordering_fields or self._get_field(queryset, field_name) is None:
+            ordering = self.get_default_ordering(queryset)
+            field_name = ordering.lstrip('-')
+
+        return field_name, ordering.startswith('-')
+
+    def get_default_ordering(self, queryset):
+        return self.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.field_name, self.descending = self.get_keyset(request, queryset)
+        self.field = self._get_field(queryset, self.field_name)
+
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor.reverse if self.cursor else False
+        descending = self.descending != reverse
+
+        queryset = queryset.order_by(*self._get_order_by(descending))
+        if self.cursor is None:
+            results = list(queryset[:self.page_size + 1])
+        else:
+            results = []
+            for seek_filter in self._get_seek_filters(self.cursor.position, descending):
+                results += queryset.filter(seek_filter)[:self.page_size + 1 - len(results)]
+                if len(results) > self.page_size:
+                    break
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        cursor = Cursor(offset=0, reverse=False, position=self._get_position(self.page[-1]))
+        return self.encode_cursor(cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+
+        cursor = Cursor(offset=0, reverse=True, position=self._get_position(self.page[0]))
+        return self.encode_cursor(cursor)
+
+    def encode_cursor(self, cursor):
+        tokens = {'p': cursor.position}
+        if cursor.reverse:
+            tokens['r'] = 1
+
+        encoded = urlsafe_b64encode(json.dumps(tokens, separators=(',', ':')).encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            tokens = json.loads(urlsafe_b64decode(encoded.encode('ascii')))
+            value, pk = tokens['p']
+            position = (None if value is None else self.field.to_python(value), int(pk))
+            reverse = bool(tokens.get('r'))
+        except (TypeError, ValueError, KeyError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return Cursor(offset=0, reverse=reverse, position=position)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append({
+            'name': self.ordering_query_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Which field to use when ordering the results.',
+            'schema': {
+                'type': 'string',
+                'enum': [prefix + field for field in self.ordering_fields for prefix in ('', '-')],
+            },
+        })
+        return parameters
+
+    def _get_field(self, queryset, field_name):
+        """
+        Returns the model field or the annotation output field named ``field_name``, if any.
+        """
+        if field_name in queryset.query.annotations:
+            return queryset.query.annotations[field_name].output_field
+
+        try:
+            return queryset.model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return None
+
+    def _get_position(self, instance):
+        """
+        Returns the cursor position of a model instance, or of a `.values()` row holding `pk`
+        and the ordering field.
+        """
+        if isinstance(instance, dict):
+            value, pk = instance[self.field_name], instance['pk']
+        else:
+            value, pk = getattr(instance, self.field_name), instance.pk
+
+        if value is not None:
+            value = str(value)
+
+        return [value, pk]
+
+    def _get_order_by(self, descending):
+        if descending:
+            return F(self.field_name).desc(nulls_first=True), F('pk').desc()
+        return F(self.field_name).asc(nulls_last=True), F('pk').asc()
+
+    def _get_seek_filters(self, position, descending):
+        """
+        Returns the filters selecting the rows strictly after ``position`` in the given direction,
+        in the order their rows come in. Each one bounds the ``(field, id)`` index by the position,
+        so it is a range scan rather than a filter over every row before it, which is why the NULLs
+        of a nullable field are a filter of their own instead of an ``OR`` with the values.
+        """
+        value, pk = position
+        field_name = self.field_name
+        is_null = Q(**{f'{field_name}__isnull': True})
+
+        if descending:
+            if value is None:
+                return [is_null & Q(pk__lt=pk), Q(**{f'{field_name}__isnull': False})]
+            return [Q(**{f'{field_name}__lte': value}) & (Q(**{f'{field_name}__lt': value}) | Q(pk__lt=pk))]
+
+        if value is None:
+            return [is_null & Q(pk__gt=pk)]
+        seek_filters = [Q(**{f'{field_name}__gte': value}) & (Q(**{f'{field_name}__gt': value}) | Q(pk__gt=pk))]
+        if getattr(self.field, 'null', False):
+            seek_filters.append(is_null)
+        return seek_filters
+
+
+class ProjectCursorPagination(KeysetCursorPagination):
+    ordering = '-created_at'
+    ordering_fields = ('created_at', 'budget', 'deadline', 'search_rank')
+
+    def get_default_ordering(self, queryset):
+        if 'search_rank' in queryset.query.annotations:
+            return '-search_rank'
+        return self.ordering
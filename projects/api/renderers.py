@@ -0,0 +1,73 @@
+import csv
+from io import StringIO
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+
+class ExportRenderer(BaseRenderer):
+    """
+    Base of the export formats. `stream` turns chunks of serialized rows into chunks of bytes,
+    `render` renders a whole list of rows at once.
+    """
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return b''.join(self.stream([data]))
+
+    def stream(self, chunks, fields=None):
+        raise NotImplementedError('ExportRenderer.stream() must be implemented.')
+
+
+class NDJSONRenderer(ExportRenderer):
+    """
+    One compact JSON document per row and per line.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def stream(self, chunks, fields=None):
+        renderer = JSONRenderer()
+        for rows in chunks:
+            yield b''.join(renderer.render(row) + b'\n' for row in rows)
+
+
+class CSVRenderer(ExportRenderer):
+    """
+    A header line followed by a line per row. Lists such as tags are joined with `|`,
+    `None` becomes an empty cell.
+    """
+    media_type = 'text/csv'
+    format = 'csv'
+    list_separator = '|'
+
+    def stream(self, chunks, fields=None):
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        if fields:
+            writer.writerow(fields)
+
+        for rows in chunks:
+            if fields is None and rows:
+                fields = list(rows[0])
+                writer.writerow(fields)
+
+            for row in rows:
+                writer.writerow([self._to_cell(row[name]) for name in fields])
+
+            yield self._flush(buffer)
+
+        if buffer.tell():
+            yield self._flush(buffer)
+
+    def _flush(self, buffer) -> bytes:
+        content = buffer.getvalue().encode(self.charset)
+        buffer.seek(0)
+        buffer.truncate()
+        return content
+
+    def _to_cell(self, value):
+        if value is None:
+            return ''
+        if isinstance(value, list):
+            return self.list_separator.join(str(item) for item in value)
+        return value
@@ -1,5 +1,16 @@
-from rest_framework import serializers
+from collections import defaultdict
+from operator import itemgetter
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import ISO_8601, serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+
+from config import settings
 from projects.models import Project, Category, Tag, ProjectFile
+from projects.services.bulk import _bulk_create_projects
 
 
 class CategoryProductSerializer(serializers.ModelSerializer):
@@ -8,16 +19,31 @@ class CategoryProductSerializer(serializers.ModelSerializer):
         fields = ['name', 'description', 'slug']
 
 
+class CategorySuggestionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Category
+        fields = ['name', 'slug', 'projects_count', 'open_projects_count']
+
+
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
-        fields = ['name', 'description', 'image', 'slug']
+        fields = ['name', 'description', 'image', 'slug', 'projects_count', 'open_projects_count']
+
+
+class CategoryListQuerySerializer(serializers.Serializer):
+    limit = serializers.IntegerField(min_value=1, required=False)
+
+
+class SuggestQuerySerializer(serializers.Serializer):
+    prefix = serializers.CharField(min_length=1, max_length=50, required=True)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
 
 
 class TagSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tag
-        fields = ['id', 'name']
+        fields = ['id', 'name', 'projects_count', 'open_projects_count']
 
 
 class ProjectFileSerializer(serializers.ModelSerializer):
@@ -50,6 +76,17 @@ class ProjectSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at', 'slug'
         ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        fields = self.context.get('fields')
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+        if 'category' in self.context.get('expand', ()) and 'category' in self.fields:
+            self.fields['category'] = CategoryProductSerializer(read_only=True)
+
     def create(self, validated_data):
         tags = validated_data.pop('tags', [])
         project = Project.objects.create(**validated_data)
@@ -72,3 +109,201 @@ class ProjectSerializer(serializers.ModelSerializer):
 
         instance.save()
         return instance
+
+
+class ProjectRowSerializer:
+    """
+    Read-only fast path of ProjectSerializer for listings, rendering `.values()` rows instead of
+    model instances. The fields are taken from a ProjectSerializer built with the same context and
+    turned into one accessor per field up front, so the output is the same while a row costs a
+    single dict build. Tags and files of all the rows are loaded with one query each.
+    """
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        self.fields = ProjectSerializer(context=self.context).fields
+        self.columns = ['pk']
+        self._tags = self._files = {}
+        self._accessors = [(name, self._get_accessor(name, field)) for name, field in self.fields.items()]
+
+    def to_representation(self, rows) -> list:
+        rows = list(rows)
+        project_ids = [row['pk'] for row in rows]
+        if 'tags' in self.fields:
+            self._tags = self._load_tags(project_ids)
+        if 'files' in self.fields:
+            self._files = self._load_files(project_ids)
+
+        accessors = self._accessors
+        return [{name: accessor(row) for name, accessor in accessors} for row in rows]
+
+    def _get_accessor(self, name, field):
+        if name == 'tags':
+            return lambda row: self._tags.get(row['pk'], [])
+        if name == 'files':
+            return lambda row: self._files.get(row['pk'], [])
+        if name == 'owner':
+            return self._get_column_accessor('owner_id', field)
+        if name == 'category' and isinstance(field, serializers.Serializer):
+            return self._get_nested_accessor('category', field)
+        if name == 'category':
+            return self._get_column_accessor(f'category__{field.slug_field}', field)
+        return self._get_column_accessor(name, field)
+
+    def _get_column_accessor(self, column, field):
+        self.columns.append(column)
+        if isinstance(field, serializers.RelatedField) or type(field) in (serializers.CharField, serializers.SlugField):
+            # Related columns already hold the rendered key, strings come back as they are rendered.
+            return itemgetter(column)
+
+        to_representation = self._get_converter(field)
+
+        def accessor(row):
+            value = row[column]
+            return None if value is None else to_representation(value)
+
+        return accessor
+
+    @staticmethod
+    def _get_converter(field):
+        """
+        Returns `field.to_representation`, except for ISO 8601 datetime fields whose timezone is
+        resolved once instead of per value (a context-local lookup in DRF).
+        """
+        if not isinstance(field, serializers.DateTimeField):
+            return field.to_representation
+
+        output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+        field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+        if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+            return field.to_representation
+
+        def to_representation(value):
+            if not timezone.is_aware(value):
+                return field.to_representation(value)
+
+            value = value.astimezone(field_timezone).isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+        return to_representation
+
+    def _get_nested_accessor(self, name, serializer):
+        accessors = [
+            (field_name, self._get_column_accessor(f'{name}__{field_name}', field))
+            for field_name, field in serializer.fields.items()
+        ]
+        pk_column = f'{name}__pk'
+        self.columns.append(pk_column)
+
+        def accessor(row):
+            if row[pk_column] is None:
+                return None
+            return {field_name: field_accessor(row) for field_name, field_accessor in accessors}
+
+        return accessor
+
+    def _load_tags(self, project_ids) -> dict:
+        tags = defaultdict(list)
+        rows = (
+            Project.tags.through.objects
+            .filter(project_id__in=project_ids)
+            .order_by('tag_id')
+            .values_list('project_id', 'tag__name')
+        )
+        for project_id, name in rows:
+            tags[project_id].append(name)
+        return tags
+
+    def _load_files(self, project_ids) -> dict:
+        fields = self.fields['files'].child.fields
+        file_field, uploaded_at_field = fields['file'], self._get_converter(fields['uploaded_at'])
+        model_field = ProjectFile._meta.get_field('file')
+
+        files = defaultdict(list)
+        rows = (
+            ProjectFile.objects
+            .filter(project_id__in=project_ids)
+            .order_by('id')
+            .values_list('project_id', 'file', 'uploaded_at')
+        )
+        for project_id, name, uploaded_at in rows:
+            files[project_id].append({
+                'file': file_field.to_representation(model_field.attr_class(None, model_field, name)),
+                'uploaded_at': None if uploaded_at is None else uploaded_at_field(uploaded_at),
+            })
+        return files
+
+
+class ProjectBulkListSerializer(serializers.ListSerializer):
+    """
+    Resolves the category slugs, tag names and owners of all the projects with one query each,
+    reporting unknown references per item in the same shape as field errors.
+    """
+
+    def run_child_validation(self, data):
+        try:
+            return super().run_child_validation(data)
+        except ValidationError as exc:
+            return exc
+
+    def to_internal_value(self, data):
+        results = super().to_internal_value(data)
+        items = [item for item in results if not isinstance(item, ValidationError)]
+
+        category_slugs = {item['category'] for item in items}
+        categories = {category.slug: category for category in Category.objects.filter(slug__in=category_slugs)}
+
+        tag_names = {name for item in items for name in item['tags']}
+        tags = {tag.name: tag for tag in Tag.objects.filter(name__in=tag_names).order_by('-id')}
+
+        owner_ids = {item['owner'] for item in items}
+        owners = set(get_user_model().objects.filter(pk__in=owner_ids).values_list('pk', flat=True))
+
+        errors = []
+        for item in results:
+            if isinstance(item, ValidationError):
+                errors.append(item.detail)
+                continue
+
+            item_errors = {}
+            if item['category'] not in categories:
+                item_errors['category'] = [_('Object with slug=%s does not exist.') % item['category']]
+
+            missing_tags = [name for name in item['tags'] if name not in tags]
+            if missing_tags:
+                item_errors['tags'] = [_('Object with name=%s does not exist.') % name for name in missing_tags]
+
+            if item['owner'] not in owners:
+                item_errors['owner'] = [_('Invalid pk "%s" - object does not exist.') % item['owner']]
+
+            errors.append(item_errors)
+
+        if any(errors):
+            raise ValidationError(errors)
+
+        for item in items:
+            item['category'] = categories[item['category']]
+            item['tags'] = [tags[name] for name in item['tags']]
+            item['owner_id'] = item.pop('owner')
+
+        return items
+
+    def create(self, validated_data):
+        return _bulk_create_projects(validated_data)
+
+
+class ProjectBulkCreateSerializer(serializers.ModelSerializer):
+    category = serializers.SlugField(max_length=50)
+    tags = serializers.ListField(child=serializers.CharField(max_length=50), required=False, default=list)
+    owner = serializers.IntegerField()
+
+    class Meta:
+        model = Project
+        fields = ['title', 'description', 'category', 'tags', 'owner', 'budget', 'deadline', 'status']
+        list_serializer_class = ProjectBulkListSerializer
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        kwargs.setdefault('allow_empty', False)
+        kwargs.setdefault('max_length', settings.PROJECT_BULK_CREATE_MAX_SIZE)
+        return super().many_init(*args, **kwargs)
@@ -1,7 +1,7 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from projects.api.views import ProjectViewSet, CategoryListAPIView
+from projects.api.views import ProjectViewSet, CategoryListAPIView, TagSuggestAPIView, CategorySuggestAPIView
 
 app_name = 'projects'
 
@@ -10,6 +10,8 @@ router.register('', ProjectViewSet, basename='project')
 
 urlpatterns = [
     path('categories/', CategoryListAPIView.as_view(), name='categories'),
+    path('categories/suggest/', CategorySuggestAPIView.as_view(), name='categories_suggest'),
+    path('tags/suggest/', TagSuggestAPIView.as_view(), name='tags_suggest'),
 ]
 
 urlpatterns += router.urls
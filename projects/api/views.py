@@ -1,26 +1,124 @@
-from drf_spectacular.utils import extend_schema, OpenApiParameter
-from rest_framework import viewsets, filters
+from itertools import islice
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiResponse
+from rest_framework import viewsets, filters, status
+from rest_framework.decorators import action
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from projects.models import Project, Category
+from config import settings
+from projects.models import Project, Category, Tag, ProjectFile
+from projects.services.cache import (PROJECTS_CACHE_NAMESPACE, CATEGORIES_CACHE_NAMESPACE, build_request_cache_key,
+                                     get_namespace_version)
+from projects.services.categories import _get_category_list
+from projects.services.facets import FACETS, _parse_facets, _get_project_facets
+from projects.services.suggestions import _suggest_tags, _suggest_categories
 from .filters import ProjectFilter
-from .serializers import ProjectSerializer, CategorySerializer
+from .mixins import CachedListRetrieveMixin, PrecompressedResponseMixin, RowListMixin, SparseFieldsetsMixin
+from .pagination import ProjectCursorPagination
+from .renderers import NDJSONRenderer, CSVRenderer
+from .serializers import (ProjectSerializer, CategorySerializer, CategoryListQuerySerializer,
+                          SuggestQuerySerializer, TagSerializer, CategorySuggestionSerializer,
+                          ProjectBulkCreateSerializer, ProjectRowSerializer)
 from rest_framework.permissions import IsAuthenticated
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+SPARSE_FIELDSETS_PARAMETERS = [
+    OpenApiParameter(name='fields', description='Comma separated fields to return', required=False, type=str),
+    OpenApiParameter(name='omit', description='Comma separated fields to leave out', required=False, type=str),
+    OpenApiParameter(name='expand', description='Comma separated relations to nest, any of category',
+                     required=False, type=str),
+]
+
+
+@extend_schema_view(
+    list=extend_schema(parameters=[
+        OpenApiParameter(
+            name='facets',
+            description=f'Comma separated facets to count over the filtered projects, any of {", ".join(FACETS)}',
+            required=False,
+            type=str,
+        ),
+        *SPARSE_FIELDSETS_PARAMETERS,
+    ]),
+    retrieve=extend_schema(parameters=SPARSE_FIELDSETS_PARAMETERS),
+)
+class ProjectViewSet(CachedListRetrieveMixin, RowListMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
+    row_serializer_class = ProjectRowSerializer
 
     filter_backends = [DjangoFilterBackend]
     filterset_class = ProjectFilter
+    pagination_class = ProjectCursorPagination
 
     lookup_field = 'slug'
 
+    cache_namespace = PROJECTS_CACHE_NAMESPACE
+
+    expandable_fields = ('category',)
+    keyset_columns = ('created_at', 'budget', 'deadline')
+    row_ordering_columns = keyset_columns
+
+    def get_queryset(self):
+        """
+        Loads everything ProjectSerializer touches up front, so serializing a page costs
+        the same number of queries no matter how many projects it holds.
+        `owner` is rendered from `owner_id` and needs no join.
+        On reads only the columns, joins and prefetches of the requested fields are loaded.
+        `list` renders `.values()` rows through ProjectRowSerializer, which reads the same
+        columns and orders tags and files the same way.
+        """
+        fields = self.get_requested_fields()
+        queryset = self.queryset
+
+        if self.action in self.sparse_actions:
+            queryset = queryset.only(*self._get_projection(fields))
+        else:
+            queryset = queryset.defer('search_vector')
+
+        if 'category' in fields:
+            queryset = queryset.select_related('category')
+        if 'tags' in fields:
+            queryset = queryset.prefetch_related(Prefetch('tags', queryset=Tag.objects.only('id', 'name').order_by('id')))
+        if 'files' in fields:
+            queryset = queryset.prefetch_related(
+                Prefetch('files', queryset=ProjectFile.objects.only('id', 'project_id', 'file', 'uploaded_at').order_by('id')),
+            )
+
+        return queryset
+
+    def _get_projection(self, fields) -> list:
+        columns = ['id', *self.keyset_columns]
+        for name in fields:
+            if name == 'category':
+                columns.append('category__slug')
+                if 'category' in self.get_expanded_fields():
+                    columns += ['category__name', 'category__description']
+            elif name not in ('tags', 'files'):
+                columns.append(name)
+
+        return columns
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+
+        facets = self.request.query_params.get('facets')
+        if facets:
+            queryset = self.filter_queryset(self.get_queryset())
+            response.data['facets'] = _get_project_facets(queryset, _parse_facets(facets))
+
+        return response
+
     def get_permissions(self):
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
+        if self.action in ['create', 'bulk_create', 'update', 'partial_update', 'destroy']:
             return [IsAuthenticated()]
         return []
 
@@ -30,8 +128,62 @@ class ProjectViewSet(viewsets.ModelViewSet):
     def update(self, request, *args, **kwargs):
         return super().update(request, *args, **kwargs)
 
+    @extend_schema(request=ProjectBulkCreateSerializer(many=True), responses={201: {}})
+    @action(detail=False, methods=['post'], url_path='bulk', url_name='bulk_create')
+    def bulk_create(self, request, *args, **kwargs):
+        serializer = ProjectBulkCreateSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        projects = serializer.save()
+        return Response(data={'slugs': [project.slug for project in projects]}, status=status.HTTP_201_CREATED)
 
-class CategoryListAPIView(APIView):
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name='format', description='Export format', required=False, type=str,
+                             enum=[NDJSONRenderer.format, CSVRenderer.format]),
+        ],
+        responses={
+            (200, NDJSONRenderer.media_type): OpenApiResponse(OpenApiTypes.BINARY),
+            (200, CSVRenderer.media_type): OpenApiResponse(OpenApiTypes.BINARY),
+        },
+    )
+    @action(detail=False, methods=['get'], url_path='export', url_name='export',
+            renderer_classes=[NDJSONRenderer, CSVRenderer], pagination_class=None)
+    def export(self, request, *args, **kwargs):
+        """
+        Streams every filtered project, without files. Rows are read through a server-side cursor
+        and serialized in chunks of `PROJECT_EXPORT_CHUNK_SIZE` with one tags query each, so memory
+        stays flat whatever the number of projects.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        fields = [name for name in self.get_requested_fields() if name != 'files']
+        serializer = ProjectRowSerializer(context={**self.get_serializer_context(), 'fields': fields})
+
+        chunk_size = settings.PROJECT_EXPORT_CHUNK_SIZE
+        rows = (
+            queryset
+            .prefetch_related(None)
+            .order_by('pk')
+            .values(*serializer.columns)
+            .iterator(chunk_size=chunk_size)
+        )
+        chunks = (serializer.to_representation(chunk) for chunk in iter(lambda: list(islice(rows, chunk_size)), []))
+
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            renderer.stream(chunks, fields),
+            content_type=f'{renderer.media_type}; charset={renderer.charset}',
+        )
+        response['Content-Disposition'] = f'attachment; filename="projects.{renderer.format}"'
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if self.action == 'export' and isinstance(response, Response):
+            # Export errors are reported in JSON whatever the requested format.
+            request.accepted_renderer, request.accepted_media_type = JSONRenderer(), JSONRenderer.media_type
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class CategoryListAPIView(PrecompressedResponseMixin, APIView):
 
     @extend_schema(
         parameters=[
@@ -40,13 +192,40 @@ class CategoryListAPIView(APIView):
         responses=CategorySerializer(many=True)
     )
     def get(self, request, *args, **kwargs):
-        limit = request.query_params.get('limit', None)
-        if limit:
-            limit = int(limit)
-            categories = Category.objects.all()[:limit]
-        else:
-            categories = Category.objects.all()
+        query_serializer = CategoryListQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        limit = query_serializer.validated_data.get('limit')
+
+        categories = _get_category_list(CategorySerializer)
+        etag = categories.get_etag(limit)
+
+        response = get_conditional_response(request, etag=etag, last_modified=categories.last_modified)
+        if response is None:
+            response = Response(categories.data[:limit])
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(categories.last_modified)
+        patch_cache_control(response, public=True, max_age=settings.CATEGORIES_CACHE_CONTROL_MAX_AGE)
 
-        serializer = CategorySerializer(categories, many=True)
+        key = build_request_cache_key(CATEGORIES_CACHE_NAMESPACE, request)
+        return self.get_compressed_response(request, response, key, get_namespace_version(CATEGORIES_CACHE_NAMESPACE))
+
+
+class TagSuggestAPIView(APIView):
+
+    @extend_schema(parameters=[SuggestQuerySerializer], responses=TagSerializer(many=True))
+    def get(self, request, *args, **kwargs):
+        query_serializer = SuggestQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        return Response(_suggest_tags(**query_serializer.validated_data))
+
+
+class CategorySuggestAPIView(APIView):
+
+    @extend_schema(parameters=[SuggestQuerySerializer], responses=CategorySuggestionSerializer(many=True))
+    def get(self, request, *args, **kwargs):
+        query_serializer = SuggestQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
 
-        return Response(serializer.data)
+        return Response(_suggest_categories(**query_serializer.validated_data))
@@ -0,0 +1,108 @@
+import time
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Prefetch
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+
+from projects.api.serializers import ProjectSerializer, ProjectRowSerializer
+from projects.models import Project, Category, Tag, ProjectFile
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares listing projects through ProjectSerializer and ProjectRowSerializer. '
+        'The benchmark rows are created in a transaction which is rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+        parser.add_argument('--repeat', type=int, default=3, help='Runs per serializer, the best one is kept')
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get('/api/projects/')
+        self.stdout.write(f'{"rows":>8} {"serializer":>12} {"rows path":>12} {"speedup":>8}')
+
+        for size in options['rows']:
+            with transaction.atomic():
+                # Only the benchmark rows are listed, whatever the database already holds
+                projects = Project.objects.filter(owner=self._create_rows(size))
+                slow, slow_data = self._measure(self._serialize_instances, projects, request, options['repeat'])
+                fast, fast_data = self._measure(self._serialize_rows, projects, request, options['repeat'])
+                transaction.set_rollback(True)
+
+            if JSONRenderer().render(slow_data) != JSONRenderer().render(fast_data):
+                self.stderr.write(self.style.ERROR(f'Outputs differ at {size} rows'))
+
+            self.stdout.write(f'{size:>8} {slow:>11.3f}s {fast:>11.3f}s {slow / fast:>7.1f}x')
+
+    def _measure(self, serialize, projects, request, repeat):
+        timings, data = [], None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            data = serialize(projects, request)
+            timings.append(time.perf_counter() - start)
+
+        return min(timings), data
+
+    def _serialize_instances(self, projects, request):
+        queryset = (
+            projects
+            .defer('search_vector')
+            .order_by('id')
+            .select_related('category')
+            .prefetch_related(
+                Prefetch('tags', queryset=Tag.objects.only('id', 'name').order_by('id')),
+                Prefetch('files', queryset=ProjectFile.objects.only('id', 'project_id', 'file', 'uploaded_at')
+                         .order_by('id')),
+            )
+        )
+        return ProjectSerializer(queryset, many=True, context={'request': request}).data
+
+    def _serialize_rows(self, projects, request):
+        serializer = ProjectRowSerializer(context={'request': request})
+        return serializer.to_representation(projects.order_by('id').values(*serializer.columns))
+
+    def _create_rows(self, size):
+        """
+        Creates `size` projects with three tags and a file each, bypassing signals as bulk inserts do,
+        returning the user owning them.
+        """
+        owner = get_user_model().objects.create(username='benchmark', email='benchmark@example.com')
+        categories = Category.objects.bulk_create(
+            Category(name=f'Category {index}', slug=f'benchmark-category-{index}') for index in range(10)
+        )
+        tags = Tag.objects.bulk_create(Tag(name=f'tag-{index}') for index in range(50))
+
+        projects = Project.objects.bulk_create(
+            (
+                Project(
+                    title=f'Project {index}',
+                    description='Benchmark project ' * 20,
+                    category=categories[index % len(categories)] if index % 7 else None,
+                    owner=owner,
+                    budget=Decimal(index % 5000) + Decimal('0.5') if index % 3 else None,
+                    status=Project.status_choices[index % len(Project.status_choices)][0],
+                    slug=f'benchmark-project-{index}',
+                )
+                for index in range(size)
+            ),
+            batch_size=1000,
+        )
+
+        Project.tags.through.objects.bulk_create(
+            (
+                Project.tags.through(project_id=project.pk, tag_id=tags[(index + offset) % len(tags)].pk)
+                for index, project in enumerate(projects)
+                for offset in range(3)
+            ),
+            batch_size=5000,
+        )
+        ProjectFile.objects.bulk_create(
+            (ProjectFile(project=project, file=f'project_files/{project.slug}.pdf') for project in projects),
+            batch_size=5000,
+        )
+        return owner
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from projects.services.counters import _recompute_project_counters
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the project counters of every category and tag from scratch'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            _recompute_project_counters()
+
+        self.stdout.write(self.style.SUCCESS('Project counters recomputed'))
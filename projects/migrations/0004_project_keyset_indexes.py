@@ -0,0 +1,25 @@
+# Generated by Django 4.2 on 2026-10-18 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_remove_tag_slug'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['created_at', 'id'], name='projects_pr_created_3ed563_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['budget', 'id'], name='projects_pr_budget_d4c2f2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['deadline', 'id'], name='projects_pr_deadlin_d991fc_idx'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2 on 2026-10-18 15:23
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery, TextField, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_search_vector(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    Tag = apps.get_model('projects', 'Tag')
+    Category = apps.get_model('projects', 'Category')
+
+    config = getattr(settings, 'PROJECTS_SEARCH_CONFIG', 'english')
+    category_name = Category.objects.filter(pk=OuterRef('category_id')).values('name')
+    tag_names = (
+        Tag.objects
+        .filter(projects=OuterRef('pk'))
+        .values('projects')
+        .annotate(names=StringAgg('name', delimiter=' '))
+        .values('names')
+    )
+    Project.objects.update(search_vector=(
+            SearchVector('title', weight='A', config=config)
+            + SearchVector(Coalesce(Subquery(category_name), Value(''), output_field=TextField()), weight='B', config=config)
+            + SearchVector(Coalesce(Subquery(tag_names), Value(''), output_field=TextField()), weight='B', config=config)
+            + SearchVector('description', weight='C', config=config)
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_project_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='projects_pr_search__1d35f9_gin'),
+        ),
+        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2 on 2026-10-18 15:26
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, group_by):
+    return Coalesce(Subquery(queryset.values(group_by).annotate(count=Count('pk')).values('count')), 0)
+
+
+def populate_counters(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    Tag = apps.get_model('projects', 'Tag')
+    Category = apps.get_model('projects', 'Category')
+
+    projects = Project.objects.filter(category=OuterRef('pk'))
+    Category.objects.update(
+        projects_count=_count(projects, 'category'),
+        open_projects_count=_count(projects.filter(status='open'), 'category'),
+    )
+
+    project_tags = Project.tags.through.objects.filter(tag=OuterRef('pk'))
+    Tag.objects.update(
+        projects_count=_count(project_tags, 'tag'),
+        open_projects_count=_count(project_tags.filter(project__status='open'), 'tag'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_project_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='open_projects_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='projects_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='open_projects_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='projects_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,9 @@
 from django.contrib.auth import get_user_model
-from django.db import models
-from django.utils.text import slugify
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+
+from projects.services.slugs import _allocate_slug
 
 
 class Category(models.Model):
@@ -8,10 +11,14 @@ class Category(models.Model):
     description = models.TextField(blank=True)
     image = models.ImageField(upload_to='category_images/', blank=True, null=True)
     slug = models.SlugField(unique=True, blank=True)
+    projects_count = models.IntegerField(default=0, editable=False)
+    open_projects_count = models.IntegerField(default=0, editable=False)
 
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.name)
+            with transaction.atomic():
+                self.slug = _allocate_slug(Category, self.name)
+                return super().save(*args, **kwargs)
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -20,6 +27,8 @@ class Category(models.Model):
 
 class Tag(models.Model):
     name = models.CharField(max_length=50)
+    projects_count = models.IntegerField(default=0, editable=False)
+    open_projects_count = models.IntegerField(default=0, editable=False)
 
     def __str__(self):
         return self.name
@@ -44,10 +53,21 @@ class Project(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     status = models.CharField(max_length=20, choices=status_choices, default='open')
     slug = models.SlugField(unique=True, blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['budget', 'id']),
+            models.Index(fields=['deadline', 'id']),
+            GinIndex(fields=['search_vector']),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.title)
+            with transaction.atomic():
+                self.slug = _allocate_slug(Project, self.title)
+                return super().save(*args, **kwargs)
         super().save(*args, **kwargs)
 
     def __str__(self):
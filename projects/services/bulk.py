@@ -0,0 +1,60 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from config import settings
+from projects.models import Project, Tag, Category
+from projects.services.cache import PROJECTS_CACHE_NAMESPACE, bump_namespace_version_on_commit
+from projects.services.counters import OPEN_STATUS, _apply_counter_deltas
+from projects.services.search import _update_search_vectors
+from projects.services.slugs import _allocate_slugs
+
+
+def _bulk_create_projects(items: list) -> list:
+    """
+    Creates the validated projects with batched inserts for the projects and their tags, in one transaction.
+    `bulk_create` sends no signals, so the search vectors, counters and cache versions the signals
+    maintain for single saves are updated here in bulk.
+    :param items: validated project fields, with `category` and `tags` already resolved to instances
+    :return: created projects
+    """
+    batch_size = settings.PROJECT_BULK_CREATE_BATCH_SIZE
+    through_model = Project.tags.through
+
+    with transaction.atomic():
+        slugs = _allocate_slugs(Project, [item['title'] for item in items])
+        projects = Project.objects.bulk_create(
+            [
+                Project(slug=slug, **{name: value for name, value in item.items() if name != 'tags'})
+                for slug, item in zip(slugs, items)
+            ],
+            batch_size=batch_size,
+        )
+
+        project_tags = [
+            through_model(project_id=project.pk, tag_id=tag.pk)
+            for project, item in zip(projects, items)
+            for tag in {tag.pk: tag for tag in item['tags']}.values()
+        ]
+        through_model.objects.bulk_create(project_tags, batch_size=batch_size)
+
+        project_ids = [project.pk for project in projects]
+        for start in range(0, len(project_ids), batch_size):
+            _update_search_vectors(Project.objects.filter(pk__in=project_ids[start:start + batch_size]))
+
+        category_deltas = defaultdict(lambda: [0, 0])
+        tag_deltas = defaultdict(lambda: [0, 0])
+        open_projects = {project.pk for project in projects if project.status == OPEN_STATUS}
+        for project in projects:
+            if project.category_id is not None:
+                category_deltas[project.category_id][0] += 1
+                category_deltas[project.category_id][1] += project.pk in open_projects
+        for project_tag in project_tags:
+            tag_deltas[project_tag.tag_id][0] += 1
+            tag_deltas[project_tag.tag_id][1] += project_tag.project_id in open_projects
+
+        _apply_counter_deltas(Category, category_deltas)
+        _apply_counter_deltas(Tag, tag_deltas)
+        bump_namespace_version_on_commit(PROJECTS_CACHE_NAMESPACE)
+
+    return projects
@@ -0,0 +1,65 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+PROJECTS_CACHE_NAMESPACE = 'projects'
+CATEGORIES_CACHE_NAMESPACE = 'categories'
+TAGS_CACHE_NAMESPACE = 'tags'
+
+
+def _namespace_version_key(namespace: str) -> str:
+    return f'cache_namespace_version:{namespace}'
+
+
+def get_namespace_version(namespace: str) -> int:
+    """
+    Returns the current version of the namespace, initializing it if it does not exist yet.
+    A missing counter (e.g. evicted by redis) is re-seeded from the clock instead of 1, so it
+    can never travel back to a version whose entries are still cached.
+    """
+    key = _namespace_version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+
+    return version
+
+
+def bump_namespace_version(namespace: str):
+    """
+    Invalidates every entry of the namespace at once by moving its version forward.
+    """
+    key = _namespace_version_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), timeout=None)
+
+
+def bump_namespace_version_on_commit(*namespaces: str):
+    """
+    Bumps the namespaces once the current transaction commits, so a concurrent reader can not
+    cache the old rows under the new version.
+    """
+    def bump():
+        for namespace in namespaces:
+            bump_namespace_version(namespace)
+
+    transaction.on_commit(bump)
+
+
+def build_request_cache_key(namespace: str, request) -> str:
+    """
+    Builds a cache key from the absolute path and the normalized query params of the request,
+    so `?b=1&a=2` and `?a=2&b=1` share the same entry.
+    """
+    params = sorted(
+        (name, sorted(request.query_params.getlist(name)))
+        for name in request.query_params
+        if any(request.query_params.getlist(name))
+    )
+    digest = hashlib.md5(f'{request.build_absolute_uri(request.path)}{params}'.encode()).hexdigest()
+    return f'{namespace}:{digest}'
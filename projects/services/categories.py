@@ -0,0 +1,46 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from rest_framework.utils.encoders import JSONEncoder
+
+from config import settings
+from projects.models import Category
+from projects.services.cache import CATEGORIES_CACHE_NAMESPACE, get_namespace_version
+
+CATEGORY_LIST_CACHE_KEY = f'{CATEGORIES_CACHE_NAMESPACE}:list'
+
+
+@dataclass(init=True, repr=True)
+class CategoryList:
+    data: list
+    digest: str
+    last_modified: int
+
+    def get_etag(self, limit: int = None) -> str:
+        if limit is None:
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{limit}"'
+
+
+def _get_category_list(serializer_class) -> CategoryList:
+    """
+    Returns the categories serialized with `serializer_class`, building and caching them on the first call
+    after an invalidation.
+    """
+    version = get_namespace_version(CATEGORIES_CACHE_NAMESPACE)
+    category_list = cache.get(CATEGORY_LIST_CACHE_KEY, version=version)
+    if category_list is not None:
+        return category_list
+
+    data = serializer_class(Category.objects.order_by('id'), many=True).data
+    category_list = CategoryList(
+        data=list(data),
+        digest=hashlib.sha1(json.dumps(data, cls=JSONEncoder).encode()).hexdigest(),
+        last_modified=int(time.time()),
+    )
+    cache.set(CATEGORY_LIST_CACHE_KEY, category_list, timeout=settings.API_RESPONSE_CACHE_TIMEOUT, version=version)
+
+    return category_list
@@ -0,0 +1,65 @@
+from collections import defaultdict
+
+from django.db.models import F, Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from projects.models import Project, Tag, Category
+from projects.services.cache import CATEGORIES_CACHE_NAMESPACE, bump_namespace_version_on_commit
+
+OPEN_STATUS = 'open'
+
+
+def _change_counters(model, pks, projects_delta: int, open_projects_delta: int):
+    """
+    Atomically moves the project counters of the given categories or tags by the given deltas.
+    """
+    pks = [pk for pk in pks if pk is not None]
+    if not pks or (not projects_delta and not open_projects_delta):
+        return
+
+    model.objects.filter(pk__in=pks).update(
+        projects_count=F('projects_count') + projects_delta,
+        open_projects_count=F('open_projects_count') + open_projects_delta,
+    )
+    if model is Category:
+        bump_namespace_version_on_commit(CATEGORIES_CACHE_NAMESPACE)
+
+
+def _get_project_tag_ids(project_ids) -> list:
+    return list(
+        Project.tags.through.objects.filter(project_id__in=project_ids).values_list('tag_id', flat=True)
+    )
+
+
+def _count(queryset, group_by: str):
+    return Coalesce(Subquery(queryset.values(group_by).annotate(count=Count('pk')).values('count')), 0)
+
+
+def _recompute_project_counters():
+    """
+    Recomputes every counter from scratch, with one `UPDATE` per model.
+    """
+    projects = Project.objects.filter(category=OuterRef('pk'))
+    Category.objects.update(
+        projects_count=_count(projects, 'category'),
+        open_projects_count=_count(projects.filter(status=OPEN_STATUS), 'category'),
+    )
+
+    project_tags = Project.tags.through.objects.filter(tag=OuterRef('pk'))
+    Tag.objects.update(
+        projects_count=_count(project_tags, 'tag'),
+        open_projects_count=_count(project_tags.filter(project__status=OPEN_STATUS), 'tag'),
+    )
+    bump_namespace_version_on_commit(CATEGORIES_CACHE_NAMESPACE)
+
+
+def _apply_counter_deltas(model, deltas: dict):
+    """
+    Applies `{pk: (projects_delta, open_projects_delta)}`, with one `UPDATE` per distinct delta pair.
+    """
+    pks_by_delta = defaultdict(list)
+    for pk, delta in deltas.items():
+        pks_by_delta[tuple(delta)].append(pk)
+
+    for (projects_delta, open_projects_delta), pks in pks_by_delta.items():
+        _change_counters(model, pks, projects_delta, open_projects_delta)
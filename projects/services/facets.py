@@ -0,0 +1,84 @@
+from django.db.models import Count, Q, QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+
+from config import settings
+from projects.models import Project
+
+FACETS = ('status', 'category', 'tags', 'budget')
+
+
+def _parse_facets(value: str) -> list:
+    facets = [facet.strip() for facet in value.split(',') if facet.strip()]
+    unknown = set(facets) - set(FACETS)
+    if unknown:
+        raise ValidationError({'facets': _('Unknown facets: %s') % ', '.join(sorted(unknown))})
+
+    return facets
+
+
+def _get_budget_buckets() -> list:
+    """
+    Returns the `(min, max)` budget buckets, `min` is inclusive and `max` exclusive.
+    """
+    bounds = [None, *settings.PROJECT_BUDGET_FACET_BOUNDS, None]
+    return list(zip(bounds, bounds[1:]))
+
+
+def _get_budget_bucket_filter(lower, upper) -> Q:
+    bucket = Q(budget__isnull=False)
+    if lower is not None:
+        bucket &= Q(budget__gte=lower)
+    if upper is not None:
+        bucket &= Q(budget__lt=upper)
+    return bucket
+
+
+def _get_project_facets(queryset: QuerySet, facets: list) -> dict:
+    """
+    Counts the projects of the already filtered queryset per value of each requested facet.
+    Status, category and budget come from one query grouped by category with conditional counts,
+    tags need a second query since grouping over them multiplies the rows.
+    """
+    projects = Project.objects.filter(pk__in=queryset.values('pk')).order_by()
+    result = {}
+
+    if {'status', 'category', 'budget'} & set(facets):
+        budget_buckets = _get_budget_buckets()
+        aggregates = {'count': Count('pk')}
+        aggregates.update({
+            f'status_{status}': Count('pk', filter=Q(status=status)) for status, label in Project.status_choices
+        })
+        aggregates.update({
+            f'budget_{index}': Count('pk', filter=_get_budget_bucket_filter(lower, upper))
+            for index, (lower, upper) in enumerate(budget_buckets)
+        })
+        rows = list(projects.values('category__slug').annotate(**aggregates))
+
+        if 'status' in facets:
+            result['status'] = [
+                {'value': status, 'count': sum(row[f'status_{status}'] for row in rows)}
+                for status, label in Project.status_choices
+            ]
+        if 'category' in facets:
+            result['category'] = [
+                {'value': row['category__slug'], 'count': row['count']}
+                for row in sorted(rows, key=lambda row: -row['count'])
+            ]
+        if 'budget' in facets:
+            result['budget'] = [
+                {'min': lower, 'max': upper, 'count': sum(row[f'budget_{index}'] for row in rows)}
+                for index, (lower, upper) in enumerate(budget_buckets)
+            ]
+
+    if 'tags' in facets:
+        rows = (
+            projects
+            .filter(tags__isnull=False)
+            .values('tags__name')
+            .annotate(count=Count('pk'))
+            .order_by('-count', 'tags__name')[:settings.PROJECT_TAGS_FACET_LIMIT]
+        )
+        result['tags'] = [{'value': row['tags__name'], 'count': row['count']} for row in rows]
+
+    return result
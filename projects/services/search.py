@@ -0,0 +1,45 @@
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
+from django.db.models import OuterRef, Subquery, Value, F, FloatField, TextField, QuerySet
+from django.db.models.functions import Coalesce, Cast
+
+from config import settings
+from projects.models import Tag, Category
+
+
+def get_project_search_vector(tag_model, category_model) -> SearchVector:
+    """
+    Returns the weighted search vector expression of a project over its title, category name,
+    tag names and description. Related names are pulled in through correlated subqueries, so the
+    expression can be used in a single `UPDATE` over any number of projects.
+    """
+    config = settings.PROJECTS_SEARCH_CONFIG
+    category_name = category_model.objects.filter(pk=OuterRef('category_id')).values('name')
+    tag_names = (
+        tag_model.objects
+        .filter(projects=OuterRef('pk'))
+        .values('projects')
+        .annotate(names=StringAgg('name', delimiter=' '))
+        .values('names')
+    )
+
+    return (
+            SearchVector('title', weight='A', config=config)
+            + SearchVector(Coalesce(Subquery(category_name), Value(''), output_field=TextField()), weight='B', config=config)
+            + SearchVector(Coalesce(Subquery(tag_names), Value(''), output_field=TextField()), weight='B', config=config)
+            + SearchVector('description', weight='C', config=config)
+    )
+
+
+def _update_search_vectors(projects: QuerySet) -> int:
+    return projects.update(search_vector=get_project_search_vector(Tag, Category))
+
+
+def _search_projects(projects: QuerySet, text: str) -> QuerySet:
+    """
+    Filters the projects matching the web-search style `text` and annotates them with `search_rank`.
+    """
+    query = SearchQuery(text, search_type='websearch', config=settings.PROJECTS_SEARCH_CONFIG)
+    return projects.filter(search_vector=query).annotate(
+        search_rank=Cast(SearchRank(F('search_vector'), query), FloatField()),
+    )
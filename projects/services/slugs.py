@@ -0,0 +1,101 @@
+import re
+import zlib
+from collections import defaultdict
+
+from django.db import connection
+from django.db.models import Q
+from django.utils.text import slugify
+
+SLUG_LOOKUP_CHUNK_SIZE = 500
+SLUG_SUFFIX_MAX_LENGTH = 8
+
+_SUFFIXED_SLUG = re.compile(r'^(.+)-(\d{1,6})$')
+
+
+def _get_slug_base(model, text: str, field_name: str = 'slug') -> str:
+    """
+    Returns the slugified text, leaving room for a numeric suffix and falling back to the model name
+    for texts without any latin character.
+    """
+    max_length = model._meta.get_field(field_name).max_length - SLUG_SUFFIX_MAX_LENGTH
+    base = slugify(text)[:max_length].strip('-')
+    return base or model._meta.model_name
+
+
+def _get_used_suffixes(model, bases, field_name: str = 'slug') -> dict:
+    """
+    Returns the numeric suffixes already taken for each base, `0` standing for the bare base.
+    Every base is a prefix lookup on the slug index, chunked into a few queries for large batches.
+    """
+    bases = sorted(set(bases))
+    used = defaultdict(set)
+
+    for start in range(0, len(bases), SLUG_LOOKUP_CHUNK_SIZE):
+        chunk = set(bases[start:start + SLUG_LOOKUP_CHUNK_SIZE])
+        lookup = Q()
+        for base in chunk:
+            lookup |= Q(**{f'{field_name}__startswith': base})
+
+        for slug in model.objects.filter(lookup).values_list(field_name, flat=True).iterator():
+            if slug in chunk:
+                used[slug].add(0)
+
+            match = _SUFFIXED_SLUG.match(slug)
+            if match and match.group(1) in chunk:
+                used[match.group(1)].add(int(match.group(2)))
+
+    return used
+
+
+def _get_lock_key(model) -> int:
+    return zlib.crc32(model._meta.label_lower.encode()) - 2 ** 31
+
+
+def _compute_slugs(model, bases, field_name: str = 'slug') -> list:
+    """
+    Returns a unique slug for each base, in order. Repeated bases get `-2`, `-3`, ... continuing
+    after the largest suffix in use.
+    """
+    next_suffix = {
+        base: max(max(suffixes) + 1, 2)
+        for base, suffixes in _get_used_suffixes(model, bases, field_name).items()
+    }
+
+    slugs = []
+    for base in bases:
+        suffix = next_suffix.get(base)
+        next_suffix[base] = suffix + 1 if suffix else 2
+        slugs.append(f'{base}-{suffix}' if suffix else base)
+
+    return slugs
+
+
+def _allocate_slug(model, text: str, field_name: str = 'slug') -> str:
+    """
+    Returns a unique slug for a single row, which must be inserted in the current transaction.
+    The transaction holds an advisory lock on the slug base (without any numeric suffix, as `logo-2`
+    may be taken by both `Logo` and `Logo 2`) until it commits, so concurrent inserts of the same
+    base wait for each other instead of picking the same suffix, while other bases are not blocked.
+    """
+    base = _get_slug_base(model, text, field_name)
+    suffixed = _SUFFIXED_SLUG.match(base)
+    lock_key = _get_lock_key(model)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT pg_advisory_xact_lock_shared(%s), pg_advisory_xact_lock(%s, hashtext(%s))',
+            [lock_key, lock_key, suffixed.group(1) if suffixed else base],
+        )
+
+    return _compute_slugs(model, [base], field_name)[0]
+
+
+def _allocate_slugs(model, texts, field_name: str = 'slug') -> list:
+    """
+    Returns a unique slug for each text, in order, for rows inserted in the current transaction.
+    Locking every base would exhaust the lock table on large batches, so the transaction takes the
+    whole model's slug lock instead, which waits for the single-row allocations in flight.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_xact_lock(%s)', [_get_lock_key(model)])
+
+    return _compute_slugs(model, [_get_slug_base(model, text, field_name) for text in texts], field_name)
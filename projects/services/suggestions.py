@@ -0,0 +1,101 @@
+import heapq
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+
+from config import settings
+from projects.models import Tag, Category
+from projects.services.cache import TAGS_CACHE_NAMESPACE, CATEGORIES_CACHE_NAMESPACE, get_namespace_version
+
+
+class PrefixIndex:
+    """
+    In-memory prefix index over names, ranked by usage.
+    Every suffix of a name starting at a word is a key, so both `graphic de` and `design` find
+    `Graphic Design`. Keys are kept in a sorted list and a prefix lookup is two bisects plus a
+    heap over the matching range.
+    """
+
+    def __init__(self, items):
+        """
+        :param items: iterable of `(name, usage, payload)` tuples, payload must contain an `id`
+        """
+        entries = []
+        for name, usage, payload in items:
+            words = name.casefold().split()
+            for position in range(len(words)):
+                key = ' '.join(words[position:])
+                entries.append((key, -usage, name.casefold(), payload['id'], payload))
+
+        entries.sort(key=lambda entry: entry[:4])
+        self._keys = [entry[0] for entry in entries]
+        self._entries = entries
+
+    def search(self, prefix: str, limit: int) -> list:
+        prefix = ' '.join(prefix.casefold().split())
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + '\U0010ffff', lo=start)
+
+        # A name has an entry per matching word suffix, so entries are popped by rank until `limit`
+        # distinct names are collected
+        heap = [(*self._entries[position][1:4], position) for position in range(start, end)]
+        heapq.heapify(heap)
+
+        results, seen = [], set()
+        while heap and len(results) < limit:
+            *_, payload_id, position = heapq.heappop(heap)
+            if payload_id not in seen:
+                seen.add(payload_id)
+                results.append(self._entries[position][4])
+
+        return results
+
+
+@dataclass(init=True, repr=True)
+class _Snapshot:
+    version: int
+    built_at: float
+    index: PrefixIndex
+
+
+_snapshots = {}
+
+
+def _get_prefix_index(namespace: str, loader) -> PrefixIndex:
+    """
+    Returns the per-process index of the namespace, rebuilding it when the namespace version moved
+    (names changed) or when it is older than `SUGGESTIONS_SNAPSHOT_MAX_AGE` (usage counts drifted).
+    """
+    version = get_namespace_version(namespace)
+    snapshot = _snapshots.get(namespace)
+    if (
+            snapshot is None
+            or snapshot.version != version
+            or time.monotonic() - snapshot.built_at > settings.SUGGESTIONS_SNAPSHOT_MAX_AGE
+    ):
+        snapshot = _Snapshot(version=version, built_at=time.monotonic(), index=PrefixIndex(loader()))
+        _snapshots[namespace] = snapshot
+
+    return snapshot.index
+
+
+_COUNTER_FIELDS = ('projects_count', 'open_projects_count')
+
+
+def _load_tags():
+    tags = Tag.objects.values('id', 'name', *_COUNTER_FIELDS)
+    return [(tag['name'], tag['projects_count'], tag) for tag in tags]
+
+
+def _load_categories():
+    categories = Category.objects.values('id', 'name', 'slug', *_COUNTER_FIELDS)
+    return [(category['name'], category['projects_count'], category) for category in categories]
+
+
+def _suggest_tags(prefix: str, limit: int) -> list:
+    return _get_prefix_index(TAGS_CACHE_NAMESPACE, _load_tags).search(prefix, limit)
+
+
+def _suggest_categories(prefix: str, limit: int) -> list:
+    suggestions = _get_prefix_index(CATEGORIES_CACHE_NAMESPACE, _load_categories).search(prefix, limit)
+    return [{field: category[field] for field in ('name', 'slug', *_COUNTER_FIELDS)} for category in suggestions]
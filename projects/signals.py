@@ -0,0 +1,181 @@
+from django.db.models.signals import post_init, pre_save, post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from projects.models import Project, ProjectFile, Tag, Category
+from projects.services.cache import (PROJECTS_CACHE_NAMESPACE, CATEGORIES_CACHE_NAMESPACE, TAGS_CACHE_NAMESPACE,
+                                     bump_namespace_version_on_commit)
+from projects.services.counters import OPEN_STATUS, _change_counters, _get_project_tag_ids
+from projects.services.search import _update_search_vectors
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=ProjectFile)
+@receiver(post_delete, sender=ProjectFile)
+def invalidate_projects_cache(sender, **kwargs):
+    bump_namespace_version_on_commit(PROJECTS_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tags_cache(sender, **kwargs):
+    bump_namespace_version_on_commit(PROJECTS_CACHE_NAMESPACE, TAGS_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_categories_cache(sender, **kwargs):
+    bump_namespace_version_on_commit(PROJECTS_CACHE_NAMESPACE, CATEGORIES_CACHE_NAMESPACE)
+
+
+@receiver(m2m_changed, sender=Project.tags.through)
+def invalidate_projects_cache_on_tags_change(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_namespace_version_on_commit(PROJECTS_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=Project)
+def update_project_search_vector(sender, instance, **kwargs):
+    _update_search_vectors(Project.objects.filter(pk=instance.pk))
+
+
+@receiver(m2m_changed, sender=Project.tags.through)
+def update_project_search_vector_on_tags_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            _update_search_vectors(Project.objects.filter(pk=instance.pk))
+        return
+
+    if action == 'pre_clear':
+        instance._search_project_ids = list(instance.projects.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        _update_search_vectors(Project.objects.filter(pk__in=instance._search_project_ids))
+    elif action in ('post_add', 'post_remove'):
+        _update_search_vectors(Project.objects.filter(pk__in=pk_set))
+
+
+@receiver(post_save, sender=Tag)
+def update_tag_projects_search_vector(sender, instance, created, **kwargs):
+    if not created:
+        _update_search_vectors(Project.objects.filter(tags=instance))
+
+
+@receiver(post_save, sender=Category)
+def update_category_projects_search_vector(sender, instance, created, **kwargs):
+    if not created:
+        _update_search_vectors(Project.objects.filter(category=instance))
+
+
+@receiver(pre_delete, sender=Tag)
+@receiver(pre_delete, sender=Category)
+def remember_search_projects(sender, instance, **kwargs):
+    instance._search_project_ids = list(instance.projects.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=Category)
+def update_search_vector_of_remembered_projects(sender, instance, **kwargs):
+    _update_search_vectors(Project.objects.filter(pk__in=instance._search_project_ids))
+
+
+def _get_counter_state(instance):
+    """
+    Returns the `(category_id, is_open)` pair the counters currently account for, or None when
+    one of the fields is deferred.
+    """
+    fields = instance.__dict__
+    if 'category_id' not in fields or 'status' not in fields:
+        return None
+    return fields['category_id'], fields['status'] == OPEN_STATUS
+
+
+@receiver(post_init, sender=Project)
+def remember_counter_state(sender, instance, **kwargs):
+    instance._counter_state = _get_counter_state(instance)
+
+
+@receiver(pre_save, sender=Project)
+def load_deferred_counter_state(sender, instance, **kwargs):
+    if instance._state.adding or instance._counter_state is not None:
+        return
+
+    previous = Project.objects.filter(pk=instance.pk).values_list('category_id', 'status').first()
+    if previous is not None:
+        instance._counter_state = previous[0], previous[1] == OPEN_STATUS
+
+
+@receiver(post_save, sender=Project)
+def update_counters_on_project_save(sender, instance, created, **kwargs):
+    if created:
+        category_id, is_open = instance.category_id, instance.status == OPEN_STATUS
+        _change_counters(Category, [category_id], 1, int(is_open))
+        instance._counter_state = category_id, is_open
+        return
+
+    if instance._counter_state is None:
+        return
+
+    previous_category_id, was_open = instance._counter_state
+    fields = instance.__dict__
+    category_id = fields.get('category_id', previous_category_id)
+    is_open = fields['status'] == OPEN_STATUS if 'status' in fields else was_open
+    open_delta = int(is_open) - int(was_open)
+
+    if previous_category_id != category_id:
+        _change_counters(Category, [previous_category_id], -1, -int(was_open))
+        _change_counters(Category, [category_id], 1, int(is_open))
+    else:
+        _change_counters(Category, [category_id], 0, open_delta)
+
+    if open_delta:
+        _change_counters(Tag, _get_project_tag_ids([instance.pk]), 0, open_delta)
+
+    instance._counter_state = category_id, is_open
+
+
+@receiver(pre_delete, sender=Project)
+def remember_project_tags(sender, instance, **kwargs):
+    instance._counter_tag_ids = _get_project_tag_ids([instance.pk])
+
+
+@receiver(post_delete, sender=Project)
+def update_counters_on_project_delete(sender, instance, **kwargs):
+    is_open = int(instance.status == OPEN_STATUS)
+    _change_counters(Category, [instance.category_id], -1, -is_open)
+    _change_counters(Tag, instance._counter_tag_ids, -1, -is_open)
+
+
+@receiver(m2m_changed, sender=Project.tags.through)
+def update_counters_on_tags_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear':
+        if reverse:
+            instance._counter_project_ids = list(instance.projects.values_list('pk', flat=True))
+        else:
+            instance._counter_tag_ids = _get_project_tag_ids([instance.pk])
+        return
+
+    if action == 'pre_remove':
+        # `pk_set` holds every id asked to be removed, only the linked ones change the counters
+        if reverse:
+            instance._counter_project_ids = list(
+                sender.objects.filter(tag_id=instance.pk, project_id__in=pk_set).values_list('project_id', flat=True)
+            )
+        else:
+            instance._counter_tag_ids = list(
+                sender.objects.filter(project_id=instance.pk, tag_id__in=pk_set).values_list('tag_id', flat=True)
+            )
+        return
+
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    sign = 1 if action == 'post_add' else -1
+    if not reverse:
+        tag_ids = pk_set if action == 'post_add' else instance._counter_tag_ids
+        is_open = int(instance.status == OPEN_STATUS)
+        _change_counters(Tag, tag_ids, sign, sign * is_open)
+        return
+
+    project_ids = pk_set if action == 'post_add' else instance._counter_project_ids
+    open_projects = Project.objects.filter(pk__in=project_ids, status=OPEN_STATUS).count()
+    _change_counters(Tag, [instance.pk], sign * len(project_ids), sign * open_projects)
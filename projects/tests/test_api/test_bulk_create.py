@@ -0,0 +1,82 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from projects.models import Project, Category, Tag
+
+
+class ProjectBulkCreateTests(APITestCase):
+
+    def setUp(self) -> None:
+        self.url = reverse('projects:project-bulk_create')
+        self.user = baker.make(get_user_model())
+        self.client.force_authenticate(self.user)
+
+        self.category = baker.make(Category, slug='design')
+        self.tags = [baker.make(Tag, name='logo'), baker.make(Tag, name='figma')]
+        baker.make(Project, slug='logo-design', category=self.category)
+
+    def _project(self, **kwargs):
+        data = {
+            'title': 'Logo design',
+            'description': 'A logo',
+            'category': 'design',
+            'tags': ['logo', 'figma'],
+            'owner': self.user.pk,
+        }
+        data.update(kwargs)
+        return data
+
+    def test_bulk_create(self):
+        data = [self._project(), self._project(status='closed'), self._project(title='Flyer', tags=[])]
+
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['slugs'], ['logo-design-2', 'logo-design-3', 'flyer'])
+        project = Project.objects.get(slug='logo-design-2')
+        self.assertEqual(project.category, self.category)
+        self.assertCountEqual(project.tags.values_list('name', flat=True), ['logo', 'figma'])
+
+    def test_bulk_create_updates_counters_and_search(self):
+        data = [self._project(), self._project(status='closed')]
+
+        self.client.post(self.url, data, format='json')
+
+        self.category.refresh_from_db()
+        self.tags[0].refresh_from_db()
+        self.assertEqual((self.category.projects_count, self.category.open_projects_count), (3, 2))
+        self.assertEqual((self.tags[0].projects_count, self.tags[0].open_projects_count), (2, 1))
+        self.assertEqual(Project.objects.filter(search_vector='figma').count(), 2)
+
+    def test_bulk_create_query_count_does_not_depend_on_size(self):
+        for size in [2, 20]:
+            # tags, categories, owners, slug lock, slugs, projects, project tags, search vectors,
+            # 2 counter updates, savepoints
+            with self.assertNumQueries(12):
+                response = self.client.post(self.url, [self._project()] * size, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_bulk_create_reports_per_item_errors(self):
+        data = [self._project(), self._project(category='missing'), self._project(tags=['missing']), {}]
+
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(list(response.data[1]), ['category'])
+        self.assertEqual(list(response.data[2]), ['tags'])
+        self.assertIn('title', response.data[3])
+        self.assertEqual(Project.objects.count(), 1)
+
+    def test_bulk_create_without_being_login(self):
+        self.client.logout()
+
+        response = self.client.post(self.url, [self._project()], format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
@@ -0,0 +1,79 @@
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from projects.models import Project, Tag, Category
+
+
+class ProjectResponseCacheTests(APITestCase):
+
+    def setUp(self) -> None:
+        self.list_url = reverse('projects:project-list')
+        self.project = baker.make(Project, slug='project', title='Project')
+        self.detail_url = reverse('projects:project-detail', kwargs={'slug': self.project.slug})
+
+    def test_repeated_list_is_served_without_queries(self):
+        response = self.client.get(self.list_url, {'status': 'open', 'page_size': 10})
+
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(self.list_url, {'page_size': 10, 'status': 'open'})
+
+        self.assertEqual(cached_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(cached_response.data, response.data)
+
+    def test_repeated_retrieve_is_served_without_queries(self):
+        self.client.get(self.detail_url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.data['title'], 'Project')
+
+    def test_project_save_invalidates_cache(self):
+        self.client.get(self.detail_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.title = 'Renamed'
+            self.project.save()
+
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data['title'], 'Renamed')
+
+    def test_tags_change_invalidates_cache(self):
+        tag = baker.make(Tag, name='python')
+        self.client.get(self.detail_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.tags.set([tag])
+
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data['tags'], ['python'])
+
+    def test_category_save_invalidates_cache(self):
+        category = baker.make(Category, slug='design')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.category = category
+            self.project.save()
+        self.client.get(self.detail_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            category.slug = 'graphic-design'
+            category.save()
+
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data['category'], 'graphic-design')
+
+    def test_missing_project_is_not_cached(self):
+        url = reverse('projects:project-detail', kwargs={'slug': 'missing'})
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            baker.make(Project, slug='missing')
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
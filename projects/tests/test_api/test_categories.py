@@ -0,0 +1,72 @@
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from projects.models import Category
+
+
+class CategoryListTests(APITestCase):
+
+    def setUp(self) -> None:
+        self.url = reverse('projects:categories')
+        self.categories = [baker.make(Category, name=f'Category {index}', slug=f'category-{index}') for index in range(3)]
+
+    def test_list_categories(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([category['slug'] for category in response.data], ['category-0', 'category-1', 'category-2'])
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+    def test_list_categories_with_limit(self):
+        response = self.client.get(self.url, {'limit': 2})
+        self.assertEqual(len(response.data), 2)
+
+    def test_list_categories_with_invalid_limit(self):
+        for limit in ['abc', '0', '-1']:
+            response = self.client.get(self.url, {'limit': limit})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_repeated_list_is_served_without_queries(self):
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data), 3)
+
+    def test_matching_etag_returns_not_modified(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_matching_last_modified_returns_not_modified(self):
+        last_modified = self.client.get(self.url)['Last-Modified']
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_depends_on_limit(self):
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, {'limit': 1}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_category_change_invalidates_cache(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.categories[0].name = 'Renamed'
+            self.categories[0].save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['name'], 'Renamed')
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
@@ -0,0 +1,62 @@
+import gzip
+import json
+from unittest import mock
+
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from config import compression
+from projects.api import mixins
+from projects.models import Project, Category
+
+
+@mock.patch.object(compression, 'brotli', None)
+class PrecompressedResponseTests(APITestCase):
+
+    def setUp(self) -> None:
+        self.list_url = reverse('projects:project-list')
+        self.categories_url = reverse('projects:categories')
+        for index in range(20):
+            baker.make(Project, slug=f'project-{index}', description='Long description ' * 20)
+            baker.make(Category, slug=f'category-{index}', description='Long description ' * 20)
+
+    def test_list_is_compressed_once(self):
+        plain = self.client.get(self.list_url)
+
+        with mock.patch.object(mixins, 'compress', wraps=compression.compress) as compress:
+            first = self.client.get(self.list_url, HTTP_ACCEPT_ENCODING='gzip')
+            with self.assertNumQueries(0):
+                second = self.client.get(self.list_url, HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertEqual(compress.call_count, 1)
+        for response in [first, second]:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+            self.assertEqual(response['Content-Type'], 'application/json')
+            self.assertIn('Accept-Encoding', response['Vary'])
+            self.assertEqual(json.loads(gzip.decompress(response.content)), json.loads(plain.content))
+        self.assertEqual(first.content, second.content)
+
+    def test_small_responses_are_not_compressed(self):
+        response = self.client.get(self.list_url, {'page_size': 1, 'fields': 'slug'}, HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_categories(self):
+        response = self.client.get(self.categories_url, HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertTrue(response['ETag'].startswith('W/"'))
+        self.assertIn('max-age', response['Cache-Control'])
+        self.assertEqual(len(json.loads(gzip.decompress(response.content))), 20)
+
+        response = self.client.get(self.categories_url, HTTP_ACCEPT_ENCODING='gzip',
+                                   HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
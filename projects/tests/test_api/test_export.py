@@ -0,0 +1,89 @@
+import csv
+import json
+from io import StringIO
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from config import settings
+from projects.models import Project, Category, Tag
+
+
+class ProjectExportTests(APITestCase):
+
+    def setUp(self) -> None:
+        self.url = reverse('projects:project-export')
+        category = baker.make(Category, slug='design')
+        tags = [baker.make(Tag, name=name) for name in ['figma', 'logo']]
+
+        for index in range(5):
+            project = baker.make(Project, slug=f'project-{index}', category=category if index % 2 else None,
+                                 budget=index * 100 or None, title=f'Project, "{index}"')
+            project.tags.set(tags[:index % 3])
+
+    def _export(self, params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            content = b''.join(response.streaming_content).decode()
+
+        return response, content, len(context.captured_queries)
+
+    def test_ndjson(self):
+        response, content, _ = self._export({'format': 'ndjson'})
+        rows = [json.loads(line) for line in content.splitlines()]
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        self.assertEqual([row['slug'] for row in rows], [f'project-{index}' for index in range(5)])
+        self.assertNotIn('files', rows[0])
+
+        listed = self.client.get(reverse('projects:project-list'), {'ordering': 'created_at'}).data['results']
+        for row, project in zip(rows, sorted(listed, key=lambda project: project['slug'])):
+            project.pop('files')
+            self.assertEqual(row, project)
+
+    def test_csv(self):
+        response, content, _ = self._export({'format': 'csv'})
+        rows = list(csv.DictReader(StringIO(content)))
+
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="projects.csv"')
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['title'], 'Project, "0"')
+        self.assertEqual(rows[0]['budget'], '')
+        self.assertEqual(rows[2]['tags'], 'figma|logo')
+        self.assertEqual(rows[1]['category'], 'design')
+
+    def test_filters(self):
+        _, content, _ = self._export({'format': 'csv', 'category': 'design', 'tags': 'figma'})
+        rows = list(csv.DictReader(StringIO(content)))
+
+        self.assertEqual([row['slug'] for row in rows], ['project-1'])
+
+    def test_empty_csv_has_a_header(self):
+        _, content, _ = self._export({'format': 'csv', 'category': 'missing'})
+        self.assertEqual(content.splitlines(), [
+            'title,description,category,tags,owner,budget,deadline,status,created_at,updated_at,slug',
+        ])
+
+    @mock.patch.object(settings, 'PROJECT_EXPORT_CHUNK_SIZE', 2)
+    def test_one_tags_query_per_chunk(self):
+        _, content, queries = self._export({'format': 'ndjson'})
+
+        self.assertEqual(len(content.splitlines()), 5)
+        self.assertEqual(queries, 1 + 3)  # rows, then tags of each chunk
+
+    def test_errors_are_json(self):
+        response = self.client.get(self.url, {'format': 'csv', 'min_budget': 'invalid'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('min_budget', response.json())
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
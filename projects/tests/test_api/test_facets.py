@@ -0,0 +1,55 @@
+from decimal import Decimal
+
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from projects.models import Project, Category, Tag
+
+
+class ProjectFacetsTests(APITestCase):
+
+    def setUp(self) -> None:
+        self.url = reverse('projects:project-list')
+        design = baker.make(Category, slug='design')
+        web = baker.make(Category, slug='web')
+        python, figma = baker.make(Tag, name='python'), baker.make(Tag, name='figma')
+
+        baker.make(Project, slug='p1', category=design, status='open', budget=Decimal('50')).tags.set([figma])
+        baker.make(Project, slug='p2', category=design, status='closed', budget=Decimal('700')).tags.set([figma])
+        baker.make(Project, slug='p3', category=web, status='open', budget=Decimal('700')).tags.set([python, figma])
+        baker.make(Project, slug='p4', category=web, status='open', budget=None)
+
+    def test_list_without_facets(self):
+        response = self.client.get(self.url)
+        self.assertNotIn('facets', response.data)
+
+    def test_facets(self):
+        response = self.client.get(self.url, {'facets': 'status,category,tags,budget', 'page_size': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        facets = response.data['facets']
+        self.assertEqual(facets['status'][:2], [{'value': 'open', 'count': 3}, {'value': 'in_progress', 'count': 0}])
+        self.assertCountEqual(facets['category'], [{'value': 'design', 'count': 2}, {'value': 'web', 'count': 2}])
+        self.assertEqual(facets['tags'], [{'value': 'figma', 'count': 3}, {'value': 'python', 'count': 1}])
+        self.assertEqual([bucket['count'] for bucket in facets['budget']], [1, 0, 2, 0, 0])
+
+    def test_facets_follow_filters(self):
+        response = self.client.get(self.url, {'facets': 'category,tags', 'status': 'open', 'tags': 'python'})
+
+        facets = response.data['facets']
+        self.assertEqual(facets['category'], [{'value': 'web', 'count': 1}])
+        self.assertEqual(facets['tags'], [{'value': 'figma', 'count': 1}, {'value': 'python', 'count': 1}])
+
+    def test_facets_query_count(self):
+        with self.assertNumQueries(5):  # page, tags, files, grouped facets, tags facet
+            self.client.get(self.url, {'facets': 'status,category,tags,budget'})
+
+    def test_unknown_facet(self):
+        response = self.client.get(self.url, {'facets': 'status,owner'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
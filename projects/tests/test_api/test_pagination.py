@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from projects.models import Project
+
+
+class ProjectCursorPaginationTests(APITestCase):
+
+    def setUp(self) -> None:
+        self.url = reverse('projects:project-list')
+        budgets = [Decimal('100.00'), Decimal('100.00'), None, Decimal('50.00'), None, Decimal('100.00'), Decimal('10.00')]
+        self.projects = [
+            baker.make(Project, slug=f'project-{index}', budget=budget, status='open')
+            for index, budget in enumerate(budgets)
+        ]
+
+    def _walk(self, params):
+        slugs = []
+        response = self.client.get(self.url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            slugs += [project['slug'] for project in response.data['results']]
+            if response.data['next'] is None:
+                return slugs, response
+            response = self.client.get(response.data['next'])
+
+    def test_default_ordering_is_newest_first(self):
+        slugs, _ = self._walk({'page_size': 2})
+        expected = [project.slug for project in sorted(self.projects, key=lambda p: (p.created_at, p.id), reverse=True)]
+        self.assertEqual(slugs, expected)
+
+    def test_walks_duplicated_and_null_values_without_gaps(self):
+        for ordering in ['budget', '-budget']:
+            slugs, _ = self._walk({'page_size': 2, 'ordering': ordering})
+            self.assertEqual(len(slugs), len(self.projects))
+            self.assertEqual(set(slugs), {project.slug for project in self.projects})
+
+    def test_previous_link_returns_previous_page(self):
+        first_page = self.client.get(self.url, {'page_size': 3, 'ordering': 'budget'})
+        second_page = self.client.get(first_page.data['next'])
+        previous_page = self.client.get(second_page.data['previous'])
+
+        self.assertEqual(previous_page.data['results'], first_page.data['results'])
+
+    def test_combines_with_filters(self):
+        baker.make(Project, slug='closed-project', status='closed')
+
+        slugs, _ = self._walk({'page_size': 2, 'status': 'closed'})
+        self.assertEqual(slugs, ['closed-project'])
+
+    def test_deep_pages_are_bounded_by_the_index(self):
+        first_page = self.client.get(self.url, {'page_size': 2, 'ordering': 'budget'})
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(first_page.data['next'])
+
+        page_query = next(query['sql'] for query in queries if 'ORDER BY "projects_project"."budget"' in query['sql'])
+        with connection.cursor() as cursor:
+            # Rules out the plans a table this small would get anyway
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('SET LOCAL enable_sort = off')
+            cursor.execute(f'EXPLAIN {page_query}')
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+
+        self.assertRegex(plan, r'Index Cond: \(budget >= ')
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'cursor': 'invalid'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
@@ -0,0 +1,49 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from projects.models import Project, Category, Tag, ProjectFile
+
+
+class ProjectQueryCountTests(APITestCase):
+    """
+    Pins the number of SQL queries of the project endpoints, so N+1 regressions in
+    ProjectSerializer fail loudly instead of showing up in production latency.
+    """
+    list_queries = 3  # page, tags, files
+    retrieve_queries = 3  # project, tags, files
+
+    def setUp(self) -> None:
+        self.list_url = reverse('projects:project-list')
+        categories = baker.make(Category, _quantity=3, _fill_optional=['slug'])
+        tags = baker.make(Tag, _quantity=5)
+
+        for index in range(30):
+            project = baker.make(Project, slug=f'project-{index}', category=categories[index % 3])
+            project.tags.set(tags[index % 5:])
+            baker.make(ProjectFile, project=project, file=f'project_files/{index}.pdf', _quantity=2)
+
+    def _count_queries(self, url, params=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_list_query_count_does_not_depend_on_page_size(self):
+        for page_size in [1, 10, 30]:
+            self.assertEqual(self._count_queries(self.list_url, {'page_size': page_size}), self.list_queries)
+
+    def test_list_query_count_with_filters(self):
+        self.assertEqual(self._count_queries(self.list_url, {'status': 'open', 'page_size': 30}), self.list_queries)
+
+    def test_retrieve_query_count(self):
+        url = reverse('projects:project-detail', kwargs={'slug': 'project-0'})
+        self.assertEqual(self._count_queries(url), self.retrieve_queries)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
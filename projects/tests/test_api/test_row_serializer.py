@@ -0,0 +1,97 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db.models import Prefetch
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase, APIRequestFactory
+
+from projects.api.serializers import ProjectSerializer, ProjectRowSerializer
+from projects.management.commands.benchmark_project_serializers import Command as BenchmarkCommand
+from projects.models import Project, Category, Tag, ProjectFile
+
+
+class ProjectRowSerializerTests(APITestCase):
+    """
+    ProjectRowSerializer must render exactly what ProjectSerializer renders.
+    """
+
+    def setUp(self) -> None:
+        category = baker.make(Category, name='Design', description='Design projects', slug='design')
+        tags = [baker.make(Tag, name=name) for name in ['figma', 'logo', 'branding']]
+
+        project = baker.make(Project, slug='logo', title='Logo', category=category, budget=Decimal('1500.5'),
+                             deadline=date(2030, 1, 2), status='in_progress')
+        project.tags.set(tags[::-1])
+        baker.make(ProjectFile, project=project, file='project_files/logo.pdf')
+        baker.make(ProjectFile, project=project, file='project_files/brief pdf.pdf')
+
+        baker.make(Project, slug='bare', title='Bare', category=None, budget=None, deadline=None)
+
+        self.request = APIRequestFactory().get(reverse('projects:project-list'))
+
+    def _render_both(self, **context):
+        context['request'] = self.request
+        queryset = Project.objects.order_by('id')
+
+        rows = ProjectRowSerializer(context=context)
+        fast = rows.to_representation(queryset.values(*rows.columns))
+
+        instances = queryset.select_related('category').prefetch_related(
+            Prefetch('tags', queryset=Tag.objects.order_by('id')),
+            Prefetch('files', queryset=ProjectFile.objects.order_by('id')),
+        )
+        slow = ProjectSerializer(instances, many=True, context=context).data
+
+        return JSONRenderer().render(fast), JSONRenderer().render(slow)
+
+    def test_same_output(self):
+        fast, slow = self._render_both()
+        self.assertEqual(fast, slow)
+        self.assertIn(b'"budget":"1500.50"', fast)
+        self.assertIn(b'"tags":[]', fast)
+
+    def test_same_output_with_sparse_fields(self):
+        fast, slow = self._render_both(fields=['slug', 'budget', 'tags', 'created_at'], expand=[])
+        self.assertEqual(fast, slow)
+
+    def test_same_output_with_expanded_category(self):
+        fast, slow = self._render_both(fields=['title', 'category', 'files'], expand=['category'])
+        self.assertEqual(fast, slow)
+        self.assertIn(b'"category":null', fast)
+
+    def test_list_endpoint(self):
+        response = self.client.get(reverse('projects:project-list'), {'ordering': 'budget', 'page_size': 1})
+
+        self.assertEqual(response.data['results'][0]['slug'], 'logo')
+        self.assertEqual(response.data['results'][0]['tags'], ['figma', 'logo', 'branding'])
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(response.data['results'][0]['slug'], 'bare')
+        self.assertIsNone(response.data['next'])
+
+    def test_benchmark_lists_only_its_rows(self):
+        measure = BenchmarkCommand._measure
+        sizes = []
+
+        def measure_sizes(command, serialize, projects, request, repeat):
+            timing, data = measure(command, serialize, projects, request, repeat)
+            sizes.append(len(data))
+            return timing, data
+
+        stderr = StringIO()
+        with mock.patch.object(BenchmarkCommand, '_measure', measure_sizes):
+            call_command('benchmark_project_serializers', '--rows', '5', '--repeat', '1',
+                         stdout=StringIO(), stderr=stderr)
+
+        self.assertEqual(sizes, [5, 5])
+        self.assertEqual(stderr.getvalue(), '')
+        self.assertEqual(Project.objects.count(), 2)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
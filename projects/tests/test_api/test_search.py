@@ -0,0 +1,71 @@
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from projects.models import Project, Category, Tag
+
+
+class ProjectSearchTests(APITestCase):
+
+    def setUp(self) -> None:
+        self.url = reverse('projects:project-list')
+        self.category = baker.make(Category, name='Graphic Design', slug='graphic-design')
+        self.tag = baker.make(Tag, name='illustrator')
+
+        self.logo = baker.make(Project, slug='logo', title='Logo for a bakery', description='A simple logo',
+                               category=self.category, status='open')
+        self.website = baker.make(Project, slug='website', title='Shop website', description='Needs a new logo too',
+                                  status='closed')
+        self.api = baker.make(Project, slug='api', title='Payments API', description='Django backend')
+        self.api.tags.set([self.tag])
+
+    def _search(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [project['slug'] for project in response.data['results']]
+
+    def test_search_ranks_title_matches_first(self):
+        self.assertEqual(self._search({'q': 'logo'}), ['logo', 'website'])
+
+    def test_search_by_category_name(self):
+        self.assertEqual(self._search({'q': 'graphic'}), ['logo'])
+
+    def test_search_by_tag_name(self):
+        self.assertEqual(self._search({'q': 'illustrator'}), ['api'])
+
+    def test_search_combines_with_filters(self):
+        self.assertEqual(self._search({'q': 'logo', 'status': 'closed'}), ['website'])
+
+    def test_search_follows_related_renames(self):
+        self.tag.name = 'figma'
+        self.tag.save()
+        self.category.name = 'Branding'
+        self.category.save()
+
+        self.assertEqual(self._search({'q': 'figma'}), ['api'])
+        self.assertEqual(self._search({'q': 'branding'}), ['logo'])
+        self.assertEqual(self._search({'q': 'illustrator'}), [])
+
+    def test_search_follows_tag_removal(self):
+        self.api.tags.clear()
+
+        self.assertEqual(self._search({'q': 'illustrator'}), [])
+
+    def test_search_paginates_by_rank(self):
+        for index in range(5):
+            baker.make(Project, slug=f'logo-{index}', title='Logo ' * (index + 1), description='logo')
+
+        slugs = []
+        response = self.client.get(self.url, {'q': 'logo', 'page_size': 2})
+        while response.data['next']:
+            slugs += [project['slug'] for project in response.data['results']]
+            response = self.client.get(response.data['next'])
+        slugs += [project['slug'] for project in response.data['results']]
+
+        self.assertEqual(len(slugs), 7)
+        self.assertEqual(len(set(slugs)), 7)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
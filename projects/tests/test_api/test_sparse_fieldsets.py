@@ -0,0 +1,69 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from projects.models import Project, Category, Tag, ProjectFile
+
+
+class ProjectSparseFieldsetsTests(APITestCase):
+
+    def setUp(self) -> None:
+        self.list_url = reverse('projects:project-list')
+        self.category = baker.make(Category, name='Design', description='Design projects', slug='design')
+        self.project = baker.make(Project, slug='logo', title='Logo', description='Long description',
+                                  category=self.category)
+        self.project.tags.set([baker.make(Tag, name='figma')])
+        baker.make(ProjectFile, project=self.project, file='project_files/logo.pdf')
+        self.detail_url = reverse('projects:project-detail', kwargs={'slug': self.project.slug})
+
+    def _get(self, url, params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, [query['sql'] for query in context.captured_queries]
+
+    def test_fields(self):
+        response, queries = self._get(self.list_url, {'fields': 'title,slug,budget,deadline,status'})
+
+        self.assertEqual(list(response.data['results'][0]), ['title', 'budget', 'deadline', 'status', 'slug'])
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"description"', queries[0])
+        self.assertNotIn('"search_vector"', queries[0])
+
+    def test_omit(self):
+        response, queries = self._get(self.detail_url, {'omit': 'description,files'})
+
+        self.assertNotIn('description', response.data)
+        self.assertNotIn('files', response.data)
+        self.assertEqual(response.data['tags'], ['figma'])
+        self.assertEqual(len(queries), 2)
+        self.assertNotIn('"description"', queries[0])
+
+    def test_expand(self):
+        response, queries = self._get(self.detail_url, {'fields': 'title,category', 'expand': 'category'})
+
+        self.assertEqual(response.data, {
+            'title': 'Logo',
+            'category': {'name': 'Design', 'description': 'Design projects', 'slug': 'design'},
+        })
+        self.assertEqual(len(queries), 1)
+
+    def test_unknown_fields(self):
+        for params in [{'fields': 'title,password'}, {'omit': 'secret'}, {'expand': 'owner'}]:
+            response = self.client.get(self.list_url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_default_response_is_complete(self):
+        response, _ = self._get(self.detail_url, {})
+
+        self.assertEqual(response.data['category'], 'design')
+        self.assertEqual(response.data['description'], 'Long description')
+        self.assertEqual(len(response.data['files']), 1)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
@@ -0,0 +1,93 @@
+from django.test import TestCase
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from projects.models import Project, Category, Tag
+from projects.services.suggestions import PrefixIndex
+
+
+class TagSuggestTests(APITestCase):
+
+    def setUp(self) -> None:
+        self.url = reverse('projects:tags_suggest')
+        self.django = baker.make(Tag, name='Django')
+        self.docker = baker.make(Tag, name='Docker')
+        self.rest = baker.make(Tag, name='Django REST framework')
+        baker.make(Tag, name='Python')
+
+        for _ in range(2):
+            baker.make(Project, _fill_optional=['slug']).tags.set([self.docker])
+        baker.make(Project, _fill_optional=['slug']).tags.set([self.django])
+
+    def _suggest(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [tag['name'] for tag in response.data]
+
+    def test_suggestions_are_ranked_by_usage(self):
+        self.assertEqual(self._suggest({'prefix': 'd'}), ['Docker', 'Django', 'Django REST framework'])
+
+    def test_suggestions_are_case_insensitive(self):
+        self.assertEqual(self._suggest({'prefix': 'DJ'}), ['Django', 'Django REST framework'])
+
+    def test_suggestions_match_inner_words(self):
+        self.assertEqual(self._suggest({'prefix': 'rest fr'}), ['Django REST framework'])
+
+    def test_suggestions_with_limit(self):
+        self.assertEqual(self._suggest({'prefix': 'd', 'limit': 1}), ['Docker'])
+
+    def test_suggestions_without_prefix(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_repeated_suggestions_are_served_without_queries(self):
+        self._suggest({'prefix': 'd'})
+
+        with self.assertNumQueries(0):
+            self._suggest({'prefix': 'py'})
+
+    def test_tag_rename_refreshes_suggestions(self):
+        self._suggest({'prefix': 'd'})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.docker.name = 'Kubernetes'
+            self.docker.save()
+
+        self.assertEqual(self._suggest({'prefix': 'k'}), ['Kubernetes'])
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+
+
+class CategorySuggestTests(APITestCase):
+
+    def setUp(self) -> None:
+        self.url = reverse('projects:categories_suggest')
+        baker.make(Category, name='Graphic Design', slug='graphic-design')
+        baker.make(Category, name='Web Development', slug='web-development')
+
+    def test_suggestions(self):
+        response = self.client.get(self.url, {'prefix': 'des'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [
+            {'name': 'Graphic Design', 'slug': 'graphic-design', 'projects_count': 0, 'open_projects_count': 0}
+        ])
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+
+
+class PrefixIndexTests(TestCase):
+
+    def test_name_with_several_matching_words_is_returned_once(self):
+        index = PrefixIndex([
+            ('data driven design dev', 100, {'id': 1}),
+            ('django', 5, {'id': 2}),
+            ('docker', 4, {'id': 3}),
+        ])
+
+        self.assertEqual(index.search('d', 2), [{'id': 1}, {'id': 2}])
+        self.assertEqual(index.search('d', 5), [{'id': 1}, {'id': 2}, {'id': 3}])
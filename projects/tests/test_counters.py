@@ -0,0 +1,104 @@
+from django.core.management import call_command
+from django_redis import get_redis_connection
+from model_bakery import baker
+from django.test import TestCase
+
+from projects.models import Project, Tag, Category
+
+
+class ProjectCountersTests(TestCase):
+
+    def setUp(self) -> None:
+        self.category = baker.make(Category, slug='category')
+        self.other_category = baker.make(Category, slug='other-category')
+        self.tags = baker.make(Tag, _quantity=2)
+
+    def assertCounters(self, instance, projects_count, open_projects_count):
+        instance.refresh_from_db()
+        self.assertEqual((instance.projects_count, instance.open_projects_count), (projects_count, open_projects_count))
+
+    def test_project_create_and_delete(self):
+        project = baker.make(Project, slug='project', category=self.category)
+        project.tags.set(self.tags)
+
+        self.assertCounters(self.category, 1, 1)
+        self.assertCounters(self.tags[0], 1, 1)
+
+        project.delete()
+
+        self.assertCounters(self.category, 0, 0)
+        self.assertCounters(self.tags[0], 0, 0)
+
+    def test_status_change(self):
+        project = baker.make(Project, slug='project', category=self.category)
+        project.tags.set(self.tags)
+
+        project.status = 'closed'
+        project.save()
+
+        self.assertCounters(self.category, 1, 0)
+        self.assertCounters(self.tags[1], 1, 0)
+
+    def test_category_change_of_loaded_project(self):
+        baker.make(Project, slug='project', category=self.category, status='closed')
+
+        project = Project.objects.get(slug='project')
+        project.category = self.other_category
+        project.save()
+
+        self.assertCounters(self.category, 0, 0)
+        self.assertCounters(self.other_category, 1, 0)
+
+    def test_status_change_of_deferred_project(self):
+        baker.make(Project, slug='project', category=self.category)
+
+        project = Project.objects.only('id', 'slug').get(slug='project')
+        project.status = 'closed'
+        project.save()
+
+        self.assertCounters(self.category, 1, 0)
+
+    def test_tags_change(self):
+        project = baker.make(Project, slug='project', category=self.category)
+        project.tags.set(self.tags)
+        project.tags.remove(self.tags[0])
+        self.assertCounters(self.tags[0], 0, 0)
+
+        project.tags.clear()
+        self.assertCounters(self.tags[1], 0, 0)
+
+        self.tags[0].projects.add(project)
+        self.assertCounters(self.tags[0], 1, 1)
+
+        self.tags[0].projects.clear()
+        self.assertCounters(self.tags[0], 0, 0)
+
+    def test_removing_unlinked_rows(self):
+        project = baker.make(Project, slug='project', category=self.category)
+        other_project = baker.make(Project, slug='other-project', category=self.category)
+        project.tags.set([self.tags[0]])
+
+        project.tags.remove(*self.tags)
+        self.tags[1].projects.remove(other_project)
+
+        self.assertCounters(self.tags[0], 0, 0)
+        self.assertCounters(self.tags[1], 0, 0)
+
+        self.tags[0].projects.add(project)
+        self.tags[0].projects.remove(project, other_project)
+        self.assertCounters(self.tags[0], 0, 0)
+
+    def test_recompute_command(self):
+        project = baker.make(Project, slug='project', category=self.category)
+        project.tags.set(self.tags)
+        Category.objects.update(projects_count=10, open_projects_count=10)
+        Tag.objects.update(projects_count=0, open_projects_count=0)
+
+        call_command('recompute_project_counters', stdout=None)
+
+        self.assertCounters(self.category, 1, 1)
+        self.assertCounters(self.other_category, 0, 0)
+        self.assertCounters(self.tags[0], 1, 1)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
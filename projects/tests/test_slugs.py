@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django_redis import get_redis_connection
+from model_bakery import baker
+
+from projects.models import Project, Category
+
+
+class SlugAllocationTests(TestCase):
+
+    def test_same_titles_get_suffixes(self):
+        slugs = [baker.make(Project, title='Logo design').slug for _ in range(3)]
+        self.assertEqual(slugs, ['logo-design', 'logo-design-2', 'logo-design-3'])
+
+    def test_suffix_continues_after_the_largest_one(self):
+        baker.make(Project, title='Logo design', slug='logo-design-7')
+
+        self.assertEqual(baker.make(Project, title='Logo design').slug, 'logo-design-8')
+        self.assertEqual(baker.make(Project, title='Logo design').slug, 'logo-design-9')
+
+    def test_unrelated_slugs_sharing_the_prefix_are_ignored(self):
+        baker.make(Project, title='Logo design', slug='logo-design-agency')
+
+        self.assertEqual(baker.make(Project, title='Logo design').slug, 'logo-design')
+
+    def test_long_and_non_latin_titles(self):
+        long_project = baker.make(Project, title='Logo ' * 30)
+        baker.make(Project, title='Logo ' * 30)
+        self.assertLessEqual(len(long_project.slug), 50)
+
+        self.assertEqual(baker.make(Project, title='طراحی لوگو').slug, 'project')
+        self.assertEqual(baker.make(Project, title='طراحی سایت').slug, 'project-2')
+
+    def test_category_slug(self):
+        self.assertEqual(baker.make(Category, name='Graphic Design').slug, 'graphic-design')
+        self.assertEqual(baker.make(Category, name='Graphic design').slug, 'graphic-design-2')
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+
+
+class ConcurrentSlugAllocationTests(TransactionTestCase):
+
+    def test_concurrent_inserts_of_the_same_title(self):
+        owner = baker.make('users.User')
+
+        def create_project(_):
+            try:
+                return Project.objects.create(title='Logo design', description='', owner=owner).slug
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            slugs = list(executor.map(create_project, range(16)))
+
+        self.assertEqual(len(set(slugs)), 16)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
@@ -5,10 +5,11 @@ from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
+from authentications.services.revocation import revoke_user_tokens_on_commit
 from config import settings
 from users.api.validators import is_email_verified
 from users.services.forget_password import _send_forget_password_code
-from users.services.token_utils import _add_verified_email_to_redis
+from users.services.otp import _verify_code, CODE_MISSING, CODE_MISMATCH
 
 
 class SendForgotPasswordCodeSerializer(serializers.Serializer):
@@ -21,17 +22,14 @@ class SendForgotPasswordCodeSerializer(serializers.Serializer):
         if not exists:
             raise ValidationError(_('Email does not exist'))
 
-        email_key = f'{email}{settings.FORGET_PASSWORD_EMAIL_REDIS_KEY_POSTFIX}'
-        value = cache.get(email_key)
-        if value:
-            raise ValidationError(
-                _('Forget password code has been send already, please wait until it expires'))
-
         return attrs
 
     def create(self, validated_data):
         email = validated_data['email']
-        _send_forget_password_code(email)
+        if not _send_forget_password_code(email):
+            raise ValidationError(
+                _('Forget password code has been send already, please wait until it expires'))
+
         return validated_data
 
 
@@ -41,23 +39,24 @@ class VerifyForgetCodeSerializer(serializers.Serializer):
 
     def validate(self, attrs):
         email = attrs['email']
-        email_key = f'{email}{settings.FORGET_PASSWORD_EMAIL_REDIS_KEY_POSTFIX}'
         forget_code = attrs['forget_code']
 
-        sent_forget_code = cache.get(email_key)
-
         exists = get_user_model().objects.filter(email=email).exists()
         if not exists:
             raise ValidationError(_('Email does not exists'))
 
-        if not sent_forget_code:
+        result = _verify_code(
+            email,
+            postfix=settings.FORGET_PASSWORD_EMAIL_REDIS_KEY_POSTFIX,
+            code=forget_code,
+            verified_postfix=settings.VERIFIED_FORGET_PASSWORD_EMAIL_REDIS_KEY_POSTFIX,
+        )
+        if result == CODE_MISSING:
             raise ValidationError(_('You have no recent forget code or the sent code has been expired '))
 
-        if not int(forget_code) == int(sent_forget_code):
+        if result == CODE_MISMATCH:
             raise ValidationError(_('Not Such Forget Code Found'))
 
-        _add_verified_email_to_redis(email, postfix=settings.VERIFIED_FORGET_PASSWORD_EMAIL_REDIS_KEY_POSTFIX)
-
         return attrs
 
 
@@ -85,4 +84,5 @@ class UserResetPasswordSerializer(serializers.Serializer):
         user = get_user_model().objects.get(email=email)
         user.set_password(password)
         user.save()
+        revoke_user_tokens_on_commit(user.username)
         return user
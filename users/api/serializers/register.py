@@ -1,15 +1,15 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
-from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
 from authentications.services.jwt import get_jwt_tokens_for_user
 from config import settings
-from users.api.validators import is_registered_before, is_email_verified
+from users.api.validators import is_registered_before
+from users.services.lookups import UserLookups
 from users.services.registration import _send_registration_code
-from users.services.token_utils import _add_verified_email_to_redis
+from users.services.otp import _verify_code, _consume_verified_email, CODE_MISSING, CODE_MISMATCH
 
 
 class CheckEmailSerializer(serializers.Serializer):
@@ -22,19 +22,16 @@ class SendRegistrationCodeSerializer(serializers.Serializer):
     def validate(self, attrs):
         email = attrs['email']
 
-        is_registered_before(email)
-
-        email_key = f'{email}{settings.REGISTRATION_EMAIL_REDIS_KEY_POSTFIX}'
-        value = cache.get(email_key)
-        if value:
-            raise ValidationError(
-                _('Registration code has been send already, please wait until it expires'))
+        is_registered_before(email, UserLookups.for_request(self.context.get('request')))
 
         return attrs
 
     def create(self, validated_data):
         email = validated_data['email']
-        _send_registration_code(email)
+        if not _send_registration_code(email):
+            raise ValidationError(
+                _('Registration code has been send already, please wait until it expires'))
+
         return validated_data
 
 
@@ -46,22 +43,32 @@ class VerifyRegistrationCodeSerializer(serializers.Serializer):
         email = attrs['email']
         registration_code = attrs['registration_code']
 
-        sent_registration_code = cache.get(f'{email}{settings.REGISTRATION_EMAIL_REDIS_KEY_POSTFIX}')
-        is_registered_before(email)
+        is_registered_before(email, UserLookups.for_request(self.context.get('request')))
 
-        if not sent_registration_code:
+        result = _verify_code(
+            email,
+            postfix=settings.REGISTRATION_EMAIL_REDIS_KEY_POSTFIX,
+            code=registration_code,
+            verified_postfix=settings.VERIFIED_REGISTERED_EMAIL_REDIS_KEY_POSTFIX,
+        )
+        if result == CODE_MISSING:
             raise ValidationError(_('You have no recent registration code or the sent code has been expired '))
 
-        if not int(registration_code) == int(sent_registration_code):
+        if result == CODE_MISMATCH:
             raise ValidationError(_('Not Such Registration Code Found'))
 
-        _add_verified_email_to_redis(email, postfix=settings.VERIFIED_REGISTERED_EMAIL_REDIS_KEY_POSTFIX)
-
         return attrs
 
 
 class RegisterUserSerializer(serializers.ModelSerializer):
+    """
+    Checks the username and the email with one query, which is why the model's unique validator is
+    left off the email, and consumes the verified flag with a single `DEL` once everything else is
+    valid. The user is saved with one `INSERT`.
+    """
+
     username = serializers.CharField(max_length=128, required=True)
+    email = serializers.EmailField(max_length=254, required=True)
     password = serializers.CharField(max_length=128, write_only=True, required=True)
     confirm_password = serializers.CharField(max_length=128, write_only=True, required=True)
 
@@ -81,25 +88,28 @@ class RegisterUserSerializer(serializers.ModelSerializer):
         password = attrs['password']
         confirm_password = attrs['confirm_password']
 
-        if get_user_model().objects.filter(username=username).exists():
+        lookups = UserLookups.for_request(self.context.get('request'))
+        lookups.load(emails=[email], usernames=[username])
+
+        if lookups.username_exists(username):
             raise ValidationError(_('Username already exists'))
 
         if not password == confirm_password:
             raise ValidationError(_('Passwords mismatch'))
 
         validate_password(password)
-        is_registered_before(email)
-        is_email_verified(email, postfix=settings.VERIFIED_REGISTERED_EMAIL_REDIS_KEY_POSTFIX)
+        is_registered_before(email, lookups)
 
-        cache.delete(f'{email}{settings.REGISTRATION_EMAIL_REDIS_KEY_POSTFIX}')
-        cache.delete(f'{email}{settings.VERIFIED_REGISTERED_EMAIL_REDIS_KEY_POSTFIX}')
+        # The registration code itself is already deleted when it is verified.
+        if not _consume_verified_email(email, settings.VERIFIED_REGISTERED_EMAIL_REDIS_KEY_POSTFIX):
+            raise ValidationError(_('Email has not been verified'))
 
         return attrs
 
     def create(self, validated_data):
-        instance = get_user_model().objects.create(email=validated_data['email'], username=validated_data['username'])
+        instance = get_user_model()(email=validated_data['email'], username=validated_data['username'])
         instance.set_password(validated_data['password'])
-        instance.save()
+        instance.save(force_insert=True)
         return instance
 
     def to_representation(self, instance):
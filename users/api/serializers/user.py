@@ -4,6 +4,8 @@ from django.utils.translation import gettext_lazy as  _
 from rest_framework import serializers
 from rest_framework.serializers import ValidationError
 
+from authentications.services.revocation import revoke_user_tokens_on_commit
+
 
 class UserRetrieveUpdateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -55,6 +57,7 @@ class UserChangePasswordSerializer(serializers.Serializer):
     def update(self, instance, validated_data):
         instance.set_password(validated_data['password'])
         instance.save()
+        revoke_user_tokens_on_commit(instance.username)
         return instance
 
 
@@ -0,0 +1,17 @@
+from config.throttling import IPRateThrottle, EmailRateThrottle, UserRateThrottle
+
+
+class OTPIPThrottle(IPRateThrottle):
+    scope = 'otp_ip'
+
+
+class OTPEmailThrottle(EmailRateThrottle):
+    scope = 'otp_email'
+
+
+class OTPVerifyEmailThrottle(EmailRateThrottle):
+    scope = 'otp_verify_email'
+
+
+class PasswordUserThrottle(UserRateThrottle):
+    scope = 'password_user'
@@ -1,11 +1,12 @@
-from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 from rest_framework.exceptions import ValidationError
 
+from users.services.lookups import UserLookups
 
-def is_registered_before(email: str):
-    exists = get_user_model().objects.filter(email=email).exists()
+
+def is_registered_before(email: str, lookups: UserLookups = None):
+    exists = (lookups or UserLookups()).email_exists(email)
     if exists:
         raise ValidationError(_('Email already exists'))
 
@@ -2,14 +2,18 @@ from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import extend_schema
 from rest_framework import status, mixins
-from rest_framework.decorators import api_view, permission_classes, action
+from rest_framework.decorators import (api_view, permission_classes, action, throttle_classes,
+                                       authentication_classes)
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from authentications.api.authentication import RevocableJWTAuthentication
+from users.services.lookups import UserLookups
 from users.services.registration import _check_email
 from users.api.filters import SelfFilterBacked
+from users.api.throttles import OTPIPThrottle, OTPEmailThrottle, OTPVerifyEmailThrottle, PasswordUserThrottle
 from users.api.serializers import (SendRegistrationCodeSerializer,
                                    RegisterUserSerializer, CheckEmailSerializer,
                                    VerifyRegistrationCodeSerializer,
@@ -23,18 +27,20 @@ from users.api.serializers import (SendRegistrationCodeSerializer,
 @extend_schema(request=CheckEmailSerializer)
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([OTPIPThrottle, OTPEmailThrottle])
 def check_email_view(request, **kwargs):
     serializer = CheckEmailSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
-    result = _check_email(serializer.validated_data['email'])
+    result = _check_email(serializer.validated_data['email'], UserLookups.for_request(request))
     return Response(data=result, status=status.HTTP_200_OK)
 
 
 @extend_schema(request=SendRegistrationCodeSerializer, responses={202: {}})
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([OTPIPThrottle, OTPEmailThrottle])
 def send_registration_code_view(request, **kwargs):
-    serializer = SendRegistrationCodeSerializer(data=request.data)
+    serializer = SendRegistrationCodeSerializer(data=request.data, context={'request': request})
     serializer.is_valid(raise_exception=True)
     serializer.save()
     return Response(status=status.HTTP_202_ACCEPTED)
@@ -43,8 +49,9 @@ def send_registration_code_view(request, **kwargs):
 @extend_schema(request=VerifyRegistrationCodeSerializer, responses={202: {}})
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([OTPIPThrottle, OTPVerifyEmailThrottle])
 def verify_registration_code_view(request, **kwargs):
-    serializer = VerifyRegistrationCodeSerializer(data=request.data)
+    serializer = VerifyRegistrationCodeSerializer(data=request.data, context={'request': request})
     serializer.is_valid(raise_exception=True)
     return Response(status=status.HTTP_202_ACCEPTED)
 
@@ -52,6 +59,7 @@ def verify_registration_code_view(request, **kwargs):
 @extend_schema(request=SendForgotPasswordCodeSerializer)
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([OTPIPThrottle, OTPEmailThrottle])
 def send_forget_password_code_view(request, **kwargs):
     serializer = SendForgotPasswordCodeSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -62,6 +70,7 @@ def send_forget_password_code_view(request, **kwargs):
 @extend_schema(request=VerifyForgetCodeSerializer)
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([OTPIPThrottle, OTPVerifyEmailThrottle])
 def verify_forget_code_view(request, **kwargs):
     serializer = VerifyForgetCodeSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -102,7 +111,8 @@ class UserViewSet(mixins.CreateModelMixin,
         return UserRetrieveUpdateSerializer
 
     @extend_schema(request=UserChangePasswordSerializer, responses={200: {}})
-    @action(detail=True, methods=['patch'], url_path='change-password', url_name='change_password')
+    @action(detail=True, methods=['patch'], url_path='change-password', url_name='change_password',
+            throttle_classes=[PasswordUserThrottle])
     def change_password(self, request, **kwargs):
         instance = self.get_object()
         serializer = UserChangePasswordSerializer(instance=instance, data=request.data)
@@ -117,6 +127,7 @@ class UserViewSet(mixins.CreateModelMixin,
 @extend_schema(responses=UserProfileSerializer)
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@authentication_classes([RevocableJWTAuthentication])
 def user_profile_view(request, **kwargs):
     data = UserProfileSerializer(instance=request.user).data
     return Response(data=data, status=status.HTTP_200_OK)
@@ -0,0 +1,26 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher, ScryptPasswordHasher
+
+from config import settings
+
+
+class TunableScryptPasswordHasher(ScryptPasswordHasher):
+    """
+    Memory hard scrypt hasher, needing 128 * block size * work factor bytes per hash.
+    """
+    work_factor = settings.PASSWORD_SCRYPT_WORK_FACTOR
+    block_size = settings.PASSWORD_SCRYPT_BLOCK_SIZE
+    parallelism = settings.PASSWORD_SCRYPT_PARALLELISM
+    maxmem = settings.PASSWORD_SCRYPT_MAX_MEMORY
+
+
+class TunableArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Memory hard Argon2id hasher, needing the argon2-cffi package.
+    """
+    time_cost = settings.PASSWORD_ARGON2_TIME_COST
+    memory_cost = settings.PASSWORD_ARGON2_MEMORY_COST
+    parallelism = settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    iterations = settings.PASSWORD_PBKDF2_ITERATIONS
@@ -0,0 +1,107 @@
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+from config import settings
+
+PASSWORD = 'Benchmark-Pass-1234'
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures the latency of hashing a password, as done on every login, with the configured hasher '
+        'and other parameters, and the hashes per second `--concurrency` threads reach on this host.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5, help='Hashes per configuration')
+        parser.add_argument('--concurrency', type=int, default=os.cpu_count(), help='Threads hashing at once')
+        parser.add_argument('--scrypt-work-factors', type=int, nargs='+', default=[2 ** 14, 2 ** 15, 2 ** 16])
+        parser.add_argument('--argon2-memory-costs', type=int, nargs='+', default=[19 * 1024, 64 * 1024],
+                            help='In KiB')
+        parser.add_argument('--pbkdf2-iterations', type=int, nargs='+', default=[260000, 600000])
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f'{"hasher":>8} {"parameters":>44} {"memory":>9} {"min":>9} {"median":>9} {"hashes/s":>9}'
+        )
+        measured = set()
+        for name, parameters in self._get_configurations(options):
+            hasher = import_string(settings.PASSWORD_HASHER_CLASSES[name])()
+            for attribute, value in parameters.items():
+                setattr(hasher, attribute, value)
+
+            summary = ' '.join(f'{attribute}={value}' for attribute, value in self._get_parameters(hasher).items())
+            if (name, summary) in measured:
+                continue
+            measured.add((name, summary))
+
+            try:
+                timings = self._measure(hasher, options['repeat'])
+            except (ImportError, ValueError) as error:
+                self.stderr.write(f'{name} {parameters}: {error}')
+                continue
+            throughput = self._measure_throughput(hasher, options['repeat'], options['concurrency'])
+
+            marker = '*' if name == settings.PASSWORD_HASHER and not parameters else ' '
+            self.stdout.write(
+                f'{marker}{name:>7} {summary:>44} {self._get_memory(hasher):>9} {min(timings) * 1000:>7.1f}ms '
+                f'{statistics.median(timings) * 1000:>7.1f}ms {throughput:>9.1f}'
+            )
+
+    def _get_configurations(self, options):
+        """
+        Yields the configured hasher first, then the others with each of the benchmarked parameters.
+        """
+        yield settings.PASSWORD_HASHER, {}
+        for work_factor in options['scrypt_work_factors']:
+            # Leaves room for the larger work factors, which scrypt refuses beyond `maxmem`
+            maxmem = 256 * work_factor * settings.PASSWORD_SCRYPT_BLOCK_SIZE
+            yield 'scrypt', {'work_factor': work_factor, 'maxmem': maxmem}
+        for memory_cost in options['argon2_memory_costs']:
+            yield 'argon2', {'memory_cost': memory_cost}
+        for iterations in options['pbkdf2_iterations']:
+            yield 'pbkdf2', {'iterations': iterations}
+
+    @staticmethod
+    def _get_parameters(hasher) -> dict:
+        names = {
+            'scrypt': ('work_factor', 'block_size', 'parallelism'),
+            'argon2': ('time_cost', 'memory_cost', 'parallelism'),
+            'pbkdf2_sha256': ('iterations',),
+        }[hasher.algorithm]
+        return {name: getattr(hasher, name) for name in names}
+
+    @staticmethod
+    def _get_memory(hasher) -> str:
+        if hasher.algorithm == 'scrypt':
+            return f'{128 * hasher.block_size * hasher.work_factor / 2 ** 20:.0f}MiB'
+        if hasher.algorithm == 'argon2':
+            return f'{hasher.memory_cost / 1024:.0f}MiB'
+        return '-'
+
+    @staticmethod
+    def _measure(hasher, repeat: int) -> list:
+        timings = []
+        for _ in range(repeat):
+            salt = hasher.salt()
+            start = time.perf_counter()
+            hasher.encode(PASSWORD, salt)
+            timings.append(time.perf_counter() - start)
+        return timings
+
+    @staticmethod
+    def _measure_throughput(hasher, repeat: int, concurrency: int) -> float:
+        """
+        Returns the hashes per second of `concurrency` threads, which hash in parallel as the hashers
+        release the GIL, like the threads or processes of a worker would.
+        """
+        count = repeat * concurrency
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            start = time.perf_counter()
+            list(executor.map(lambda _: hasher.encode(PASSWORD, hasher.salt()), range(count)))
+            return count / (time.perf_counter() - start)
@@ -3,6 +3,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from users.managers import CustomUserManager
+from users.services.passwords import _check_password
 
 
 def user_directory_path(instance, filename):
@@ -31,5 +32,8 @@ class User(AbstractUser):
         full_name = "%s %s" % (self.first_name, self.last_name)
         return full_name.strip()
 
+    def check_password(self, raw_password):
+        return _check_password(self, raw_password)
+
     def delete(self, using=None, keep_parents=False):
         raise models.ProtectedError(_("delete is not allowed in RUser model."), self)
@@ -1,23 +1,18 @@
-from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 
-from mail.tasks import send_mail_in_background
 from config import settings
-from users.services.token_utils import _add_code_to_redis
+from users.services.otp import _issue_code_with_mail
 
 
-def _send_forget_password_code(email: str):
-    previous_code = cache.get(f'{email}{settings.FORGET_PASSWORD_EMAIL_REDIS_KEY_POSTFIX}')
-    if previous_code:
-        return
-
-    code = _add_code_to_redis(email, postfix=settings.FORGET_PASSWORD_EMAIL_REDIS_KEY_POSTFIX)
-    email_message = _(f'Forget Password Code: {code}')
-
-    send_mail_in_background.apply_async(
-        kwargs={
-            'to_email': email,
-            'message': email_message,
-            'title': _('Romina Forget Password Code')
-        }
+def _send_forget_password_code(email: str) -> bool:
+    """
+    Sends a forget password code unless one is still pending, returning whether it was sent.
+    The email is left in the mail outbox, relayed to the workers by `relay_mail_outbox`.
+    """
+    code = _issue_code_with_mail(
+        email,
+        postfix=settings.FORGET_PASSWORD_EMAIL_REDIS_KEY_POSTFIX,
+        title=_('Romina Forget Password Code'),
+        message=_('Forget Password Code: {code}'),
     )
+    return code is not None
@@ -0,0 +1,48 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+
+class UserLookups:
+    """
+    Request-scoped memo of the user existence lookups of the registration flow.
+    `load` fetches every email and username a request is going to check with one query, and
+    later checks of the same values are answered from memory instead of another `exists()`.
+    """
+
+    def __init__(self):
+        self._emails = {}
+        self._usernames = {}
+
+    @classmethod
+    def for_request(cls, request) -> 'UserLookups':
+        if request is None:
+            return cls()
+
+        lookups = getattr(request, '_user_lookups', None)
+        if lookups is None:
+            lookups = cls()
+            request._user_lookups = lookups
+        return lookups
+
+    def load(self, emails=(), usernames=()):
+        emails = [email for email in emails if email not in self._emails]
+        usernames = [username for username in usernames if username not in self._usernames]
+        if not emails and not usernames:
+            return
+
+        found_emails, found_usernames = set(), set()
+        users = get_user_model().objects.filter(Q(email__in=emails) | Q(username__in=usernames))
+        for email, username in users.values_list('email', 'username'):
+            found_emails.add(email)
+            found_usernames.add(username)
+
+        self._emails.update({email: email in found_emails for email in emails})
+        self._usernames.update({username: username in found_usernames for username in usernames})
+
+    def email_exists(self, email: str) -> bool:
+        self.load(emails=[email])
+        return self._emails[email]
+
+    def username_exists(self, username: str) -> bool:
+        self.load(usernames=[username])
+        return self._usernames[username]
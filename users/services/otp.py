@@ -0,0 +1,76 @@
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+from config import settings
+from mail.services.outbox import _add_with_mail
+from users.services.token_utils import _generate_random_number_with_size
+
+CODE_VERIFIED = 1
+CODE_MISSING = 0
+CODE_MISMATCH = -1
+
+VERIFIED_EMAIL_VALUE = 'True'
+
+# Deletes the code if it matches and marks the email verified, returning one of the CODE_* values.
+_VERIFY_CODE_SCRIPT = """
+local code = redis.call('GET', KEYS[1])
+if not code then
+    return 0
+end
+if code ~= ARGV[1] then
+    return -1
+end
+redis.call('DEL', KEYS[1])
+redis.call('SET', KEYS[2], ARGV[2], 'PX', ARGV[3])
+return 1
+"""
+
+_verify_code_script = None
+
+
+def _get_verify_code_script():
+    global _verify_code_script
+    if _verify_code_script is None:
+        _verify_code_script = get_redis_connection().register_script(_VERIFY_CODE_SCRIPT)
+    return _verify_code_script
+
+
+def _issue_code_with_mail(email: str, postfix: str, title: str, message: str):
+    """
+    Stores a new code for the email unless one is still pending, so concurrent requests can not both
+    issue a code, and appends the email carrying it to the mail outbox in the same script call, so a
+    code is stored if and only if its email will be sent. Returns the code, or `None` when one is
+    pending. `message` is formatted with the `code`.
+    Codes are stored as integers, which django-redis keeps as plain digits readable by scripts.
+    """
+    code = _generate_random_number_with_size(settings.LENGTH_OF_TOKEN_CODE)
+    job_id = _add_with_mail(
+        f'{email}{postfix}', code, settings.CODE_EXPIRY_MINUTES * 60,
+        to_email=email, message=message.format(code=code), title=title,
+    )
+    return None if job_id is None else code
+
+
+def _verify_code(email: str, postfix: str, code: int, verified_postfix: str) -> int:
+    """
+    Compares the code with the pending one and, on a match, deletes it and marks the email verified
+    for `EMAIL_STAY_VERIFIED_DURATION_MINUTEST`, atomically in one script call. A code can only be
+    verified once.
+    """
+    return _get_verify_code_script()(
+        keys=[cache.make_key(f'{email}{postfix}'), cache.make_key(f'{email}{verified_postfix}')],
+        args=[
+            int(code),
+            cache.client.encode(VERIFIED_EMAIL_VALUE),
+            settings.EMAIL_STAY_VERIFIED_DURATION_MINUTEST * 60 * 1000,
+        ],
+        client=get_redis_connection(),
+    )
+
+
+def _consume_verified_email(email: str, verified_postfix: str) -> bool:
+    """
+    Deletes the verified flag of the email with a single `DEL`, returning whether it was set, so
+    one verification can only be used once.
+    """
+    return bool(cache.delete(f'{email}{verified_postfix}'))
@@ -0,0 +1,65 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher
+from django.db import close_old_connections
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# A single thread, the hashers release the GIL so rehashing does not stall the request threads
+rehash_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='password-rehash')
+_pending_rehashes = threading.BoundedSemaphore(settings.PASSWORD_REHASH_MAX_PENDING)
+
+
+def get_password_salt(encoded: str) -> str:
+    """
+    Returns the salt of the password hash, which changes with the password but is kept when the
+    hash is upgraded, or the whole hash if it has none.
+    """
+    try:
+        return identify_hasher(encoded).decode(encoded).get('salt') or encoded
+    except ValueError:
+        return encoded
+
+
+def _rehash_password(pk, encoded: str, raw_password: str) -> bool:
+    """
+    Replaces the hash with one of the preferred hasher keeping its salt, unless the password changed
+    meanwhile. Returns whether it was replaced.
+    """
+    salt = get_password_salt(encoded)
+    hasher = get_hasher()
+    if salt == encoded:
+        salt = hasher.salt()
+    password = hasher.encode(raw_password, salt)
+    return get_user_model().objects.filter(pk=pk, password=encoded).update(password=password) == 1
+
+
+def _run_rehash(pk, encoded: str, raw_password: str):
+    try:
+        _rehash_password(pk, encoded, raw_password)
+    except Exception:
+        logger.exception('Could not rehash the password of user %s', pk)
+    finally:
+        _pending_rehashes.release()
+        close_old_connections()
+
+
+def _schedule_rehash(pk, encoded: str, raw_password: str):
+    if not _pending_rehashes.acquire(blocking=False):
+        return
+    rehash_executor.submit(_run_rehash, pk, encoded, raw_password)
+
+
+def _check_password(user, raw_password: str) -> bool:
+    """
+    Checks the password like `AbstractBaseUser.check_password`, but upgrades an outdated hash in the
+    background instead of hashing it again and saving the user within the request.
+    """
+    return check_password(
+        raw_password, user.password, lambda password: _schedule_rehash(user.pk, user.password, password),
+    )
@@ -1,12 +1,10 @@
 from dataclasses import dataclass, asdict
 
-from django.contrib.auth import get_user_model
-from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 
-from mail.tasks import send_mail_in_background
 from config import settings
-from users.services.token_utils import _add_code_to_redis
+from users.services.lookups import UserLookups
+from users.services.otp import _issue_code_with_mail
 
 
 @dataclass(init=True, repr=True)
@@ -17,8 +15,8 @@ class UserEmailStatus:
     dict = asdict
 
 
-def _check_email(email: str) -> dict:
-    exists = get_user_model().objects.filter(email=email).exists()
+def _check_email(email: str, lookups: UserLookups = None) -> dict:
+    exists = (lookups or UserLookups()).email_exists(email)
     if not exists:
         _send_registration_code(email)
 
@@ -26,19 +24,15 @@ def _check_email(email: str) -> dict:
     return email_status.dict()
 
 
-def _send_registration_code(email: str):
-    previous_code = cache.get(f'{email}{settings.REGISTRATION_EMAIL_REDIS_KEY_POSTFIX}')
-    if previous_code:
-        print(previous_code)
-        return
-
-    code = _add_code_to_redis(email, postfix=settings.REGISTRATION_EMAIL_REDIS_KEY_POSTFIX)
-    email_message = _(f'Registration Code : {code}')
-
-    send_mail_in_background.apply_async(
-        kwargs={
-            'to_email': email,
-            'message': email_message,
-            'title': _('Bitjob Registration Code')
-        }
+def _send_registration_code(email: str) -> bool:
+    """
+    Sends a registration code unless one is still pending, returning whether it was sent.
+    The email is left in the mail outbox, relayed to the workers by `relay_mail_outbox`.
+    """
+    code = _issue_code_with_mail(
+        email,
+        postfix=settings.REGISTRATION_EMAIL_REDIS_KEY_POSTFIX,
+        title=_('Bitjob Registration Code'),
+        message=_('Registration Code : {code}'),
     )
+    return code is not None
@@ -0,0 +1,21 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_init, post_save
+from django.dispatch import receiver
+
+from authentications.services.user_cache import invalidate_user_snapshot_on_commit
+
+
+@receiver(post_init, sender=get_user_model())
+def remember_username(sender, instance, **kwargs):
+    # Read from __dict__ so a deferred username is not loaded
+    instance._snapshot_username = instance.__dict__.get('username')
+
+
+@receiver(post_save, sender=get_user_model())
+def invalidate_user_snapshot(sender, instance, **kwargs):
+    # A renamed user is also evicted under the old username, which tokens issued before still carry
+    previous_username = instance._snapshot_username
+    if previous_username is not None and previous_username != instance.username:
+        invalidate_user_snapshot_on_commit(previous_username)
+    invalidate_user_snapshot_on_commit(instance.username)
+    instance._snapshot_username = instance.username
@@ -0,0 +1,116 @@
+from contextlib import contextmanager
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from redis import Redis
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from config import settings
+from config.throttling import _SLIDING_WINDOW_SCRIPT, limiter
+from mail.services.outbox import _SET_WITH_MAIL_SCRIPT
+from users.services.otp import _issue_code_with_mail, _verify_code
+
+
+@contextmanager
+def count_redis_commands():
+    commands = []
+    execute_command = Redis.execute_command
+
+    def counting_execute_command(client, *args, **options):
+        commands.append(args[0])
+        return execute_command(client, *args, **options)
+
+    with mock.patch.object(Redis, 'execute_command', counting_execute_command):
+        yield commands
+
+
+class RegistrationRoundTripTests(APITestCase):
+    """
+    Pins the SQL queries and Redis commands each registration endpoint costs, the rate limiting
+    throttles of an endpoint taking one command each.
+    """
+
+    def setUp(self):
+        self.email = 'test@test.com'
+        # Loads the scripts, so counts are not skewed by the first `SCRIPT LOAD`.
+        _verify_code(self.email, settings.REGISTRATION_EMAIL_REDIS_KEY_POSTFIX, 0,
+                     settings.VERIFIED_REGISTERED_EMAIL_REDIS_KEY_POSTFIX)
+        get_redis_connection().script_load(_SLIDING_WINDOW_SCRIPT)
+        get_redis_connection().script_load(_SET_WITH_MAIL_SCRIPT)
+
+    def assertRoundTrips(self, queries, redis_commands, url, data, expected_status):
+        with self.assertNumQueries(queries), count_redis_commands() as commands:
+            response = self.client.post(url, data=data)
+
+        self.assertEqual(response.status_code, expected_status, response.data)
+        self.assertEqual(len(commands), redis_commands, commands)
+
+    def test_check_new_email(self):
+        self.assertRoundTrips(1, 3, reverse('users:check_email'), {'email': self.email}, status.HTTP_200_OK)
+
+    def test_check_registered_email(self):
+        baker.make(get_user_model(), email=self.email)
+
+        self.assertRoundTrips(1, 2, reverse('users:check_email'), {'email': self.email}, status.HTTP_200_OK)
+
+    def test_send_registration_code(self):
+        self.assertRoundTrips(
+            1, 3, reverse('users:send_registration_code'), {'email': self.email}, status.HTTP_202_ACCEPTED,
+        )
+
+    def test_verify_registration_code(self):
+        code = _issue_code_with_mail(
+            self.email, settings.REGISTRATION_EMAIL_REDIS_KEY_POSTFIX, title='Code', message='Your code: {code}',
+        )
+
+        self.assertRoundTrips(
+            1, 3, reverse('users:verify_registration_code'),
+            {'email': self.email, 'registration_code': code}, status.HTTP_202_ACCEPTED,
+        )
+
+    def test_register_user(self):
+        cache.set(f'{self.email}{settings.VERIFIED_REGISTERED_EMAIL_REDIS_KEY_POSTFIX}', 'True')
+        data = {
+            'username': 'test',
+            'email': self.email,
+            'password': 'Strong-Pass-1234',
+            'confirm_password': 'Strong-Pass-1234',
+        }
+
+        self.assertRoundTrips(2, 1, reverse('users:user-list'), data, status.HTTP_201_CREATED)
+
+        user = get_user_model().objects.get(email=self.email)
+        self.assertTrue(user.check_password('Strong-Pass-1234'))
+        self.assertIsNone(cache.get(f'{self.email}{settings.VERIFIED_REGISTERED_EMAIL_REDIS_KEY_POSTFIX}'))
+
+    def test_register_user_twice(self):
+        cache.set(f'{self.email}{settings.VERIFIED_REGISTERED_EMAIL_REDIS_KEY_POSTFIX}', 'True')
+        data = {
+            'username': 'test',
+            'email': self.email,
+            'password': 'Strong-Pass-1234',
+            'confirm_password': 'Strong-Pass-1234',
+        }
+        self.client.post(reverse('users:user-list'), data=data)
+
+        self.assertRoundTrips(1, 0, reverse('users:user-list'), data, status.HTTP_400_BAD_REQUEST)
+
+    def test_unverified_email_can_not_register(self):
+        data = {
+            'username': 'test',
+            'email': self.email,
+            'password': 'Strong-Pass-1234',
+            'confirm_password': 'Strong-Pass-1234',
+        }
+
+        self.assertRoundTrips(1, 1, reverse('users:user-list'), data, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(get_user_model().objects.filter(email=self.email).exists())
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+        limiter.clear()
@@ -0,0 +1,73 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django_redis import get_redis_connection
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from config import settings
+from mail.services.outbox import MAIL_OUTBOX_STREAM
+from users.services.otp import _issue_code_with_mail, _verify_code, CODE_VERIFIED, CODE_MISSING, CODE_MISMATCH
+
+POSTFIX = settings.REGISTRATION_EMAIL_REDIS_KEY_POSTFIX
+VERIFIED_POSTFIX = settings.VERIFIED_REGISTERED_EMAIL_REDIS_KEY_POSTFIX
+
+
+def issue_code(email: str):
+    return _issue_code_with_mail(email, POSTFIX, title='Code', message='Your code: {code}')
+
+
+class OTPStoreTests(TestCase):
+
+    def setUp(self) -> None:
+        self.email = 'test@test.com'
+
+    def test_issue_code(self):
+        code = issue_code(self.email)
+
+        self.assertEqual(cache.get(f'{self.email}{POSTFIX}'), code)
+        self.assertAlmostEqual(cache.ttl(f'{self.email}{POSTFIX}'), settings.CODE_EXPIRY_MINUTES * 60, delta=1)
+
+    def test_pending_code_is_not_replaced(self):
+        code = issue_code(self.email)
+
+        self.assertIsNone(issue_code(self.email))
+        self.assertEqual(cache.get(f'{self.email}{POSTFIX}'), code)
+
+    def test_verify_code(self):
+        code = issue_code(self.email)
+
+        self.assertEqual(_verify_code(self.email, POSTFIX, code + 1, VERIFIED_POSTFIX), CODE_MISMATCH)
+        self.assertIsNone(cache.get(f'{self.email}{VERIFIED_POSTFIX}'))
+
+        self.assertEqual(_verify_code(self.email, POSTFIX, code, VERIFIED_POSTFIX), CODE_VERIFIED)
+        self.assertIsNone(cache.get(f'{self.email}{POSTFIX}'))
+        self.assertEqual(cache.get(f'{self.email}{VERIFIED_POSTFIX}'), 'True')
+        self.assertAlmostEqual(
+            cache.ttl(f'{self.email}{VERIFIED_POSTFIX}'), settings.EMAIL_STAY_VERIFIED_DURATION_MINUTEST * 60, delta=1,
+        )
+
+    def test_code_is_verified_once(self):
+        code = issue_code(self.email)
+
+        self.assertEqual(_verify_code(self.email, POSTFIX, code, VERIFIED_POSTFIX), CODE_VERIFIED)
+        self.assertEqual(_verify_code(self.email, POSTFIX, code, VERIFIED_POSTFIX), CODE_MISSING)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+
+
+class SendCodeOnceTests(APITestCase):
+
+    def test_duplicate_sends_send_one_mail(self):
+        url = reverse('users:send_registration_code')
+
+        first = self.client.post(url, {'email': 'test@test.com'})
+        second = self.client.post(url, {'email': 'test@test.com'})
+
+        self.assertEqual(first.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(second.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(get_redis_connection().xlen(cache.make_key(MAIL_OUTBOX_STREAM)), 1)
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
@@ -0,0 +1,102 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django_redis import get_redis_connection
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentications.services.user_cache import local_user_cache
+from users.services.passwords import _rehash_password, get_password_salt, rehash_executor
+
+PASSWORD = 'Strong-Pass-1234'
+HASHERS = ['users.hashers.TunableScryptPasswordHasher', 'django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+def run_now(function, *args):
+    # Runs the rehash in the test's thread, whose connection must stay open
+    with mock.patch('users.services.passwords.close_old_connections'):
+        function(*args)
+
+
+@override_settings(PASSWORD_HASHERS=HASHERS)
+class PasswordRehashTests(APITestCase):
+
+    def setUp(self):
+        self.user = baker.make(get_user_model(), username='test', email='test@test.com',
+                               password=make_password(PASSWORD, hasher='md5'))
+
+    def login(self):
+        return self.client.post(
+            reverse('authentications:token_obtain_pair'), {'email': 'test@test.com', 'password': PASSWORD},
+        )
+
+    @mock.patch.object(rehash_executor, 'submit')
+    def test_login_does_not_rehash_in_the_request(self, submit):
+        response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(submit.call_count, 1)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('md5$'))
+
+    @mock.patch.object(rehash_executor, 'submit', run_now)
+    def test_legacy_hash_is_upgraded_on_login(self):
+        legacy_password = self.user.password
+
+        response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('scrypt$'))
+        self.assertEqual(get_password_salt(self.user.password), get_password_salt(legacy_password))
+        self.assertTrue(self.user.check_password(PASSWORD))
+
+        # The tokens issued with the legacy hash stay valid
+        local_user_cache.clear()
+        get_redis_connection().flushall()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.data["access"]}')
+        response = self.client.get(reverse('users:user-detail', kwargs={'username': 'test'}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @mock.patch.object(rehash_executor, 'submit')
+    def test_current_hash_is_not_rehashed(self, submit):
+        self.user.set_password(PASSWORD)
+        self.user.save()
+
+        self.assertTrue(self.user.check_password(PASSWORD))
+        self.assertFalse(self.user.check_password('Wrong-Pass-1234'))
+        submit.assert_not_called()
+
+    def test_changed_password_is_not_overwritten(self):
+        legacy_password = self.user.password
+        self.user.set_password('Other-Pass-1234')
+        self.user.save()
+
+        self.assertFalse(_rehash_password(self.user.pk, legacy_password, PASSWORD))
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('Other-Pass-1234'))
+
+    def tearDown(self) -> None:
+        get_redis_connection().flushall()
+        local_user_cache.clear()
+
+
+class BenchmarkPasswordHashersTests(TestCase):
+
+    def test_benchmark(self):
+        stdout = StringIO()
+        call_command(
+            'benchmark_password_hashers', '--repeat', '1', '--concurrency', '2', '--scrypt-work-factors', '1024',
+            '--argon2-memory-costs', '1024', '--pbkdf2-iterations', '1000', stdout=stdout, stderr=StringIO(),
+        )
+
+        lines = stdout.getvalue().splitlines()
+        self.assertTrue(lines[1].startswith('* scrypt'))
+        self.assertTrue(any('work_factor=1024' in line for line in lines))
+        self.assertTrue(any('iterations=1000' in line for line in lines))